@@ -5,15 +5,30 @@ import jwt
 from django.conf import settings
 from django.contrib.auth import get_user_model
 
+from .user_cache import get_user
+
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
 
 User = get_user_model()
 
 
-def create_access_token(user_id: str) -> str:
+def access_token_claims(user: "AbstractUser") -> dict[str, Any]:
+    """Claims that let ClaimsAuth authorize reads without loading the user."""
+    return {
+        "is_active": user.is_active,
+        "is_superuser": user.is_superuser,
+        "ver": user.token_version,
+    }
+
+
+def create_access_token(
+    user_id: str,
+    claims: dict[str, Any] | None = None,
+) -> str:
     now = datetime.now(tz=UTC)
     payload = {
+        **(claims or {}),
         "user_id": str(user_id),
         "exp": now + timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES),
         "iat": now,
@@ -59,9 +74,10 @@ def get_user_from_token(token: str) -> "AbstractUser | None":
     if not payload:
         return None
 
-    try:
-        user = User.objects.get(id=payload["user_id"])
-    except User.DoesNotExist:
+    user = get_user(payload["user_id"])
+    if user is None:
+        return None
+    # Tokens issued before the user's token_version was bumped are revoked
+    if "ver" in payload and payload["ver"] != user.token_version:
         return None
-    else:
-        return user if user.is_active else None
+    return user if user.is_active else None
@@ -1,16 +1,22 @@
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from uuid import UUID
 
 from django.contrib.auth import get_user_model
 from django.http import HttpRequest
 from ninja.security import HttpBearer
 
-from .jwt import get_user_from_token
+from project_showcase.metrics import count_auth_failure
+
+from .jwt import get_user_from_token, verify_token
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
 
 User = get_user_model()
 
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
 
 class JWTAuth(HttpBearer):
     def authenticate(
@@ -21,13 +27,83 @@ class JWTAuth(HttpBearer):
         user = get_user_from_token(token)
         if user:
             return user
+        count_auth_failure("invalid_token")
         return None
 
 
-# Instance to use in endpoints
+@dataclass(frozen=True)
+class TokenPrincipal:
+    """Lightweight stand-in for a User, built from access token claims."""
+
+    id: UUID
+    is_active: bool
+    is_superuser: bool
+    token_version: int
+
+    @classmethod
+    def from_user(cls, user: "AbstractUser") -> "TokenPrincipal":
+        return cls(
+            id=user.id,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            token_version=user.token_version,
+        )
+
+
+class ClaimsAuth(HttpBearer):
+    """Authenticate from token claims alone, without loading the User row.
+
+    Reads trust the is_active claim. Writes also confirm that the user is
+    still active and the token's version matches, so bumping
+    User.token_version revokes access on the next write (and on every endpoint
+    using JWTAuth). Tokens without claims fall back to a full user lookup.
+    """
+
+    def authenticate(
+        self,
+        request: HttpRequest,
+        token: str,
+    ) -> TokenPrincipal | None:
+        principal = self._principal(request, token)
+        if principal is None:
+            count_auth_failure("invalid_token")
+        return principal
+
+    def _principal(self, request: HttpRequest, token: str) -> TokenPrincipal | None:
+        payload = verify_token(token)
+        if not payload or payload.get("type") != "access":
+            return None
+
+        if "ver" not in payload:
+            user = get_user_from_token(token)
+            return TokenPrincipal.from_user(user) if user else None
+
+        principal = TokenPrincipal(
+            id=UUID(payload["user_id"]),
+            is_active=bool(payload.get("is_active")),
+            is_superuser=bool(payload.get("is_superuser")),
+            token_version=payload["ver"],
+        )
+        if not principal.is_active:
+            return None
+
+        if request.method not in SAFE_METHODS and not (
+            User.objects.filter(
+                id=principal.id,
+                is_active=True,
+                token_version=principal.token_version,
+            ).exists()
+        ):
+            return None
+
+        return principal
+
+
+# Instances to use in endpoints
 auth = JWTAuth()
+claims_auth = ClaimsAuth()
 
 
-def require_admin(user: "AbstractUser | None") -> bool:
+def require_admin(user: "AbstractUser | TokenPrincipal | None") -> bool:
     """Check if user is admin/superuser."""
     return bool(user and user.is_superuser)
@@ -0,0 +1,124 @@
+"""Short-lived cache of authenticated users, keyed by user id.
+
+The per-process layer is a dictionary with a TTL (AUTH_USER_CACHE_TTL seconds,
+0 disables caching). With AUTH_USER_CACHE_SHARED the Django cache is consulted
+on a local miss, so a Redis-backed cache is shared between workers. Saving or
+deleting a user, or changing their groups, evicts them from this process and
+from the shared cache; other processes' local copies expire within the TTL.
+
+Callers get a copy of the cached instance, so mutating request.auth in one
+request never leaks into another.
+"""
+
+import copy
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+if TYPE_CHECKING:
+    from django.contrib.auth.models import AbstractUser
+
+User = get_user_model()
+
+
+class LocalUserCache:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, AbstractUser]] = {}
+
+    def get(self, user_id: str) -> "AbstractUser | None":
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, user = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            return user
+
+    def set(self, user_id: str, user: "AbstractUser", ttl: int) -> None:
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + ttl, user)
+
+    def delete(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+local_cache = LocalUserCache()
+
+
+def _shared_key(user_id: str) -> str:
+    return f"auth-user:{user_id}"
+
+
+def get_user(user_id: str) -> "AbstractUser | None":
+    """Return the user with `user_id`, or None if it does not exist."""
+    user_id = str(user_id)
+    ttl = settings.AUTH_USER_CACHE_TTL
+
+    user = local_cache.get(user_id) if ttl else None
+    if user is None and ttl and settings.AUTH_USER_CACHE_SHARED:
+        user = cache.get(_shared_key(user_id))
+        if user is not None:
+            local_cache.set(user_id, user, ttl)
+
+    if user is None:
+        try:
+            # Groups are prefetched for UserResponse.resolve_groups
+            user = User.objects.prefetch_related("groups").get(id=user_id)
+        except (User.DoesNotExist, ValidationError):
+            return None
+        if ttl:
+            local_cache.set(user_id, user, ttl)
+            if settings.AUTH_USER_CACHE_SHARED:
+                cache.set(_shared_key(user_id), user, timeout=ttl)
+
+    return copy.copy(user)
+
+
+def invalidate_user(user_id: Any) -> None:
+    user_id = str(user_id)
+    local_cache.delete(user_id)
+    if settings.AUTH_USER_CACHE_SHARED:
+        cache.delete(_shared_key(user_id))
+
+
+def _invalidate_saved_user(sender: type, instance: Any, **kwargs: Any) -> None:
+    invalidate_user(instance.pk)
+
+
+def _invalidate_group_members(
+    sender: type,
+    instance: Any,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    if not action.startswith("post_"):
+        return
+    if not reverse:
+        invalidate_user(instance.pk)
+    elif pk_set:
+        for user_id in pk_set:
+            invalidate_user(user_id)
+    else:
+        # A group was cleared of all members; they can't be listed any more
+        local_cache.clear()
+
+
+post_save.connect(_invalidate_saved_user, sender=User)
+post_delete.connect(_invalidate_saved_user, sender=User)
+m2m_changed.connect(_invalidate_group_members, sender=User.groups.through)
@@ -0,0 +1,159 @@
+"""Response cache for anonymous, public read endpoints.
+
+Responses are cached whole (already serialized) under a key built from the
+path and the normalized query string. Every key also embeds a generation token;
+any change to a model that public listings render replaces the token, which
+orphans all cached entries at once. With the default local-memory backend each
+worker process caches (and invalidates) independently, so
+PUBLIC_API_CACHE_TIMEOUT bounds how stale another worker can be. Point
+REDIS_URL at a shared Redis to cache and invalidate across workers.
+"""
+
+import hashlib
+import threading
+import uuid
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+from urllib.parse import urlencode
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpRequest, HttpResponse
+
+from apps.projects.models import Competition, Project, ProjectImage
+from apps.tags.models import Tag
+from project_showcase.metrics import count_cache_lookup
+
+GENERATION_KEY = "public-api:generation"
+
+
+class CacheStats:
+    """Thread-safe, per-process hit/miss counters keyed by cache namespace."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def record(self, namespace: str, outcome: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(namespace, {"hits": 0, "misses": 0})
+            counts[outcome] += 1
+        count_cache_lookup(namespace, outcome)
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._counts.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+stats = CacheStats()
+
+
+def _generation() -> str:
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        generation = uuid.uuid4().hex
+        # add() keeps a token another worker set in the meantime
+        if not cache.add(GENERATION_KEY, generation, timeout=None):
+            generation = cache.get(GENERATION_KEY, generation)
+    return generation
+
+
+def invalidate_public_cache() -> None:
+    cache.set(GENERATION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def _cache_key(namespace: str, request: HttpRequest) -> str:
+    # Filters are set-like, so neither parameter nor value order matters
+    params = sorted((key, sorted(values)) for key, values in request.GET.lists())
+    query = urlencode(params, doseq=True)
+    digest = hashlib.sha256(f"{request.path}?{query}".encode()).hexdigest()
+    return f"public-api:{_generation()}:{namespace}:{digest}"
+
+
+def _cacheable(request: HttpRequest) -> bool:
+    return request.method == "GET" and "Authorization" not in request.headers
+
+
+def _cached_response(namespace: str, request: HttpRequest) -> tuple[str, Any]:
+    """Cache key for `request` and the cached response, if there is one."""
+    key = _cache_key(namespace, request)
+    cached = cache.get(key)
+    if cached is None:
+        stats.record(namespace, "misses")
+        return key, None
+
+    stats.record(namespace, "hits")
+    content, content_type = cached
+    response = HttpResponse(content, content_type=content_type)
+    response["X-Cache"] = "HIT"
+    return key, response
+
+
+def _store_response(key: str, response: HttpResponse) -> None:
+    if response.status_code == 200:  # noqa: PLR2004
+        cache.set(
+            key,
+            (response.content, response["Content-Type"]),
+            timeout=settings.PUBLIC_API_CACHE_TIMEOUT,
+        )
+    response["X-Cache"] = "MISS"
+
+
+def cache_public_response(
+    namespace: str,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """View decorator (for ninja's decorate_view) caching anonymous GETs."""
+
+    def decorator(view: Callable[..., Any]) -> Callable[..., Any]:
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def async_wrapper(
+                request: HttpRequest, *args: Any, **kwargs: Any
+            ) -> HttpResponse:
+                if not _cacheable(request):
+                    return await view(request, *args, **kwargs)
+
+                # Cache backends block on I/O, so run them off the event loop
+                key, cached = await sync_to_async(_cached_response)(namespace, request)
+                if cached is not None:
+                    return cached
+                response = await view(request, *args, **kwargs)
+                await sync_to_async(_store_response)(key, response)
+                return response
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            if not _cacheable(request):
+                return view(request, *args, **kwargs)
+
+            key, cached = _cached_response(namespace, request)
+            if cached is not None:
+                return cached
+            response = view(request, *args, **kwargs)
+            _store_response(key, response)
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidate_on_change(**kwargs: Any) -> None:
+    invalidate_public_cache()
+
+
+for _model in (Project, ProjectImage, Tag, Competition):
+    post_save.connect(_invalidate_on_change, sender=_model)
+    post_delete.connect(_invalidate_on_change, sender=_model)
+for _through in (Project.tags.through, Competition.projects.through):
+    m2m_changed.connect(_invalidate_on_change, sender=_through)
@@ -0,0 +1,133 @@
+"""Conditional GET (ETag) support for public detail endpoints.
+
+Each resource has a "markers" function returning the timestamps and counts that
+change whenever its serialized payload would. One aggregate query computes them,
+so a revalidation that ends in 304 Not Modified never loads the full object.
+
+There is no Last-Modified: removing a tag or a non-main image changes the
+counts without moving any timestamp forward, and flagging the image main_image
+already falls back to as is_main changes nothing but the flag. Only the ETag,
+a digest of all the markers, reliably changes with the payload.
+"""
+
+import hashlib
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Max, OuterRef, Q, Subquery
+from django.http import HttpRequest
+from django.views.decorators.http import condition
+
+from apps.projects.models import (
+    Competition,
+    Project,
+    ProjectImage,
+    ProjectStatus,
+    UploadStatus,
+)
+
+Markers = dict[str, Any]
+
+
+def project_markers(request: HttpRequest, project_id: str) -> Markers | None:
+    # Only approved projects are public; others skip conditional handling
+    uploaded = Q(images__upload_status=UploadStatus.UPLOADED)
+    flagged_main = ProjectImage.objects.filter(
+        project=OuterRef("pk"),
+        upload_status=UploadStatus.UPLOADED,
+        is_main=True,
+    ).values("id")[:1]
+    try:
+        return (
+            Project.objects.filter(id=project_id, status=ProjectStatus.APPROVED)
+            .annotate(
+                tags_changed=Max("tags__updated_at"),
+                tag_count=Count("tags", distinct=True),
+                images_changed=Max("images__uploaded_at", filter=uploaded),
+                image_count=Count("images", filter=uploaded, distinct=True),
+                flagged_main=Subquery(flagged_main),
+            )
+            .values(
+                "updated_at",
+                "owner__updated_at",
+                "tags_changed",
+                "tag_count",
+                "images_changed",
+                "image_count",
+                "flagged_main",
+            )
+            .first()
+        )
+    except ValidationError:
+        return None
+
+
+def competition_markers(request: HttpRequest, competition_id: str) -> Markers | None:
+    approved = Q(projects__status=ProjectStatus.APPROVED)
+    try:
+        return (
+            Competition.objects.filter(id=competition_id)
+            .annotate(
+                projects_changed=Max("projects__updated_at", filter=approved),
+                project_count=Count("projects", filter=approved, distinct=True),
+            )
+            .values("updated_at", "projects_changed", "project_count")
+            .first()
+        )
+    except ValidationError:
+        return None
+
+
+def _markers_attr(markers_func: Callable[..., Markers | None]) -> str:
+    return f"_conditional_{markers_func.__name__}"
+
+
+def request_markers(
+    request: HttpRequest,
+    markers_func: Callable[..., Markers | None],
+) -> Markers | None:
+    """The markers conditional_on(markers_func) computed for this request."""
+    return getattr(request, _markers_attr(markers_func), None)
+
+
+def conditional_on(
+    markers_func: Callable[..., Markers | None],
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """View decorator (for ninja's decorate_view) answering 304 when unchanged."""
+    attr = _markers_attr(markers_func)
+
+    def markers(request: HttpRequest, **kwargs: Any) -> Markers | None:
+        # condition() may ask for the ETag more than once
+        if not hasattr(request, attr):
+            setattr(request, attr, markers_func(request, **kwargs))
+        return getattr(request, attr)
+
+    def etag(request: HttpRequest, **kwargs: Any) -> str | None:
+        values = markers(request, **kwargs)
+        if values is None:
+            return None
+        digest = hashlib.sha256(repr(sorted(values.items())).encode()).hexdigest()
+        return f'W/"{digest[:32]}"'
+
+    conditional = condition(etag_func=etag)
+
+    def decorator(view: Callable[..., Any]) -> Callable[..., Any]:
+        if not iscoroutinefunction(view):
+            return conditional(view)
+
+        conditional_view = conditional(view)
+
+        @wraps(view)
+        async def async_wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+            # condition() calls the ETag function synchronously, so run the
+            # markers query up front
+            values = await sync_to_async(markers_func)(request, **kwargs)
+            setattr(request, attr, values)
+            return await conditional_view(request, *args, **kwargs)
+
+        return async_wrapper
+
+    return decorator
@@ -0,0 +1,92 @@
+"""Request-size guardrails for the listing endpoints.
+
+Each listing has a maximum page size (LISTING_MAX_PER_PAGE, keyed by endpoint
+name) and every guarded response is capped at MAX_RESPONSE_BYTES once
+serialized. Rejections are counted per endpoint and reason, per worker
+process, and reported by /admin/cache-stats.
+"""
+
+import json
+import threading
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+
+class RejectionStats:
+    """Thread-safe, per-process counts of rejected requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counts: dict[str, dict[str, int]] = {}
+
+    def record(self, endpoint: str, reason: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(endpoint, {})
+            counts[reason] = counts.get(reason, 0) + 1
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {name: dict(counts) for name, counts in self._counts.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+stats = RejectionStats()
+
+
+def page_size_error(endpoint: str, page: int, per_page: int) -> str | None:
+    """Return an error message (and count it) when the page is out of bounds."""
+    max_per_page = settings.LISTING_MAX_PER_PAGE[endpoint]
+    if not 1 <= per_page <= max_per_page:
+        stats.record(endpoint, "per_page")
+        return f"per_page must be between 1 and {max_per_page}"
+    if page < 1:
+        stats.record(endpoint, "page")
+        return "page must be at least 1"
+    return None
+
+
+def _capped(endpoint: str, response: HttpResponse) -> HttpResponse:
+    limit = settings.MAX_RESPONSE_BYTES
+    if len(response.content) <= limit:
+        return response
+
+    stats.record(endpoint, "response_size")
+    detail = f"Response exceeds {limit} bytes; request a smaller page"
+    return HttpResponse(
+        json.dumps({"detail": detail}),
+        status=400,
+        content_type="application/json",
+    )
+
+
+def cap_response_size(
+    endpoint: str,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """View decorator (for ninja's decorate_view) rejecting oversized bodies."""
+
+    def decorator(view: Callable[..., Any]) -> Callable[..., Any]:
+        if iscoroutinefunction(view):
+
+            @wraps(view)
+            async def async_wrapper(
+                request: HttpRequest, *args: Any, **kwargs: Any
+            ) -> HttpResponse:
+                return _capped(endpoint, await view(request, *args, **kwargs))
+
+            return async_wrapper
+
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
+            return _capped(endpoint, view(request, *args, **kwargs))
+
+        return wrapper
+
+    return decorator
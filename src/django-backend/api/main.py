@@ -1,3 +1,13 @@
+"""The Ninja APIs behind /api/.
+
+`api` serves every operation with sync handlers; it is what the WSGI entry
+point (project_showcase.wsgi, used by the Docker image) routes to.
+`async_api` holds async versions of the public read endpoints (projects, tags
+and competitions), so under project_showcase.asgi a worker can keep many of
+them waiting on the database at once. project_showcase.asgi_urls mounts it
+ahead of `api`, which still serves everything else.
+"""
+
 from typing import Any
 
 from django.http import HttpRequest
@@ -12,12 +22,23 @@ from api.routers import (
     projects,
     tags,
 )
+from project_showcase.metrics import observe_operation
+from project_showcase.middleware import time_handler
+
+
+def _instrument(api: NinjaAPI) -> None:
+    # Lets PerformanceMiddleware tell handler time from serialization time
+    api.add_decorator(time_handler)
+    # Per-operation latency histograms for /metrics
+    api.add_decorator(observe_operation, mode="view")
+
 
 api = NinjaAPI(
     title="Project Showcase API",
     description="API for developer project showcasing platform",
     version="1.0.0",
 )
+_instrument(api)
 
 # Add routers
 api.add_router("/auth", auth.router)
@@ -37,3 +58,19 @@ def root(request: HttpRequest) -> dict[str, Any]:
 @api.get("/health")
 def health_check(request: HttpRequest) -> dict[str, Any]:
     return {"status": "healthy"}
+
+
+# A router belongs to one API, so async_api only mounts the async routers.
+# The docs stay with `api`, which describes the same operations.
+async_api = NinjaAPI(
+    title="Project Showcase API",
+    version="1.0.0",
+    urls_namespace="api-async",
+    docs_url=None,
+    openapi_url=None,
+)
+_instrument(async_api)
+
+async_api.add_router("/projects", projects.async_router)
+async_api.add_router("/tags", tags.async_router)
+async_api.add_router("/competitions", competitions.async_router)
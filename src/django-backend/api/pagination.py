@@ -0,0 +1,203 @@
+"""Keyset (cursor) pagination helpers for listing endpoints.
+
+A cursor encodes the sort key value and ``id`` of the last row on a page. The
+next page seeks past that row with an indexed WHERE clause instead of an
+OFFSET, so deep pages cost the same as the first one and no COUNT is needed.
+
+Page-number listings still report a total, counted with `count_rows` using
+one of the `CountStrategy` values the client picks.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Literal
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Model, Q, QuerySet
+
+CountStrategy = Literal["exact", "capped", "estimated"]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded."""
+
+
+def encode_cursor(value: Any, pk: Any) -> str:
+    """Encode a (sort value, id) pair into an opaque URL-safe cursor."""
+    # DjangoJSONEncoder drops microseconds, so the seek would land mid-tie
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, pk], cls=DjangoJSONEncoder, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[Any, str]:
+    """Decode a cursor produced by `encode_cursor`."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        value, pk = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        msg = "Invalid cursor"
+        raise InvalidCursorError(msg) from exc
+    if value is None or not isinstance(pk, str):
+        msg = "Invalid cursor"
+        raise InvalidCursorError(msg)
+    return value, pk
+
+
+def _seek[M: Model](
+    queryset: QuerySet[M],
+    sort_field: str,
+    *,
+    descending: bool,
+    cursor: str | None,
+    per_page: int,
+) -> QuerySet[M]:
+    direction = "-" if descending else ""
+    queryset = queryset.order_by(f"{direction}{sort_field}", f"{direction}id")
+
+    if cursor:
+        value, pk = decode_cursor(cursor)
+        lookup = "lt" if descending else "gt"
+        try:
+            field = queryset.model._meta.get_field(sort_field)  # noqa: SLF001
+            value = field.to_python(value)
+            queryset = queryset.filter(
+                Q(**{f"{sort_field}__{lookup}": value})
+                | Q(**{sort_field: value, f"id__{lookup}": pk}),
+            )
+        except (ValidationError, ValueError, TypeError) as exc:
+            msg = "Invalid cursor"
+            raise InvalidCursorError(msg) from exc
+
+    # One extra row tells whether another page exists
+    return queryset[: per_page + 1]
+
+
+def _page[M: Model](
+    rows: list[M],
+    sort_field: str,
+    per_page: int,
+) -> tuple[list[M], str | None]:
+    if len(rows) <= per_page:
+        return rows, None
+    rows = rows[:per_page]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_field), str(last.pk))
+
+
+def paginate_by_cursor[M: Model](
+    queryset: QuerySet[M],
+    sort_field: str,
+    *,
+    descending: bool,
+    cursor: str | None,
+    per_page: int,
+) -> tuple[list[M], str | None]:
+    """Return one page of `queryset` after `cursor` and the cursor for the next.
+
+    Rows are ordered by `sort_field` with `id` as a tiebreaker, so the ordering
+    is total and a row is never skipped or repeated between pages. `sort_field`
+    must be a non-nullable column.
+    """
+    rows = list(
+        _seek(
+            queryset,
+            sort_field,
+            descending=descending,
+            cursor=cursor,
+            per_page=per_page,
+        ),
+    )
+    return _page(rows, sort_field, per_page)
+
+
+async def apaginate_by_cursor[M: Model](
+    queryset: QuerySet[M],
+    sort_field: str,
+    *,
+    descending: bool,
+    cursor: str | None,
+    per_page: int,
+) -> tuple[list[M], str | None]:
+    """Async version of `paginate_by_cursor`."""
+    page = _seek(
+        queryset,
+        sort_field,
+        descending=descending,
+        cursor=cursor,
+        per_page=per_page,
+    )
+    rows = [row async for row in page]
+    return _page(rows, sort_field, per_page)
+
+
+def _planner_estimate(queryset: QuerySet[Any]) -> int:
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _strategy_for(
+    queryset: QuerySet[Any],
+    strategy: CountStrategy,
+    *,
+    filtered: bool,
+) -> CountStrategy:
+    if strategy != "estimated":
+        return strategy
+    if filtered:
+        return "capped"
+    if connections[queryset.db].vendor == "postgresql":
+        return strategy
+    return "exact"
+
+
+def _counted(
+    queryset: QuerySet[Any], strategy: CountStrategy, needed: int
+) -> QuerySet[Any]:
+    if strategy == "capped":
+        limit = max(settings.LISTING_COUNT_CAP, needed)
+        return queryset.order_by()[: limit + 1]
+    return queryset
+
+
+def count_rows(
+    queryset: QuerySet[Any],
+    strategy: CountStrategy,
+    *,
+    needed: int,
+    filtered: bool,
+) -> tuple[int, CountStrategy]:
+    """Count `queryset` with `strategy`; returns the total and the strategy used.
+
+    "capped" stops counting after LISTING_COUNT_CAP rows (or `needed`, the rows
+    up to the end of the requested page, if more), so a total one above that
+    cap only means more rows exist. "estimated" reads the PostgreSQL planner's
+    row estimate, which is only trusted for unfiltered listings: filtered ones
+    fall back to "capped", and other databases to "exact".
+    """
+    strategy = _strategy_for(queryset, strategy, filtered=filtered)
+    if strategy == "estimated":
+        return _planner_estimate(queryset), strategy
+    return _counted(queryset, strategy, needed).count(), strategy
+
+
+async def acount_rows(
+    queryset: QuerySet[Any],
+    strategy: CountStrategy,
+    *,
+    needed: int,
+    filtered: bool,
+) -> tuple[int, CountStrategy]:
+    """Async version of `count_rows`."""
+    strategy = _strategy_for(queryset, strategy, filtered=filtered)
+    if strategy == "estimated":
+        # QuerySet.explain() has no async counterpart
+        return await sync_to_async(_planner_estimate)(queryset), strategy
+    return await _counted(queryset, strategy, needed).acount(), strategy
@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+from datetime import date, timedelta
 from math import ceil
 from typing import TYPE_CHECKING, Any
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Count, QuerySet
+from django.core.cache import cache
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from ninja import Query, Router
+from ninja.decorators import decorate_view
 
 from api.auth.security import auth, require_admin
+from api.cache import stats as cache_stats
+from api.guardrails import cap_response_size, page_size_error
+from api.guardrails import stats as rejection_stats
+from api.pagination import CountStrategy, count_rows
+from api.schemas.analytics import TimeseriesResponse
 from api.schemas.errors import Error
 from api.schemas.project import (
     AdminProjectResponse,
@@ -19,7 +28,10 @@ from api.schemas.project import (
 )
 from api.schemas.tag import TagCreate, TagResponse
 from api.schemas.user import UserResponse
-from apps.projects.models import Project, ProjectStatus
+from apps.projects.models import Project, ProjectStatus, prefetch_uploaded_images
+from apps.projects.rollups import read_analytics
+from apps.projects.timeseries import MAX_BUCKETS, Interval, buckets, build_timeseries
+from apps.projects.view_tracking import view_buffer
 from apps.tags.models import Tag
 
 if TYPE_CHECKING:
@@ -28,26 +40,35 @@ if TYPE_CHECKING:
 User = get_user_model()
 router = Router()
 
+# Range covered by the timeseries endpoint when no start date is given
+DEFAULT_TIMESERIES_DAYS = 30
+
 
 # Project Management
 @router.get(
     "/projects",
-    response={200: ProjectListResponse, 401: Error, 403: Error},
+    response={200: ProjectListResponse, 400: Error, 401: Error, 403: Error},
     auth=auth,
     tags=["Admin"],
 )
+@decorate_view(cap_response_size("admin_projects"))
 def list_all_projects(
     request: HttpRequest,
     status_filter: ProjectStatus | None = Query(None),
     page: int = Query(1),
     per_page: int = Query(20),
+    count: CountStrategy = Query("exact"),
 ) -> dict[str, Any] | tuple[int, dict[str, str]]:
     if not require_admin(request.auth):
         return 403, {"detail": "Admin access required"}
 
+    error = page_size_error("admin_projects", page, per_page)
+    if error:
+        return 400, {"detail": error}
+
     queryset: QuerySet[Project] = Project.objects.select_related(
         "owner"
-    ).prefetch_related("tags")
+    ).prefetch_related("tags", "owner__groups", prefetch_uploaded_images())
 
     if status_filter:
         queryset = queryset.filter(status=status_filter)
@@ -55,9 +76,14 @@ def list_all_projects(
     queryset = queryset.order_by("-created_at")
 
     # Pagination
-    total = queryset.count()
-    pages = ceil(total / per_page)
     offset = (page - 1) * per_page
+    total, count_strategy = count_rows(
+        queryset,
+        count,
+        needed=offset + per_page,
+        filtered=status_filter is not None,
+    )
+    pages = ceil(total / per_page)
     projects = queryset[offset : offset + per_page]
 
     return {
@@ -66,6 +92,7 @@ def list_all_projects(
         "page": page,
         "per_page": per_page,
         "pages": pages,
+        "count_strategy": count_strategy,
     }
 
 
@@ -83,7 +110,10 @@ def get_project_for_review(
         return 403, {"detail": "Admin access required"}
 
     return get_object_or_404(
-        Project.objects.select_related("owner", "approved_by").prefetch_related("tags"),
+        Project.objects.select_related("owner", "approved_by").prefetch_related(
+            "tags",
+            prefetch_uploaded_images(),
+        ),
         id=project_id,
     )
 
@@ -142,10 +172,11 @@ def toggle_project_featured(
 # User Management
 @router.get(
     "/users",
-    response={200: list[UserResponse], 401: Error, 403: Error},
+    response={200: list[UserResponse], 400: Error, 401: Error, 403: Error},
     auth=auth,
     tags=["Admin"],
 )
+@decorate_view(cap_response_size("admin_users"))
 def list_users(
     request: HttpRequest,
     page: int = Query(1),
@@ -154,8 +185,14 @@ def list_users(
     if not require_admin(request.auth):
         return 403, {"detail": "Admin access required"}
 
+    error = page_size_error("admin_users", page, per_page)
+    if error:
+        return 400, {"detail": error}
+
     offset = (page - 1) * per_page
-    return User.objects.all().order_by("-created_at")[offset : offset + per_page]
+    return User.objects.prefetch_related("groups").order_by("-created_at")[
+        offset : offset + per_page
+    ]
 
 
 @router.put(
@@ -262,49 +299,57 @@ def get_platform_analytics(
     if not require_admin(request.auth):
         return 403, {"detail": "Admin access required"}
 
-    # Basic counts
-    total_projects = Project.objects.count()
-    pending_projects = Project.objects.filter(status=ProjectStatus.PENDING).count()
-    approved_projects = Project.objects.filter(status=ProjectStatus.APPROVED).count()
-    total_users = User.objects.count()
-
-    # Monthly submissions
-    monthly_submissions = {
-        project["submission_month"]: project["count"]
-        for project in Project.objects.values("submission_month").annotate(
-            count=Count("id"),
-        )
-    }
+    return read_analytics()
 
-    # Top tags
-    top_tags = [
-        {"name": tag.name, "count": tag.project_count}
-        for tag in Tag.objects.annotate(project_count=Count("projects")).order_by(
-            "-project_count",
-        )[:10]
-    ]
 
-    # Top tech stack (simplified)
-    tech_counts: dict[str, int] = {}
-    for project in Project.objects.all():
-        for tech in project.tech_stack:
-            tech_counts[tech] = tech_counts.get(tech, 0) + 1
-
-    top_tech_stack = [
-        {"name": tech, "count": count}
-        for tech, count in sorted(
-            tech_counts.items(),
-            key=lambda x: x[1],
-            reverse=True,
-        )[:10]
-    ]
+@router.get(
+    "/analytics/timeseries",
+    response={200: TimeseriesResponse, 400: Error, 401: Error, 403: Error},
+    auth=auth,
+    tags=["Admin"],
+)
+def get_analytics_timeseries(
+    request: HttpRequest,
+    start: date | None = Query(None),
+    end: date | None = Query(None),
+    interval: Interval = Query("day"),
+) -> dict[str, Any] | tuple[int, dict[str, str]]:
+    if not require_admin(request.auth):
+        return 403, {"detail": "Admin access required"}
+
+    end = end or timezone.localdate()
+    start = start or end - timedelta(days=DEFAULT_TIMESERIES_DAYS - 1)
+    if start > end:
+        return 400, {"detail": "start must not be after end"}
+    if len(buckets(start, end, interval)) > MAX_BUCKETS:
+        return 400, {
+            "detail": f"Range spans more than {MAX_BUCKETS} {interval} buckets",
+        }
+
+    key = f"admin-analytics:timeseries:{interval}:{start}:{end}"
+    points = cache.get(key)
+    if points is None:
+        points = build_timeseries(start, end, interval)
+        cache.set(key, points, timeout=settings.ANALYTICS_CACHE_TIMEOUT)
+
+    return {"interval": interval, "start": start, "end": end, "points": points}
+
+
+@router.get(
+    "/cache-stats",
+    response={200: dict, 401: Error, 403: Error},
+    auth=auth,
+    tags=["Admin"],
+)
+def get_cache_stats(
+    request: HttpRequest,
+) -> dict[str, Any] | tuple[int, dict[str, str]]:
+    if not require_admin(request.auth):
+        return 403, {"detail": "Admin access required"}
 
+    # Counters are per worker process
     return {
-        "total_projects": total_projects,
-        "pending_projects": pending_projects,
-        "approved_projects": approved_projects,
-        "total_users": total_users,
-        "monthly_submissions": monthly_submissions,
-        "top_tags": top_tags,
-        "top_tech_stack": top_tech_stack,
+        "public_api": cache_stats.snapshot(),
+        "project_views": view_buffer.snapshot(),
+        "rejected_requests": rejection_stats.snapshot(),
     }
@@ -6,11 +6,17 @@ from django.contrib.auth import authenticate, get_user_model
 from django.http import HttpRequest
 from ninja import Router
 
-from api.auth.jwt import create_access_token, create_refresh_token, verify_token
+from api.auth.jwt import (
+    access_token_claims,
+    create_access_token,
+    create_refresh_token,
+    verify_token,
+)
 from api.auth.security import auth
 from api.schemas.auth import AccessToken, LoginRequest, RefreshRequest, Token
 from api.schemas.errors import Error
 from api.schemas.user import UserCreate, UserResponse, UserUpdate
+from project_showcase.metrics import count_auth_failure
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -55,12 +61,14 @@ def login(
     user = authenticate(request, username=payload.email, password=payload.password)
 
     if not user:
+        count_auth_failure("invalid_credentials")
         return 401, {"detail": "Invalid credentials"}
 
     if not user.is_active:
+        count_auth_failure("inactive_account")
         return 401, {"detail": "Account is inactive"}
 
-    access_token = create_access_token(user.id)
+    access_token = create_access_token(user.id, access_token_claims(user))
     refresh_token = create_refresh_token(user.id)
 
     return {
@@ -82,20 +90,24 @@ def refresh_token_endpoint(
     token_payload = verify_token(payload.refresh_token)
 
     if not token_payload:
+        count_auth_failure("invalid_refresh_token")
         return 401, {"detail": "Invalid or expired refresh token"}
 
     if token_payload.get("type") != "refresh":
+        count_auth_failure("invalid_refresh_token")
         return 401, {"detail": "Invalid token type"}
 
     try:
         user = User.objects.get(id=token_payload["user_id"])
     except User.DoesNotExist:
+        count_auth_failure("invalid_refresh_token")
         return 401, {"detail": "User not found"}
 
     if not user.is_active:
+        count_auth_failure("inactive_account")
         return 401, {"detail": "Account is inactive"}
 
-    access_token = create_access_token(user.id)
+    access_token = create_access_token(user.id, access_token_claims(user))
 
     return {"access_token": access_token, "token_type": "bearer"}
 
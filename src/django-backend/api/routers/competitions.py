@@ -1,21 +1,54 @@
+from django.db.models import Prefetch, QuerySet
 from django.http import HttpRequest
-from django.shortcuts import get_object_or_404
+from django.shortcuts import aget_object_or_404, get_object_or_404
 from ninja import Router
+from ninja.decorators import decorate_view
 
-from api.schemas.competition import CompetitionListResponse, CompetitionResponse
+from api.cache import cache_public_response
+from api.conditional import competition_markers, conditional_on
+from api.schemas.competition import (
+    APPROVED_PROJECTS_ATTR,
+    CompetitionListResponse,
+    CompetitionResponse,
+)
 from api.schemas.errors import Error
-from apps.projects.models import Competition
+from apps.projects.models import Competition, Project, ProjectStatus
 
 router = Router()
+# Served by project_showcase.asgi instead of router (see api.main.async_api)
+async_router = Router()
+
+
+def _prefetch_approved_projects() -> Prefetch:
+    # One query for the whole response, however many projects it lists
+    return Prefetch(
+        "projects",
+        queryset=Project.objects.filter(status=ProjectStatus.APPROVED).select_related(
+            "main_image"
+        ),
+        to_attr=APPROVED_PROJECTS_ATTR,
+    )
+
+
+def _competitions() -> QuerySet[Competition]:
+    return Competition.objects.prefetch_related(_prefetch_approved_projects())
 
 
 @router.get("", response={200: CompetitionListResponse}, tags=["Competitions"])
+@decorate_view(cache_public_response("competitions"))
 def list_competitions(request: HttpRequest) -> dict:
-    competitions = Competition.objects.prefetch_related(
-        "projects",
-        "projects__images",
-    ).all()
-    return {"competitions": competitions}
+    return {"competitions": _competitions()}
+
+
+@async_router.get(
+    "",
+    response={200: CompetitionListResponse},
+    tags=["Competitions"],
+    url_name="list_competitions",
+)
+@decorate_view(cache_public_response("competitions"))
+async def alist_competitions(request: HttpRequest) -> dict:
+    return {"competitions": [competition async for competition in _competitions()]}
 
 
 @router.get(
@@ -23,13 +56,21 @@ def list_competitions(request: HttpRequest) -> dict:
     response={200: CompetitionResponse, 404: Error},
     tags=["Competitions"],
 )
+@decorate_view(conditional_on(competition_markers))
 def get_competition(
     request: HttpRequest, competition_id: str
 ) -> Competition | tuple[int, dict]:
-    return get_object_or_404(
-        Competition.objects.prefetch_related(
-            "projects",
-            "projects__images",
-        ),
-        id=competition_id,
-    )
+    return get_object_or_404(_competitions(), id=competition_id)
+
+
+@async_router.get(
+    "/{competition_id}",
+    response={200: CompetitionResponse, 404: Error},
+    tags=["Competitions"],
+    url_name="get_competition",
+)
+@decorate_view(conditional_on(competition_markers))
+async def aget_competition(
+    request: HttpRequest, competition_id: str
+) -> Competition | tuple[int, dict]:
+    return await aget_object_or_404(_competitions(), id=competition_id)
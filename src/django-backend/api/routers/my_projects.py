@@ -7,7 +7,7 @@ from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from ninja import Router
 
-from api.auth.security import auth
+from api.auth.security import auth, claims_auth
 from api.schemas.errors import Error
 from api.schemas.project import (
     ImageUploadCompleteRequest,
@@ -19,7 +19,13 @@ from api.schemas.project import (
     SetMainImageRequest,
 )
 from api.services.storage import storage_service
-from apps.projects.models import Project, ProjectImage, ProjectStatus, UploadStatus
+from apps.projects.models import (
+    Project,
+    ProjectImage,
+    ProjectStatus,
+    UploadStatus,
+    prefetch_uploaded_images,
+)
 from apps.tags.models import Tag
 
 # Image upload configuration
@@ -38,14 +44,14 @@ router = Router()
 @router.get(
     "",
     response={200: list[ProjectResponse], 401: Error},
-    auth=auth,
+    auth=claims_auth,
     tags=["My Projects"],
 )
 def list_my_projects(request: HttpRequest) -> QuerySet[Project]:
     return (
-        Project.objects.filter(owner=request.auth)
+        Project.objects.filter(owner_id=request.auth.id)
         .select_related("owner")
-        .prefetch_related("tags")
+        .prefetch_related("tags", "owner__groups", prefetch_uploaded_images())
     )
 
 
@@ -107,7 +113,9 @@ def create_project(
 )
 def get_my_project(request: HttpRequest, project_id: str) -> Project:
     return get_object_or_404(
-        Project.objects.select_related("owner").prefetch_related("tags"),
+        Project.objects.select_related("owner").prefetch_related(
+            "tags", "owner__groups", prefetch_uploaded_images()
+        ),
         id=project_id,
         owner=request.auth,
     )
@@ -300,6 +308,7 @@ def complete_upload(
         image.is_main = True
 
     image.save()
+
     return image
 
 
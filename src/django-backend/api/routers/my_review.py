@@ -1,7 +1,8 @@
+from django.db.models import Count, Prefetch
 from django.http import HttpRequest
 from ninja import Router
 
-from api.auth.security import auth
+from api.auth.security import auth, claims_auth
 from api.schemas.errors import Error
 from api.schemas.my_review import (
     RankingUpdateRequest,
@@ -15,6 +16,7 @@ from api.schemas.my_review import (
 from apps.projects.models import (
     Competition,
     CompetitionReviewer,
+    Project,
     ProjectRanking,
     ReviewStatus,
 )
@@ -25,13 +27,15 @@ router = Router()
 @router.get(
     "/competitions",
     response={200: ReviewCompetitionListResponse},
-    auth=auth,
+    auth=claims_auth,
     tags=["My Review"],
 )
 def list_my_review_competitions(request: HttpRequest) -> ReviewCompetitionListResponse:
     """List all competitions the current user is assigned to review."""
-    assignments = CompetitionReviewer.objects.filter(user=request.auth).select_related(
-        "competition"
+    assignments = (
+        CompetitionReviewer.objects.filter(user_id=request.auth.id)
+        .select_related("competition")
+        .annotate(project_count=Count("competition__projects"))
     )
 
     competitions = [
@@ -40,7 +44,7 @@ def list_my_review_competitions(request: HttpRequest) -> ReviewCompetitionListRe
             name=a.competition.name,
             start_date=a.competition.start_date,
             end_date=a.competition.end_date,
-            project_count=a.competition.projects.count(),
+            project_count=a.project_count,
             my_review_status=a.status,
         )
         for a in assignments
@@ -68,8 +72,10 @@ def get_my_review_competition(
         return 404, Error(detail="Competition not found")
 
     competition = Competition.objects.prefetch_related(
-        "projects",
-        "projects__images",
+        Prefetch(
+            "projects",
+            queryset=Project.objects.select_related("main_image"),
+        ),
     ).get(id=competition_id)
 
     rankings = {
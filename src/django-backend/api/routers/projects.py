@@ -1,93 +1,273 @@
+from collections.abc import Callable
+from functools import wraps
+from http import HTTPStatus
 from math import ceil
 from typing import TYPE_CHECKING, Any
+from uuid import UUID
 
-from django.db.models import Q, QuerySet
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.db.models import QuerySet
 from django.http import HttpRequest
 from ninja import Query, Router
+from ninja.decorators import decorate_view
 
 from api.auth.jwt import get_user_from_token
+from api.cache import cache_public_response
+from api.conditional import conditional_on, project_markers, request_markers
+from api.guardrails import cap_response_size, page_size_error
+from api.pagination import (
+    InvalidCursorError,
+    acount_rows,
+    apaginate_by_cursor,
+    count_rows,
+    paginate_by_cursor,
+)
 from api.schemas.errors import Error
-from api.schemas.project import ProjectListResponse, ProjectResponse
-from apps.projects.models import Project, ProjectStatus
+from api.schemas.project import (
+    ProjectListQuery,
+    ProjectListResponse,
+    ProjectResponse,
+)
+from apps.projects.models import Project, ProjectStatus, prefetch_uploaded_images
+from apps.projects.search import search_projects
+from apps.projects.tech_stack import filter_by_tech_stack
+from apps.projects.view_tracking import view_buffer
+from project_showcase.middleware import get_client_ip
 
 if TYPE_CHECKING:
     from apps.users.models import User
 
 router = Router()
+# The same endpoints as async views, served by project_showcase.asgi (see
+# api.main.async_api). The WSGI deployment keeps the sync ones above.
+async_router = Router()
 
+# Public sort names and the columns they order by. Each column is non-nullable
+# (so keyset pagination can seek on it) and has a partial index on approved
+# projects ending in id, the tiebreaker (see Project.Meta.indexes).
+SORT_FIELDS = {
+    "created_at": "created_at",
+    "title": "title",
+    "monthly_visitors": "monthly_visitors",
+}
+SORT_ORDERS = {"asc", "desc"}
 
-@router.get("", response={200: ProjectListResponse}, tags=["Projects"])
-def list_projects(
-    request: HttpRequest,
-    tags: list[str] | None = Query(None),
-    tech_stack: list[str] | None = Query(None),
-    sort_by: str = Query("created_at"),
-    sort_order: str = Query("desc"),
-    search: str | None = Query(None),
-    page: int = Query(1),
-    per_page: int = Query(20),
-) -> dict[str, Any]:
-    # Start with approved projects only
-    queryset: QuerySet[Project] = (
+
+def _listing_error(query: ProjectListQuery) -> str | None:
+    error = page_size_error("projects", query.page, query.per_page)
+    if error:
+        return error
+    if query.sort_by not in SORT_FIELDS:
+        return f"Cannot sort by {query.sort_by}; use one of {', '.join(SORT_FIELDS)}"
+    if query.sort_order not in SORT_ORDERS:
+        return "sort_order must be asc or desc"
+    # Search results are ordered by rank, which is not a column to seek on
+    if query.pagination == "cursor" and query.search:
+        return "Cursor pagination cannot be used with search"
+    return None
+
+
+def _approved_projects() -> QuerySet[Project]:
+    return (
         Project.objects.filter(status=ProjectStatus.APPROVED)
         .select_related("owner")
-        .prefetch_related("tags")
+        .prefetch_related("tags", "owner__groups", prefetch_uploaded_images())
     )
 
-    # Apply filters
-    if tags:
-        queryset = queryset.filter(tags__slug__in=tags).distinct()
 
-    if tech_stack:
-        for tech in tech_stack:
-            queryset = queryset.filter(tech_stack__icontains=tech)
+def _filtered_projects(query: ProjectListQuery) -> QuerySet[Project]:
+    queryset = _approved_projects()
+
+    if query.tags:
+        queryset = queryset.filter(tags__slug__in=query.tags).distinct()
 
-    if search:
-        queryset = queryset.filter(
-            Q(title__icontains=search) | Q(description__icontains=search),
+    if query.tech_stack:
+        queryset = filter_by_tech_stack(
+            queryset,
+            query.tech_stack,
+            match_all=query.tech_stack_match == "all",
         )
 
-    # Apply sorting
-    order_field = f"-{sort_by}" if sort_order == "desc" else sort_by
-    queryset = queryset.order_by(order_field)
+    if query.search:
+        queryset = search_projects(queryset, query.search)
+
+    return queryset
 
-    # Pagination
-    total = queryset.count()
-    pages = ceil(total / per_page)
-    offset = (page - 1) * per_page
-    projects = queryset[offset : offset + per_page]
 
+def _ordered(queryset: QuerySet[Project], query: ProjectListQuery) -> QuerySet[Project]:
+    # The id tiebreaker keeps page boundaries stable
+    direction = "-" if query.sort_order == "desc" else ""
+    ordering = [f"{direction}{SORT_FIELDS[query.sort_by]}", f"{direction}id"]
+    if query.search:
+        ordering.insert(0, "-search_rank")
+    return queryset.order_by(*ordering)
+
+
+def _cursor_listing(
+    query: ProjectListQuery,
+    projects: list[Project],
+    next_cursor: str | None,
+) -> dict[str, Any]:
+    return {
+        "projects": projects,
+        "total": None,
+        "page": query.page,
+        "per_page": query.per_page,
+        "pages": None,
+        "next_cursor": next_cursor,
+    }
+
+
+def _page_listing(
+    query: ProjectListQuery,
+    projects: list[Project],
+    total: int,
+    count_strategy: str,
+) -> dict[str, Any]:
     return {
         "projects": projects,
         "total": total,
-        "page": page,
-        "per_page": per_page,
-        "pages": pages,
+        "page": query.page,
+        "per_page": query.per_page,
+        "pages": ceil(total / query.per_page),
+        "count_strategy": count_strategy,
     }
 
 
+def _is_filtered(query: ProjectListQuery) -> bool:
+    return bool(query.tags or query.tech_stack or query.search)
+
+
+@router.get("", response={200: ProjectListResponse, 400: Error}, tags=["Projects"])
+@decorate_view(cap_response_size("projects"), cache_public_response("projects"))
+def list_projects(
+    request: HttpRequest,
+    query: Query[ProjectListQuery],
+) -> dict[str, Any] | tuple[int, dict[str, str]]:
+    error = _listing_error(query)
+    if error:
+        return 400, {"detail": error}
+
+    queryset = _filtered_projects(query)
+
+    # Cursor mode seeks past the previous page and skips the COUNT entirely
+    if query.pagination == "cursor":
+        try:
+            projects, next_cursor = paginate_by_cursor(
+                queryset,
+                SORT_FIELDS[query.sort_by],
+                descending=query.sort_order == "desc",
+                cursor=query.cursor,
+                per_page=query.per_page,
+            )
+        except InvalidCursorError:
+            return 400, {"detail": "Invalid cursor"}
+        return _cursor_listing(query, projects, next_cursor)
+
+    queryset = _ordered(queryset, query)
+    offset = (query.page - 1) * query.per_page
+    total, count_strategy = count_rows(
+        queryset,
+        query.count,
+        needed=offset + query.per_page,
+        filtered=_is_filtered(query),
+    )
+    projects = list(queryset[offset : offset + query.per_page])
+    return _page_listing(query, projects, total, count_strategy)
+
+
+@async_router.get(
+    "",
+    response={200: ProjectListResponse, 400: Error},
+    tags=["Projects"],
+    url_name="list_projects",
+)
+@decorate_view(cap_response_size("projects"), cache_public_response("projects"))
+async def alist_projects(
+    request: HttpRequest,
+    query: Query[ProjectListQuery],
+) -> dict[str, Any] | tuple[int, dict[str, str]]:
+    error = _listing_error(query)
+    if error:
+        return 400, {"detail": error}
+
+    queryset = _filtered_projects(query)
+
+    if query.pagination == "cursor":
+        try:
+            projects, next_cursor = await apaginate_by_cursor(
+                queryset,
+                SORT_FIELDS[query.sort_by],
+                descending=query.sort_order == "desc",
+                cursor=query.cursor,
+                per_page=query.per_page,
+            )
+        except InvalidCursorError:
+            return 400, {"detail": "Invalid cursor"}
+        return _cursor_listing(query, projects, next_cursor)
+
+    queryset = _ordered(queryset, query)
+    offset = (query.page - 1) * query.per_page
+    total, count_strategy = await acount_rows(
+        queryset,
+        query.count,
+        needed=offset + query.per_page,
+        filtered=_is_filtered(query),
+    )
+    projects = [p async for p in queryset[offset : offset + query.per_page]]
+    return _page_listing(query, projects, total, count_strategy)
+
+
+def _featured_projects() -> QuerySet[Project]:
+    return _approved_projects().filter(is_featured=True)[:10]
+
+
+def _trending_projects() -> QuerySet[Project]:
+    # Scores are precomputed by the refresh_trending command; this ordering
+    # matches projects_trending_idx
+    return _approved_projects().order_by("-trending_score", "-created_at")[:10]
+
+
 @router.get("/featured", response={200: list[ProjectResponse]}, tags=["Projects"])
+@decorate_view(cache_public_response("projects-featured"))
 def get_featured_projects(
     request: HttpRequest,
 ) -> QuerySet[Project]:
-    return (
-        Project.objects.filter(status=ProjectStatus.APPROVED, is_featured=True)
-        .select_related("owner")
-        .prefetch_related("tags")[:10]
-    )
+    return _featured_projects()
+
+
+@async_router.get(
+    "/featured",
+    response={200: list[ProjectResponse]},
+    tags=["Projects"],
+    url_name="get_featured_projects",
+)
+@decorate_view(cache_public_response("projects-featured"))
+async def aget_featured_projects(
+    request: HttpRequest,
+) -> list[Project]:
+    return [project async for project in _featured_projects()]
 
 
 @router.get("/trending", response={200: list[ProjectResponse]}, tags=["Projects"])
+@decorate_view(cache_public_response("projects-trending"))
 def get_trending_projects(
     request: HttpRequest,
 ) -> QuerySet[Project]:
-    # Get projects sorted by monthly visitors
-    return (
-        Project.objects.filter(status=ProjectStatus.APPROVED)
-        .select_related("owner")
-        .prefetch_related("tags")
-        .order_by("-monthly_visitors")[:10]
-    )
+    return _trending_projects()
+
+
+@async_router.get(
+    "/trending",
+    response={200: list[ProjectResponse]},
+    tags=["Projects"],
+    url_name="get_trending_projects",
+)
+@decorate_view(cache_public_response("projects-trending"))
+async def aget_trending_projects(
+    request: HttpRequest,
+) -> list[Project]:
+    return [project async for project in _trending_projects()]
 
 
 def _get_user_from_request(request: HttpRequest) -> "User | None":
@@ -99,31 +279,108 @@ def _get_user_from_request(request: HttpRequest) -> "User | None":
     return None
 
 
+def track_project_view(view: Callable[..., Any]) -> Callable[..., Any]:
+    """Buffer a view for each approved project served, 304s included.
+
+    It wraps conditional_on(project_markers), whose markers exist only for
+    approved projects, so browsers revalidating a cached copy still count.
+    """
+
+    def record(request: HttpRequest, project_id: str, response: Any) -> None:
+        served = {HTTPStatus.OK, HTTPStatus.NOT_MODIFIED}
+        if (
+            response.status_code in served
+            and request_markers(request, project_markers) is not None
+        ):
+            view_buffer.record(
+                UUID(project_id),
+                get_client_ip(request),
+                request.headers.get("User-Agent", ""),
+            )
+
+    if iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_wrapper(
+            request: HttpRequest,
+            project_id: str,
+            **kwargs: Any,
+        ) -> Any:
+            response = await view(request, project_id=project_id, **kwargs)
+            record(request, project_id, response)
+            return response
+
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request: HttpRequest, project_id: str, **kwargs: Any) -> Any:
+        response = view(request, project_id=project_id, **kwargs)
+        record(request, project_id, response)
+        return response
+
+    return wrapper
+
+
+def _project_detail() -> QuerySet[Project]:
+    return Project.objects.select_related("owner").prefetch_related(
+        "tags",
+        "owner__groups",
+        prefetch_uploaded_images(),
+    )
+
+
+def _visible_to(project: Project, user: "User | None") -> bool:
+    # Approved projects are visible to everyone, the rest only to their owner
+    # or an admin
+    if project.status == ProjectStatus.APPROVED:
+        return True
+    return bool(user and (project.owner == user or user.is_superuser))
+
+
 @router.get(
     "/{project_id}",
     response={200: ProjectResponse, 404: Error},
     tags=["Projects"],
 )
+@decorate_view(conditional_on(project_markers), track_project_view)
 def get_project(
     request: HttpRequest,
     project_id: str,
 ) -> Project | tuple[int, dict[str, str]]:
     try:
-        project = (
-            Project.objects.select_related("owner")
-            .prefetch_related("tags")
-            .get(id=project_id)
-        )
+        project = _project_detail().get(id=project_id)
     except Project.DoesNotExist:
         return 404, {"detail": "Project not found"}
 
-    # Approved projects are visible to everyone
-    if project.status == ProjectStatus.APPROVED:
+    user = None
+    if project.status != ProjectStatus.APPROVED:
+        user = _get_user_from_request(request)
+    if _visible_to(project, user):
         return project
 
-    # Non-approved projects only visible to owner or admin
-    user = _get_user_from_request(request)
-    if user and (project.owner == user or user.is_superuser):
+    return 404, {"detail": "Project not found"}
+
+
+@async_router.get(
+    "/{project_id}",
+    response={200: ProjectResponse, 404: Error},
+    tags=["Projects"],
+    url_name="get_project",
+)
+@decorate_view(conditional_on(project_markers), track_project_view)
+async def aget_project(
+    request: HttpRequest,
+    project_id: str,
+) -> Project | tuple[int, dict[str, str]]:
+    try:
+        project = await _project_detail().aget(id=project_id)
+    except Project.DoesNotExist:
+        return 404, {"detail": "Project not found"}
+
+    user = None
+    if project.status != ProjectStatus.APPROVED:
+        user = await sync_to_async(_get_user_from_request)(request)
+    if _visible_to(project, user):
         return project
 
     return 404, {"detail": "Project not found"}
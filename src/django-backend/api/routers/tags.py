@@ -1,13 +1,29 @@
 from django.db.models import QuerySet
 from django.http import HttpRequest
 from ninja import Router
+from ninja.decorators import decorate_view
 
+from api.cache import cache_public_response
 from api.schemas.tag import TagResponse
 from apps.tags.models import Tag
 
 router = Router()
+# Served by project_showcase.asgi instead of router (see api.main.async_api)
+async_router = Router()
 
 
 @router.get("", response={200: list[TagResponse]}, tags=["Tags"])
+@decorate_view(cache_public_response("tags"))
 def list_tags(request: HttpRequest) -> QuerySet[Tag]:
     return Tag.objects.all()
+
+
+@async_router.get(
+    "",
+    response={200: list[TagResponse]},
+    tags=["Tags"],
+    url_name="list_tags",
+)
+@decorate_view(cache_public_response("tags"))
+async def alist_tags(request: HttpRequest) -> list[Tag]:
+    return [tag async for tag in Tag.objects.all()]
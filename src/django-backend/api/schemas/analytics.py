@@ -0,0 +1,19 @@
+from datetime import date
+from typing import Literal
+
+from ninja import Schema
+
+
+class TimeseriesPoint(Schema):
+    period: date
+    submissions: int
+    approvals: int
+    registrations: int
+    views: int
+
+
+class TimeseriesResponse(Schema):
+    interval: Literal["day", "week", "month"]
+    start: date
+    end: date
+    points: list[TimeseriesPoint]
@@ -6,6 +6,9 @@ from ninja import Schema
 
 from apps.projects.models import ProjectStatus
 
+# Attribute the competitions router prefetches approved projects onto
+APPROVED_PROJECTS_ATTR = "approved_projects"
+
 
 class CompetitionProjectResponse(Schema):
     id: UUID
@@ -14,10 +17,7 @@ class CompetitionProjectResponse(Schema):
 
     @staticmethod
     def resolve_main_image_url(obj: Any) -> str | None:
-        main_image = obj.images.filter(upload_status="uploaded", is_main=True).first()
-        if not main_image:
-            main_image = obj.images.filter(upload_status="uploaded").first()
-        return main_image.url if main_image else None
+        return obj.main_image.url if obj.main_image else None
 
 
 class CompetitionResponse(Schema):
@@ -29,9 +29,12 @@ class CompetitionResponse(Schema):
 
     @staticmethod
     def resolve_projects(obj: Any) -> list[Any]:
+        projects = getattr(obj, APPROVED_PROJECTS_ATTR, None)
+        if projects is not None:
+            return projects
         return list(
-            obj.projects.filter(status=ProjectStatus.APPROVED).prefetch_related(
-                "images"
+            obj.projects.filter(status=ProjectStatus.APPROVED).select_related(
+                "main_image"
             )
         )
 
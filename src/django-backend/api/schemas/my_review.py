@@ -38,10 +38,7 @@ class ReviewProjectResponse(Schema):
 
     @staticmethod
     def resolve_main_image_url(obj: Any) -> str | None:
-        main_image = obj.images.filter(upload_status="uploaded", is_main=True).first()
-        if not main_image:
-            main_image = obj.images.filter(upload_status="uploaded").first()
-        return main_image.url if main_image else None
+        return obj.main_image.url if obj.main_image else None
 
 
 class ReviewCompetitionDetailResponse(Schema):
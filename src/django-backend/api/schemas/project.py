@@ -1,9 +1,12 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
 from ninja import Schema
 
+from api.pagination import CountStrategy
+from apps.projects.models import uploaded_images_of
+
 from .tag import TagResponse
 from .user import UserResponse
 
@@ -56,8 +59,8 @@ class ProjectResponse(Schema):
 
     @staticmethod
     def resolve_images(obj: Any) -> list[Any]:
-        """Only return uploaded images."""
-        return list(obj.images.filter(upload_status="uploaded"))
+        """Only return uploaded images, using the prefetched list when present."""
+        return uploaded_images_of(obj)
 
 
 class PresignedUploadRequest(Schema):
@@ -104,12 +107,32 @@ class SetMainImageRequest(Schema):
     image_id: UUID
 
 
+class ProjectListQuery(Schema):
+    """Query parameters of the public project listing."""
+
+    tags: list[str] | None = None
+    tech_stack: list[str] | None = None
+    tech_stack_match: Literal["all", "any"] = "all"
+    sort_by: str = "created_at"
+    sort_order: str = "desc"
+    search: str | None = None
+    page: int = 1
+    per_page: int = 20
+    pagination: Literal["page", "cursor"] = "page"
+    cursor: str | None = None
+    count: CountStrategy = "exact"
+
+
 class ProjectListResponse(Schema):
     projects: list[ProjectResponse]
-    total: int
+    # total and pages are None when listing with cursor pagination
+    total: int | None
     page: int
     per_page: int
-    pages: int
+    pages: int | None
+    next_cursor: str | None = None
+    # How total was counted (see api.pagination.count_rows); None with cursors
+    count_strategy: CountStrategy | None = None
 
 
 class AdminProjectResponse(ProjectResponse):
@@ -25,7 +25,8 @@ class UserResponse(Schema):
 
     @staticmethod
     def resolve_groups(obj: Any) -> list[str]:
-        return list(obj.groups.values_list("name", flat=True))
+        # Iterating .all() lets callers prefetch groups for whole pages
+        return [group.name for group in obj.groups.all()]
 
 
 class UserUpdate(Schema):
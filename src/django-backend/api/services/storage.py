@@ -7,6 +7,8 @@ import boto3
 from botocore.config import Config
 from django.conf import settings
 
+from project_showcase.metrics import instrument_s3_client
+
 
 class StorageService:
     """Service for interacting with S3-compatible object storage."""
@@ -26,6 +28,7 @@ class StorageService:
                 aws_secret_access_key=settings.SCW_SECRET_KEY,
                 config=Config(signature_version="s3v4"),
             )
+            instrument_s3_client(self._client)
         return self._client
 
     def generate_upload_key(self, project_id: str, filename: str) -> str:
@@ -18,6 +18,8 @@ from .models import (
     ProjectStatus,
     ProjectView,
 )
+from .rollups import rebuild_status_counts
+from .view_counters import views_since
 
 if TYPE_CHECKING:
     from django.utils.safestring import SafeString
@@ -147,16 +149,18 @@ class ProjectAdmin(admin.ModelAdmin):
             return format_html('<a href="{}">{}</a>', url, obj.owner.email)
         return "-"
 
-    @admin.display(description="Total Views")
+    @admin.display(description="Total Views", ordering="total_views")
     def view_count(self, obj: Project) -> int:
-        return obj.views.count()
+        # Annotated by get_queryset(); the change form's object has it too
+        return getattr(obj, "total_views", 0)
 
     def get_queryset(self, request: HttpRequest) -> QuerySet[Project]:
         return (
             super()
             .get_queryset(request)
             .select_related("owner", "approved_by")
-            .prefetch_related("tags", "views")
+            .prefetch_related("tags")
+            .annotate(total_views=views_since())
         )
 
     actions = [
@@ -177,6 +181,8 @@ class ProjectAdmin(admin.ModelAdmin):
             approved_by=request.user,
             approved_at=timezone.now(),
         )
+        # QuerySet.update() bypasses the signals that maintain the rollups
+        rebuild_status_counts()
         self.message_user(request, f"{updated} projects were approved.")
 
     @admin.action(description="Reject selected projects")
@@ -189,6 +195,8 @@ class ProjectAdmin(admin.ModelAdmin):
             status=ProjectStatus.REJECTED,
             approved_by=request.user,
         )
+        # QuerySet.update() bypasses the signals that maintain the rollups
+        rebuild_status_counts()
         self.message_user(request, f"{updated} projects were rejected.")
 
     @admin.action(description="Feature selected projects")
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ProjectsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.projects"
+
+    def ready(self) -> None:
+        from . import signals  # noqa: F401, PLC0415
@@ -0,0 +1,30 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized Project.main_image pointer."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Number of projects loaded per batch",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        changed = 0
+        projects = Project.objects.select_related("main_image").iterator(
+            chunk_size=options["chunk_size"],
+        )
+        for project in projects:
+            previous = project.main_image_id
+            image = project.refresh_main_image()
+            if (image.pk if image else None) != previous:
+                changed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Updated {changed} projects."))
@@ -0,0 +1,22 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.projects.rollups import TECH_STACK_CHUNK_SIZE, rebuild_rollups
+
+
+class Command(BaseCommand):
+    help = "Recompute the analytics rollup table from the projects and users."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=TECH_STACK_CHUNK_SIZE,
+            help="Projects streamed per batch when tallying tech stacks outside "
+            "PostgreSQL",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        rows = rebuild_rollups(chunk_size=options["chunk_size"])
+        self.stdout.write(self.style.SUCCESS(f"Wrote {rows} rollup rows."))
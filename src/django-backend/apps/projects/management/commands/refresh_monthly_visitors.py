@@ -0,0 +1,21 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from apps.projects.view_counters import MONTHLY_VISITORS_DAYS, refresh_monthly_visitors
+
+
+class Command(BaseCommand):
+    help = "Derive Project.monthly_visitors from the daily view counters."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=MONTHLY_VISITORS_DAYS,
+            help="Number of days, ending today, to sum",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        changed = refresh_monthly_visitors(days=options["days"])
+        self.stdout.write(self.style.SUCCESS(f"Updated {changed} projects."))
@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.projects.trending import refresh_trending_scores
+
+
+class Command(BaseCommand):
+    help = "Recompute the time-decayed Project.trending_score."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        changed = refresh_trending_scores()
+        self.stdout.write(self.style.SUCCESS(f"Updated {changed} projects."))
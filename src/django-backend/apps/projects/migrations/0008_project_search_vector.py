@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:14
+
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# GIN indexes are PostgreSQL-only, so they are created here rather than in
+# Project.Meta.indexes to keep the SQLite development database migratable.
+# The trigram indexes match the UPPER(...) LIKE expression Django emits for
+# icontains lookups.
+CREATE_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS projects_search_vector_gin "
+    "ON projects USING gin (search_vector)",
+    "CREATE INDEX IF NOT EXISTS projects_title_trgm "
+    "ON projects USING gin ((UPPER(title::text)) gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS projects_description_trgm "
+    "ON projects USING gin ((UPPER(description::text)) gin_trgm_ops)",
+]
+
+DROP_INDEXES = [
+    "DROP INDEX IF EXISTS projects_search_vector_gin",
+    "DROP INDEX IF EXISTS projects_title_trgm",
+    "DROP INDEX IF EXISTS projects_description_trgm",
+]
+
+BACKFILL = """
+UPDATE projects p SET search_vector =
+    setweight(to_tsvector('simple', coalesce(p.title, '')), 'A')
+    || setweight(to_tsvector('simple', coalesce((
+        SELECT string_agg(t.name, ' ')
+        FROM tags t JOIN projects_tags pt ON pt.tag_id = t.id
+        WHERE pt.project_id = p.id
+    ), '')), 'B')
+    || setweight(to_tsvector('simple', coalesce(p.description, '')), 'B')
+    || setweight(to_tsvector('simple', coalesce(p.long_description, '')), 'C')
+"""
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for sql in CREATE_INDEXES:
+        schema_editor.execute(sql)
+    schema_editor.execute(BACKFILL)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for sql in DROP_INDEXES:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0007_competition_reviewer_status"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="project",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,67 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:17
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+def backfill_tech_stack_items(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    TechStackItem = apps.get_model("projects", "TechStackItem")
+    items = []
+    for project_id, tech_stack in Project.objects.values_list(
+        "id", "tech_stack"
+    ).iterator(chunk_size=2000):
+        names = {
+            name.strip().lower()[:100]
+            for name in tech_stack or []
+            if isinstance(name, str) and name.strip()
+        }
+        items.extend(TechStackItem(project_id=project_id, name=name) for name in names)
+        # Write as we go so memory stays flat however many projects there are
+        if len(items) >= 2000:
+            TechStackItem.objects.bulk_create(items, ignore_conflicts=True)
+            items = []
+    TechStackItem.objects.bulk_create(items, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0008_project_search_vector"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TechStackItem",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                ("name", models.CharField(max_length=100)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="tech_stack_items",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "project_tech_stack",
+                "indexes": [
+                    models.Index(
+                        fields=["name", "project"], name="project_tec_name_e86356_idx"
+                    )
+                ],
+                "unique_together": {("project", "name")},
+            },
+        ),
+        migrations.RunPython(backfill_tech_stack_items, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:24
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_main_images(apps, schema_editor):
+    Project = apps.get_model("projects", "Project")
+    ProjectImage = apps.get_model("projects", "ProjectImage")
+    # Per project, the uploaded image flagged as main, else the first one
+    images = (
+        ProjectImage.objects.filter(upload_status="uploaded")
+        .order_by("project_id", "-is_main", "display_order", "created_at")
+        .values_list("project_id", "id")
+    )
+    batch = []
+    previous = None
+    for project_id, image_id in images.iterator(chunk_size=2000):
+        if project_id == previous:
+            continue
+        previous = project_id
+        batch.append(Project(id=project_id, main_image_id=image_id))
+        if len(batch) >= 2000:
+            Project.objects.bulk_update(batch, ["main_image"])
+            batch = []
+    Project.objects.bulk_update(batch, ["main_image"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0009_techstackitem"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="project",
+            name="main_image",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="projects.projectimage",
+            ),
+        ),
+        migrations.RunPython(backfill_main_images, migrations.RunPython.noop),
+    ]
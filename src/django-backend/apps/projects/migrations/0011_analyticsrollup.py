@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0010_project_main_image"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AnalyticsRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "dimension",
+                    models.CharField(
+                        choices=[
+                            ("status", "Projects by status"),
+                            ("month", "Submissions by month"),
+                            ("tag", "Projects by tag"),
+                            ("tech", "Projects by technology"),
+                            ("users", "Users"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("key", models.CharField(max_length=100)),
+                ("count", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "db_table": "analytics_rollups",
+                "indexes": [
+                    models.Index(
+                        fields=["dimension", "-count"],
+                        name="analytics_r_dimensi_e541b8_idx",
+                    )
+                ],
+                "unique_together": {("dimension", "key")},
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-17 17:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0012_timeseries_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectDailyViews",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "project",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_views",
+                        to="projects.project",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "project_daily_views",
+                "indexes": [
+                    models.Index(fields=["date"], name="project_dai_date_5cb3a3_idx")
+                ],
+                "unique_together": {("project", "date")},
+            },
+        ),
+    ]
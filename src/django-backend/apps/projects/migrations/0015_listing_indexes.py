@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0014_project_trending_score"),
+        ("tags", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("status", "approved")),
+                fields=["created_at", "id"],
+                name="projects_approved_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("status", "approved")),
+                fields=["monthly_visitors", "id"],
+                name="projects_approved_visitors_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("is_featured", True), ("status", "approved")),
+                fields=["-created_at"],
+                name="projects_featured_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                fields=["owner", "-created_at"], name="projects_owner_created_idx"
+            ),
+        ),
+    ]
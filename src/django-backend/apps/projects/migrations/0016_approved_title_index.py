@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 18:09
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("projects", "0015_listing_indexes"),
+        ("tags", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="project",
+            index=models.Index(
+                condition=models.Q(("status", "approved")),
+                fields=["title", "id"],
+                name="projects_approved_title_idx",
+            ),
+        ),
+    ]
@@ -1,7 +1,9 @@
 import uuid
+from collections.abc import Iterable
 from typing import Any
 
 from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.utils import timezone
 
@@ -33,10 +35,26 @@ class Project(models.Model):
     rejection_reason = models.TextField(blank=True, null=True)
     is_featured = models.BooleanField(default=False)
     submission_month = models.CharField(max_length=7, db_index=True)  # YYYY-MM format
-    approved_at = models.DateTimeField(blank=True, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    approved_at = models.DateTimeField(blank=True, null=True, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Maintained by apps.projects.signals; GIN indexed on PostgreSQL only
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Time-decayed popularity, recomputed by the refresh_trending command
+    trending_score = models.FloatField(default=0, editable=False)
+
+    # Denormalized thumbnail pointer, kept in sync by ProjectImage signals and
+    # rebuildable with the backfill_main_images command
+    main_image = models.ForeignKey(
+        "ProjectImage",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
     # Foreign Keys
     owner = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -57,6 +75,45 @@ class Project(models.Model):
     class Meta:
         db_table = "projects"
         ordering = ["-created_at"]
+        # Matched to the listing queries; tests/test_query_plans.py checks
+        # PostgreSQL uses them. The id column is the keyset tiebreaker.
+        indexes = [
+            # Serves /projects/trending as an index-ordered LIMIT
+            models.Index(
+                fields=["-trending_score", "-created_at"],
+                condition=models.Q(status=ProjectStatus.APPROVED),
+                name="projects_trending_idx",
+            ),
+            # Public listing, newest first (default sort)
+            models.Index(
+                fields=["created_at", "id"],
+                condition=models.Q(status=ProjectStatus.APPROVED),
+                name="projects_approved_created_idx",
+            ),
+            # Public listing sorted by title
+            models.Index(
+                fields=["title", "id"],
+                condition=models.Q(status=ProjectStatus.APPROVED),
+                name="projects_approved_title_idx",
+            ),
+            # Public listing sorted by visitors
+            models.Index(
+                fields=["monthly_visitors", "id"],
+                condition=models.Q(status=ProjectStatus.APPROVED),
+                name="projects_approved_visitors_idx",
+            ),
+            # /projects/featured
+            models.Index(
+                fields=["-created_at"],
+                condition=models.Q(status=ProjectStatus.APPROVED, is_featured=True),
+                name="projects_featured_idx",
+            ),
+            # /my-projects, newest first
+            models.Index(
+                fields=["owner", "-created_at"],
+                name="projects_owner_created_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -66,6 +123,64 @@ class Project(models.Model):
             self.submission_month = timezone.now().strftime("%Y-%m")
         super().save(*args, **kwargs)
 
+    def set_main_image(self, image: "ProjectImage | None") -> None:
+        self.main_image = image
+        self.save(update_fields=["main_image", "updated_at"])
+
+    def refresh_main_image(self) -> "ProjectImage | None":
+        """Point main_image at the main-or-first uploaded image."""
+        image = select_main_image(
+            self.images.filter(upload_status=UploadStatus.UPLOADED),
+        )
+        if image != self.main_image:
+            self.set_main_image(image)
+        return image
+
+
+class TechStackItem(models.Model):
+    """Lowercased copy of one Project.tech_stack entry, for indexed filtering."""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="tech_stack_items",
+    )
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        db_table = "project_tech_stack"
+        unique_together = ["project", "name"]
+        indexes = [models.Index(fields=["name", "project"])]
+
+    def __str__(self) -> str:
+        return f"{self.project} - {self.name}"
+
+
+class RollupDimension(models.TextChoices):
+    STATUS = "status", "Projects by status"
+    MONTH = "month", "Submissions by month"
+    TAG = "tag", "Projects by tag"
+    TECH = "tech", "Projects by technology"
+    USERS = "users", "Users"
+
+
+class AnalyticsRollup(models.Model):
+    """Precomputed platform counter, maintained by apps.projects.rollups."""
+
+    dimension = models.CharField(max_length=10, choices=RollupDimension.choices)
+    key = models.CharField(max_length=100)
+    count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "analytics_rollups"
+        unique_together = ["dimension", "key"]
+        indexes = [models.Index(fields=["dimension", "-count"])]
+
+    def __str__(self) -> str:
+        return f"{self.dimension}:{self.key} = {self.count}"
+
 
 class ProjectView(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -76,7 +191,7 @@ class ProjectView(models.Model):
     )
     viewer_ip = models.GenericIPAddressField()
     user_agent = models.TextField(blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     class Meta:
         db_table = "project_views"
@@ -86,6 +201,26 @@ class ProjectView(models.Model):
         return f"{self.project} - {self.viewer_ip}"
 
 
+class ProjectDailyViews(models.Model):
+    """Views of one project on one day; see apps.projects.view_counters."""
+
+    project = models.ForeignKey(
+        Project,
+        on_delete=models.CASCADE,
+        related_name="daily_views",
+    )
+    date = models.DateField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = "project_daily_views"
+        unique_together = ["project", "date"]
+        indexes = [models.Index(fields=["date"])]
+
+    def __str__(self) -> str:
+        return f"{self.project} - {self.date}: {self.count}"
+
+
 class UploadStatus(models.TextChoices):
     PENDING = "pending", "Pending Upload"
     UPLOADED = "uploaded", "Uploaded"
@@ -139,6 +274,38 @@ class ProjectImage(models.Model):
         return f"{settings.S3_PUBLIC_URL_BASE}/{self.storage_key}"
 
 
+# Attribute that prefetch_uploaded_images() stores the prefetched list on
+UPLOADED_IMAGES_ATTR = "uploaded_images"
+
+
+def prefetch_uploaded_images() -> models.Prefetch:
+    """Prefetch a project's uploaded images onto `UPLOADED_IMAGES_ATTR`."""
+    return models.Prefetch(
+        "images",
+        queryset=ProjectImage.objects.filter(upload_status=UploadStatus.UPLOADED),
+        to_attr=UPLOADED_IMAGES_ATTR,
+    )
+
+
+def uploaded_images_of(project: "Project") -> list[ProjectImage]:
+    """Uploaded images in display order, prefetched when available."""
+    images = getattr(project, UPLOADED_IMAGES_ATTR, None)
+    if images is not None:
+        return images
+    return list(project.images.filter(upload_status=UploadStatus.UPLOADED))
+
+
+def select_main_image(images: Iterable[ProjectImage]) -> ProjectImage | None:
+    """Pick the image flagged as main, falling back to the first one."""
+    first = None
+    for image in images:
+        if image.is_main:
+            return image
+        if first is None:
+            first = image
+    return first
+
+
 class Competition(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     name = models.CharField(max_length=100, db_index=True)
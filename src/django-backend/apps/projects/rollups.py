@@ -0,0 +1,253 @@
+"""Materialized counters behind the admin analytics endpoint.
+
+`AnalyticsRollup` holds one row per (dimension, key): projects per status,
+submissions per month, projects per tag (keyed by tag id) and per normalized
+technology, plus the user total. Signal handlers in apps.projects.signals
+apply deltas as projects, tags and users change; `rebuild_rollups()` (the
+rebuild_analytics_rollups command) recomputes everything from scratch and
+corrects any drift, e.g. after bulk ``QuerySet.update()`` calls that bypass
+signals.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from apps.tags.models import Tag
+
+from .models import AnalyticsRollup, Project, ProjectStatus, RollupDimension
+from .tech_stack import TECH_WHITESPACE, normalize_tech_stack
+
+User = get_user_model()
+
+USERS_TOTAL_KEY = "total"
+
+# Rows per round trip when the tech stack has to be tallied in Python
+TECH_STACK_CHUNK_SIZE = 2000
+
+# Same normalization as apps.projects.tech_stack.normalize_tech, counted once
+# per project; the parameter is TECH_WHITESPACE
+TECH_STACK_COUNTS_SQL = """
+SELECT name, COUNT(DISTINCT project_id)
+FROM (
+    SELECT
+        p.id AS project_id,
+        left(lower(btrim(item, %s)), 100) AS name
+    FROM projects p, jsonb_array_elements_text(
+        CASE WHEN jsonb_typeof(p.tech_stack) = 'array'
+        THEN p.tech_stack ELSE '[]'::jsonb END
+    ) AS item
+) items
+WHERE name <> ''
+GROUP BY name
+"""
+
+# Project fields whose changes move rollup counters
+TRACKED_FIELDS = ("status", "submission_month", "tech_stack")
+
+Deltas = Counter[tuple[str, str]]
+
+
+def is_built() -> bool:
+    # rebuild_rollups() always writes the user total, even when it is zero
+    return AnalyticsRollup.objects.filter(
+        dimension=RollupDimension.USERS,
+        key=USERS_TOTAL_KEY,
+    ).exists()
+
+
+def project_counters(state: dict[str, Any]) -> Deltas:
+    """The +1 counters a project with the given field values contributes."""
+    counters: Deltas = Counter()
+    counters[RollupDimension.STATUS, state["status"]] += 1
+    if state["submission_month"]:
+        counters[RollupDimension.MONTH, state["submission_month"]] += 1
+    for name in normalize_tech_stack(state["tech_stack"] or []):
+        counters[RollupDimension.TECH, name] += 1
+    return counters
+
+
+def project_state(project: Project) -> dict[str, Any]:
+    return {field: getattr(project, field) for field in TRACKED_FIELDS}
+
+
+def apply_deltas(deltas: Deltas) -> None:
+    """Add each delta to its counter, creating missing rows once built."""
+    missing = {
+        counter: delta
+        for counter, delta in deltas.items()
+        if delta and not _add(*counter, delta) and delta > 0
+    }
+
+    # Before the first rebuild there is nothing to keep in step; the rebuild
+    # will count these changes anyway
+    if not missing or not is_built():
+        return
+    # Create at zero and add afterwards, so a row another request created in
+    # the meantime still receives this delta
+    AnalyticsRollup.objects.bulk_create(
+        [AnalyticsRollup(dimension=dimension, key=key) for dimension, key in missing],
+        ignore_conflicts=True,
+    )
+    for (dimension, key), delta in missing.items():
+        _add(dimension, key, delta)
+
+
+def _add(dimension: str, key: str, delta: int) -> bool:
+    return bool(
+        AnalyticsRollup.objects.filter(dimension=dimension, key=key).update(
+            count=F("count") + delta,
+            updated_at=timezone.now(),
+        ),
+    )
+
+
+def apply_tag_deltas(tag_ids: Iterable[Any], delta: int) -> None:
+    apply_deltas(Counter({(RollupDimension.TAG, str(pk)): delta for pk in tag_ids}))
+
+
+def rebuild_status_counts() -> None:
+    """Recount projects per status; cheap, for callers that bulk-update status."""
+    counts = dict(
+        Project.objects.order_by().values_list("status").annotate(count=Count("id")),
+    )
+    with transaction.atomic():
+        for status in ProjectStatus.values:
+            AnalyticsRollup.objects.update_or_create(
+                dimension=RollupDimension.STATUS,
+                key=status,
+                defaults={"count": counts.get(status, 0)},
+            )
+
+
+def tech_stack_counts(chunk_size: int = TECH_STACK_CHUNK_SIZE) -> Counter[str]:
+    """Number of projects using each normalized technology.
+
+    PostgreSQL unnests and groups the JSON arrays itself; elsewhere only the
+    tech_stack column is streamed, `chunk_size` rows at a time, so memory stays
+    flat however many projects there are.
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(TECH_STACK_COUNTS_SQL, [TECH_WHITESPACE])
+            return Counter(dict(cursor.fetchall()))
+
+    counts: Counter[str] = Counter()
+    tech_stacks = (
+        Project.objects.order_by()
+        .values_list("tech_stack", flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+    for tech_stack in tech_stacks:
+        counts.update(normalize_tech_stack(tech_stack or []))
+    return counts
+
+
+def _count_rows(chunk_size: int) -> list[AnalyticsRollup]:
+    rows = [
+        AnalyticsRollup(
+            dimension=RollupDimension.USERS,
+            key=USERS_TOTAL_KEY,
+            count=User.objects.count(),
+        ),
+    ]
+
+    projects = Project.objects.order_by()
+    by_status = dict(
+        projects.values_list("status").annotate(count=Count("id")),
+    )
+    rows += [
+        AnalyticsRollup(
+            dimension=RollupDimension.STATUS,
+            key=status,
+            count=by_status.get(status, 0),
+        )
+        for status in ProjectStatus.values
+    ]
+    rows += [
+        AnalyticsRollup(dimension=RollupDimension.MONTH, key=month, count=count)
+        for month, count in projects.exclude(submission_month="")
+        .values_list("submission_month")
+        .annotate(count=Count("id"))
+    ]
+    rows += [
+        AnalyticsRollup(dimension=RollupDimension.TAG, key=str(tag_id), count=count)
+        for tag_id, count in Project.tags.through.objects.order_by()
+        .values_list("tag_id")
+        .annotate(count=Count("id"))
+    ]
+
+    rows += [
+        AnalyticsRollup(dimension=RollupDimension.TECH, key=name, count=count)
+        for name, count in tech_stack_counts(chunk_size).items()
+    ]
+    return rows
+
+
+def rebuild_rollups(chunk_size: int = TECH_STACK_CHUNK_SIZE) -> int:
+    """Replace every rollup row with freshly computed counts."""
+    rows = _count_rows(chunk_size)
+    with transaction.atomic():
+        AnalyticsRollup.objects.all().delete()
+        AnalyticsRollup.objects.bulk_create(rows)
+    return len(rows)
+
+
+def read_analytics(limit: int = 10) -> dict[str, Any]:
+    """Platform totals and top lists, read from the rollup table."""
+    if not is_built():
+        rebuild_rollups()
+
+    totals = {
+        (row.dimension, row.key): row.count
+        for row in AnalyticsRollup.objects.filter(
+            dimension__in=[
+                RollupDimension.STATUS,
+                RollupDimension.MONTH,
+                RollupDimension.USERS,
+            ],
+        )
+    }
+    by_status = {
+        key: count
+        for (dimension, key), count in totals.items()
+        if dimension == RollupDimension.STATUS
+    }
+
+    def top(dimension: str) -> list[tuple[str, int]]:
+        return list(
+            AnalyticsRollup.objects.filter(dimension=dimension, count__gt=0)
+            .order_by("-count", "key")
+            .values_list("key", "count")[:limit],
+        )
+
+    top_tags = top(RollupDimension.TAG)
+    tags = {
+        str(tag.pk): tag.name
+        for tag in Tag.objects.filter(pk__in=[key for key, _ in top_tags])
+    }
+
+    return {
+        "total_projects": sum(by_status.values()),
+        "pending_projects": by_status.get(ProjectStatus.PENDING, 0),
+        "approved_projects": by_status.get(ProjectStatus.APPROVED, 0),
+        "total_users": totals.get((RollupDimension.USERS, USERS_TOTAL_KEY), 0),
+        "monthly_submissions": {
+            key: count
+            for (dimension, key), count in sorted(totals.items())
+            if dimension == RollupDimension.MONTH and count > 0
+        },
+        "top_tags": [
+            {"name": tags[key], "count": count}
+            for key, count in top_tags
+            if key in tags
+        ],
+        "top_tech_stack": [
+            {"name": name, "count": count} for name, count in top(RollupDimension.TECH)
+        ],
+    }
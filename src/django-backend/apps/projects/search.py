@@ -0,0 +1,109 @@
+"""Full-text search over projects.
+
+On PostgreSQL, `Project.search_vector` holds a weighted tsvector built from the
+title, descriptions and tag names. It is GIN indexed, as are trigram indexes on
+the title and description for partial-word matches. Other databases (SQLite in
+development) fall back to ranked ``icontains`` matching.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import (
+    Case,
+    Exists,
+    F,
+    IntegerField,
+    OuterRef,
+    Q,
+    QuerySet,
+    Subquery,
+    Value,
+    When,
+)
+
+from apps.tags.models import Tag
+
+from .models import Project
+
+# Language-agnostic config; project text is a mix of Icelandic and English
+SEARCH_CONFIG = "simple"
+
+
+def _uses_postgres() -> bool:
+    return connection.vendor == "postgresql"
+
+
+def _tag_names() -> Subquery:
+    return Subquery(
+        Tag.objects.filter(projects=OuterRef("pk"))
+        .order_by()
+        .values("projects")
+        .annotate(names=StringAgg("name", delimiter=" "))
+        .values("names"),
+    )
+
+
+def build_search_vector() -> SearchVector:
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector(_tag_names(), weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("long_description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def update_search_vectors(project_ids: Iterable[Any] | None = None) -> int:
+    """Recompute the search vector for the given projects (all when None)."""
+    if not _uses_postgres():
+        return 0
+    queryset = Project.objects.all()
+    if project_ids is not None:
+        queryset = queryset.filter(pk__in=list(project_ids))
+    return queryset.update(search_vector=build_search_vector())
+
+
+def search_projects(queryset: QuerySet[Project], term: str) -> QuerySet[Project]:
+    """Filter `queryset` to projects matching `term`, annotated with `search_rank`.
+
+    Callers order by ``-search_rank`` to get the best matches first.
+    """
+    term = term.strip()
+    if _uses_postgres():
+        query = SearchQuery(term, search_type="websearch", config=SEARCH_CONFIG)
+        # Trigram-indexed icontains catches short and partial words that the
+        # full-text query misses
+        return queryset.filter(
+            Q(search_vector=query)
+            | Q(title__icontains=term)
+            | Q(description__icontains=term),
+        ).annotate(
+            search_rank=SearchRank(F("search_vector"), query)
+            + TrigramWordSimilarity(term, "title"),
+        )
+
+    tag_match = Exists(
+        Tag.objects.filter(projects=OuterRef("pk"), name__icontains=term),
+    )
+    return queryset.filter(
+        Q(title__icontains=term)
+        | Q(description__icontains=term)
+        | Q(long_description__icontains=term)
+        | tag_match,
+    ).annotate(
+        search_rank=Case(
+            When(title__icontains=term, then=Value(3)),
+            When(tag_match, then=Value(2)),
+            When(description__icontains=term, then=Value(1)),
+            default=Value(0),
+            output_field=IntegerField(),
+        ),
+    )
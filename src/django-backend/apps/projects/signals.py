@@ -0,0 +1,206 @@
+from collections import Counter
+from typing import Any
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
+from django.dispatch import receiver
+
+from apps.tags.models import Tag
+
+from .models import AnalyticsRollup, Project, ProjectImage, RollupDimension
+from .rollups import (
+    TRACKED_FIELDS,
+    USERS_TOTAL_KEY,
+    apply_deltas,
+    apply_tag_deltas,
+    project_counters,
+    project_state,
+)
+from .search import update_search_vectors
+from .tech_stack import sync_tech_stack_items
+
+
+@receiver(post_save, sender=Project)
+def refresh_project_search_vector(
+    sender: type[Project],
+    instance: Project,
+    **kwargs: Any,
+) -> None:
+    update_search_vectors([instance.pk])
+
+
+@receiver(post_save, sender=Project)
+def refresh_project_tech_stack_items(
+    sender: type[Project],
+    instance: Project,
+    **kwargs: Any,
+) -> None:
+    sync_tech_stack_items(instance)
+
+
+@receiver(post_save, sender=ProjectImage)
+@receiver(post_delete, sender=ProjectImage)
+def refresh_project_main_image(
+    sender: type[ProjectImage],
+    instance: ProjectImage,
+    **kwargs: Any,
+) -> None:
+    # Covers every writer (API, admin, inline deletes), promoting a fallback
+    # image when the main one is deleted or unflagged. The project may be
+    # gone already when its images are deleted with it.
+    project = Project.objects.filter(pk=instance.project_id).first()
+    if project is not None:
+        project.refresh_main_image()
+
+
+@receiver(m2m_changed, sender=Project.tags.through)
+def refresh_search_vector_on_tag_change(
+    sender: type,
+    instance: Project | Tag,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    if action not in {"post_add", "post_remove", "post_clear"}:
+        return
+    if not reverse:
+        update_search_vectors([instance.pk])
+    elif pk_set:
+        update_search_vectors(pk_set)
+    else:
+        # Clearing a tag's projects; the affected ids are no longer knowable
+        update_search_vectors()
+
+
+@receiver(post_save, sender=Tag)
+def refresh_search_vector_on_tag_rename(
+    sender: type[Tag],
+    instance: Tag,
+    created: bool,  # noqa: FBT001
+    **kwargs: Any,
+) -> None:
+    if not created:
+        update_search_vectors(instance.projects.values_list("pk", flat=True))
+
+
+@receiver(pre_save, sender=Project)
+def remember_rollup_state(
+    sender: type[Project],
+    instance: Project,
+    update_fields: frozenset[str] | None,
+    **kwargs: Any,
+) -> None:
+    if instance._state.adding:  # noqa: SLF001
+        return
+    if update_fields is not None and not update_fields & set(TRACKED_FIELDS):
+        return
+    instance.__dict__["_rollup_previous"] = (
+        Project.objects.filter(pk=instance.pk).values(*TRACKED_FIELDS).first()
+    )
+
+
+@receiver(post_save, sender=Project)
+def update_rollups_on_save(
+    sender: type[Project],
+    instance: Project,
+    created: bool,  # noqa: FBT001
+    **kwargs: Any,
+) -> None:
+    previous = instance.__dict__.pop("_rollup_previous", None)
+    if not created and previous is None:
+        return
+    deltas = project_counters(project_state(instance))
+    if previous is not None:
+        deltas.subtract(project_counters(previous))
+    apply_deltas(deltas)
+
+
+@receiver(pre_delete, sender=Project)
+def remember_rollup_tags(
+    sender: type[Project],
+    instance: Project,
+    **kwargs: Any,
+) -> None:
+    # The tag links are cascade-deleted without m2m_changed signals
+    instance.__dict__["_rollup_tag_ids"] = list(
+        instance.tags.values_list("pk", flat=True)
+    )
+
+
+@receiver(post_delete, sender=Project)
+def update_rollups_on_delete(
+    sender: type[Project],
+    instance: Project,
+    **kwargs: Any,
+) -> None:
+    counters = project_counters(project_state(instance))
+    apply_deltas(Counter({counter: -count for counter, count in counters.items()}))
+    apply_tag_deltas(instance.__dict__.pop("_rollup_tag_ids", []), -1)
+
+
+@receiver(m2m_changed, sender=Project.tags.through)
+def update_tag_rollups(
+    sender: type,
+    instance: Project | Tag,
+    action: str,
+    reverse: bool,  # noqa: FBT001
+    pk_set: set[Any] | None,
+    **kwargs: Any,
+) -> None:
+    related = instance.projects if reverse else instance.tags
+    if action == "pre_clear":
+        instance.__dict__["_rollup_cleared"] = list(
+            related.values_list("pk", flat=True)
+        )
+        return
+    # remove() passes the requested pks, linked or not (add() filters them)
+    if action == "pre_remove":
+        instance.__dict__["_rollup_removed"] = list(
+            related.filter(pk__in=pk_set or []).values_list("pk", flat=True)
+        )
+        return
+    if action == "post_clear":
+        pk_set = set(instance.__dict__.pop("_rollup_cleared", []))
+    elif action == "post_remove":
+        pk_set = set(instance.__dict__.pop("_rollup_removed", []))
+    elif action != "post_add":
+        return
+    if not pk_set:
+        return
+
+    delta = -1 if action in {"post_remove", "post_clear"} else 1
+    if reverse:
+        apply_tag_deltas([instance.pk], delta * len(pk_set))
+    else:
+        apply_tag_deltas(pk_set, delta)
+
+
+@receiver(post_delete, sender=Tag)
+def drop_tag_rollup(sender: type[Tag], instance: Tag, **kwargs: Any) -> None:
+    AnalyticsRollup.objects.filter(
+        dimension=RollupDimension.TAG,
+        key=str(instance.pk),
+    ).delete()
+
+
+@receiver(post_save, sender=get_user_model())
+def count_new_user(
+    sender: type,
+    instance: Any,
+    created: bool,  # noqa: FBT001
+    **kwargs: Any,
+) -> None:
+    if created:
+        apply_deltas(Counter({(RollupDimension.USERS, USERS_TOTAL_KEY): 1}))
+
+
+@receiver(post_delete, sender=get_user_model())
+def count_deleted_user(sender: type, instance: Any, **kwargs: Any) -> None:
+    apply_deltas(Counter({(RollupDimension.USERS, USERS_TOTAL_KEY): -1}))
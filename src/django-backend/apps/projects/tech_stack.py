@@ -0,0 +1,74 @@
+"""Normalized tech-stack filtering.
+
+`Project.tech_stack` stays the source of truth for the API; `TechStackItem`
+mirrors it as one lowercased row per technology so filters are exact,
+case-insensitive and served by the (name, project) index.
+"""
+
+from collections.abc import Iterable
+
+from django.db.models import Exists, OuterRef, QuerySet
+
+from .models import Project, TechStackItem
+
+# TechStackItem.name max_length
+MAX_TECH_NAME_LENGTH = 100
+
+# Every character str.strip() removes by default, spelled out so SQL can trim
+# exactly the same set (see apps.projects.rollups.TECH_STACK_COUNTS_SQL)
+TECH_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003"
+    "\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def normalize_tech(name: str) -> str:
+    return name.strip(TECH_WHITESPACE).lower()[:MAX_TECH_NAME_LENGTH]
+
+
+def normalize_tech_stack(names: Iterable[str]) -> set[str]:
+    return {
+        normalize_tech(name) for name in names if name and name.strip(TECH_WHITESPACE)
+    }
+
+
+def sync_tech_stack_items(project: Project) -> None:
+    """Bring the project's TechStackItem rows in line with its tech_stack."""
+    wanted = normalize_tech_stack(project.tech_stack or [])
+    existing = set(project.tech_stack_items.values_list("name", flat=True))
+
+    stale = existing - wanted
+    if stale:
+        project.tech_stack_items.filter(name__in=stale).delete()
+
+    missing = wanted - existing
+    if missing:
+        TechStackItem.objects.bulk_create(
+            [TechStackItem(project=project, name=name) for name in missing],
+            ignore_conflicts=True,
+        )
+
+
+def filter_by_tech_stack(
+    queryset: QuerySet[Project],
+    terms: Iterable[str],
+    *,
+    match_all: bool = True,
+) -> QuerySet[Project]:
+    """Keep projects using all (or, with match_all=False, any) of `terms`."""
+    names = normalize_tech_stack(terms)
+    if not names:
+        return queryset
+
+    if not match_all:
+        return queryset.filter(
+            Exists(
+                TechStackItem.objects.filter(project=OuterRef("pk"), name__in=names),
+            ),
+        )
+
+    for name in names:
+        queryset = queryset.filter(
+            Exists(TechStackItem.objects.filter(project=OuterRef("pk"), name=name)),
+        )
+    return queryset
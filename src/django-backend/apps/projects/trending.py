@@ -0,0 +1,88 @@
+"""Time-decayed trending scores for approved projects.
+
+A project's score adds up three signals, each halving in weight every
+HALF_LIFE_DAYS days:
+
+* views from the daily counters over the last WINDOW_DAYS days,
+* reviewer rankings (1 / position per ranking, weighted by RANKING_WEIGHT),
+  aged from when the ranking was last changed,
+* a RECENCY_WEIGHT boost for being approved recently.
+
+`refresh_trending_scores()` (the refresh_trending command, run on a schedule)
+stores the result in `Project.trending_score`, so the trending endpoint is an
+index-ordered read.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Project, ProjectDailyViews, ProjectRanking, ProjectStatus
+
+HALF_LIFE_DAYS = 7
+WINDOW_DAYS = 30
+RANKING_WEIGHT = 10.0
+RECENCY_WEIGHT = 5.0
+
+# Rows written per UPDATE batch
+BATCH_SIZE = 500
+
+
+def decay(age_days: float) -> float:
+    return 0.5 ** (max(age_days, 0) / HALF_LIFE_DAYS)
+
+
+def _age_days(moment: date | datetime, now: datetime) -> float:
+    if isinstance(moment, datetime):
+        return (now - moment).total_seconds() / 86400
+    return (timezone.localdate(now) - moment).days
+
+
+def compute_trending_scores(now: datetime | None = None) -> dict[str, float]:
+    """Scores of approved projects with any signal; all others score 0."""
+    now = now or timezone.now()
+    since = timezone.localdate(now) - timedelta(days=WINDOW_DAYS - 1)
+    scores: dict[str, float] = defaultdict(float)
+
+    approved = Project.objects.filter(
+        status=ProjectStatus.APPROVED,
+        approved_at__isnull=False,
+    ).values_list("id", "approved_at")
+    for project_id, approved_at in approved.iterator():
+        scores[str(project_id)] += RECENCY_WEIGHT * decay(_age_days(approved_at, now))
+
+    views = ProjectDailyViews.objects.filter(
+        project__status=ProjectStatus.APPROVED,
+        date__gte=since,
+    ).values_list("project_id", "date", "count")
+    for project_id, day, count in views.iterator():
+        scores[str(project_id)] += count * decay(_age_days(day, now))
+
+    rankings = ProjectRanking.objects.filter(
+        project__status=ProjectStatus.APPROVED,
+    ).values_list("project_id", "position", "updated_at")
+    for project_id, position, updated_at in rankings.iterator():
+        scores[str(project_id)] += (
+            RANKING_WEIGHT / max(position, 1) * decay(_age_days(updated_at, now))
+        )
+
+    return dict(scores)
+
+
+def refresh_trending_scores(now: datetime | None = None) -> int:
+    """Store fresh scores, resetting projects that left the approved set."""
+    scores = compute_trending_scores(now)
+
+    changed = []
+    current = Project.objects.filter(
+        Q(status=ProjectStatus.APPROVED) | ~Q(trending_score=0),
+    ).values_list("id", "trending_score")
+    for project_id, score in current.iterator():
+        new_score = round(scores.get(str(project_id), 0.0), 6)
+        if new_score != score:
+            changed.append(Project(id=project_id, trending_score=new_score))
+
+    Project.objects.bulk_update(changed, ["trending_score"], batch_size=BATCH_SIZE)
+    return len(changed)
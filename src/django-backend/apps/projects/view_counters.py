@@ -0,0 +1,76 @@
+"""Per-project, per-day view counters.
+
+Each project gets one `ProjectDailyViews` row per day, so concurrent writers
+only ever contend on today's row for one project. The view buffer adds its
+hit counts with ``F()`` updates when it flushes. `refresh_monthly_visitors()`
+(the refresh_monthly_visitors command, run on a schedule) rolls the last
+MONTHLY_VISITORS_DAYS days up into `Project.monthly_visitors`, which the
+public API exposes and trending sorts by.
+"""
+
+from collections.abc import Mapping
+from datetime import date, timedelta
+from typing import Any
+
+from django.db.models import F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from .models import Project, ProjectDailyViews
+
+MONTHLY_VISITORS_DAYS = 30
+
+
+def _add(project_id: Any, day: date, hits: int) -> bool:
+    return bool(
+        ProjectDailyViews.objects.filter(project_id=project_id, date=day).update(
+            count=F("count") + hits,
+        ),
+    )
+
+
+def add_daily_views(hits: Mapping[Any, int], day: date | None = None) -> None:
+    """Add `hits` (project id -> views) to the counters for `day` (today)."""
+    day = day or timezone.localdate()
+    missing = {
+        project_id: count
+        for project_id, count in hits.items()
+        if count and not _add(project_id, day, count)
+    }
+    if not missing:
+        return
+    # Create at zero and add afterwards, so a row another worker created in the
+    # meantime still receives these hits
+    ProjectDailyViews.objects.bulk_create(
+        [ProjectDailyViews(project_id=project_id, date=day) for project_id in missing],
+        ignore_conflicts=True,
+    )
+    for project_id, count in missing.items():
+        _add(project_id, day, count)
+
+
+def views_since(since: date | None = None) -> Coalesce:
+    """Per-project view total (from `since` onwards), for annotating projects."""
+    counters = ProjectDailyViews.objects.filter(project=OuterRef("pk"))
+    if since is not None:
+        counters = counters.filter(date__gte=since)
+    return Coalesce(
+        Subquery(
+            counters.order_by()
+            .values("project")
+            .annotate(total=Sum("count"))
+            .values("total"),
+        ),
+        Value(0),
+    )
+
+
+def refresh_monthly_visitors(days: int = MONTHLY_VISITORS_DAYS) -> int:
+    """Recompute monthly_visitors from the counters; returns projects changed."""
+    since = timezone.localdate() - timedelta(days=days - 1)
+    recent = views_since(since)
+    return (
+        Project.objects.annotate(recent=recent)
+        .exclude(monthly_visitors=F("recent"))
+        .update(monthly_visitors=recent, updated_at=timezone.now())
+    )
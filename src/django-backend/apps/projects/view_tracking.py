@@ -0,0 +1,176 @@
+"""Buffered, batched ProjectView ingestion.
+
+Request handlers call `view_buffer.record()`, which only touches an in-memory
+dictionary. A daemon thread per worker process flushes it every
+PROJECT_VIEW_FLUSH_INTERVAL seconds (or as soon as a batch fills) with
+``bulk_create(ignore_conflicts=True)``, so repeat viewers are absorbed by the
+(project, viewer_ip) unique constraint instead of failing a request. Every
+accepted hit, repeat or not, is also added to the per-day counters in
+apps.projects.view_counters. The buffer holds at most PROJECT_VIEW_BUFFER_SIZE
+distinct views; beyond that new views are dropped and counted. Views still
+buffered when a worker is killed are lost, which is acceptable for analytics.
+"""
+
+import atexit
+import ipaddress
+import logging
+import os
+import threading
+from collections import Counter
+from typing import Any
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections
+
+from .models import Project, ProjectView
+from .view_counters import add_daily_views
+
+logger = logging.getLogger(__name__)
+
+# User agents are stored for analytics only; don't buffer arbitrarily long ones
+MAX_USER_AGENT_LENGTH = 512
+
+
+class ViewBuffer:
+    """Thread-safe, bounded buffer of views waiting to be written."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        # (project_id, viewer_ip) -> user agent; repeats collapse in memory
+        self._pending: dict[tuple[str, str], str] = {}
+        # project_id -> hits, including repeats
+        self._hits: Counter[str] = Counter()
+        self._counts = {
+            "recorded": 0,
+            "dropped": 0,
+            "invalid": 0,
+            "written": 0,
+            "failed": 0,
+        }
+        self._flusher: threading.Thread | None = None
+        self._flusher_pid: int | None = None
+        self._atexit_registered = False
+
+    def record(self, project_id: Any, viewer_ip: str, user_agent: str) -> bool:
+        """Queue a view; returns False when it was dropped or unusable."""
+        try:
+            # A malformed forwarded address would fail the whole batch insert
+            viewer_ip = str(ipaddress.ip_address(viewer_ip))
+        except ValueError:
+            with self._lock:
+                self._counts["invalid"] += 1
+            return False
+
+        key = (str(project_id), viewer_ip)
+        with self._lock:
+            if key not in self._pending:
+                if len(self._pending) >= settings.PROJECT_VIEW_BUFFER_SIZE:
+                    self._counts["dropped"] += 1
+                    return False
+                self._pending[key] = user_agent[:MAX_USER_AGENT_LENGTH]
+            self._hits[key[0]] += 1
+            self._counts["recorded"] += 1
+            batch_ready = len(self._pending) >= settings.PROJECT_VIEW_BATCH_SIZE
+
+        self._ensure_flusher()
+        if batch_ready:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        """Write everything buffered so far; returns the number of rows sent."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            hits, self._hits = self._hits, Counter()
+        if not pending:
+            return 0
+
+        # Projects deleted since the view was recorded would violate the FK
+        existing = {
+            str(pk)
+            for pk in Project.objects.filter(pk__in=list(hits)).values_list(
+                "pk",
+                flat=True,
+            )
+        }
+        views = [
+            ProjectView(project_id=project_id, viewer_ip=ip, user_agent=user_agent)
+            for (project_id, ip), user_agent in pending.items()
+            if project_id in existing
+        ]
+        batch_size = settings.PROJECT_VIEW_BATCH_SIZE
+
+        written = failed = 0
+        for offset in range(0, len(views), batch_size):
+            batch = views[offset : offset + batch_size]
+            try:
+                ProjectView.objects.bulk_create(batch, ignore_conflicts=True)
+            except DatabaseError:
+                logger.exception("Failed to write %d project views", len(batch))
+                failed += len(batch)
+            else:
+                written += len(batch)
+
+        try:
+            add_daily_views(
+                {project_id: hits[project_id] for project_id in existing},
+            )
+        except DatabaseError:
+            logger.exception("Failed to update daily view counters")
+
+        with self._lock:
+            self._counts["written"] += written
+            self._counts["failed"] += failed
+        return written
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._counts, "pending": len(self._pending)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            self._hits.clear()
+            self._counts = dict.fromkeys(self._counts, 0)
+
+    def _ensure_flusher(self) -> None:
+        if settings.PROJECT_VIEW_FLUSH_INTERVAL <= 0:
+            return
+        if self._flusher_running():
+            return
+        with self._lock:
+            if self._flusher_running():
+                return
+            self._flusher = threading.Thread(
+                target=self._run,
+                name="project-view-flusher",
+                daemon=True,
+            )
+            self._flusher_pid = os.getpid()
+            self._flusher.start()
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+
+    def _flusher_running(self) -> bool:
+        # Threads don't survive a fork, so each worker starts its own
+        return (
+            self._flusher_pid == os.getpid()
+            and self._flusher is not None
+            and self._flusher.is_alive()
+        )
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(settings.PROJECT_VIEW_FLUSH_INTERVAL)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Project view flush failed")
+            finally:
+                close_old_connections()
+
+
+view_buffer = ViewBuffer()
@@ -60,7 +60,9 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_verified = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Embedded in access tokens; bumping it revokes every token issued before
+    token_version = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     objects = UserManager()
@@ -71,6 +73,32 @@ class User(AbstractBaseUser, PermissionsMixin):
     class Meta:
         db_table = "users"
 
+    @classmethod
+    def from_db(
+        cls,
+        db: str | None,
+        field_names: Any,
+        values: Any,
+    ) -> "User":
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_token_claims = instance._token_claims()  # noqa: SLF001
+        return instance
+
+    def _token_claims(self) -> tuple[bool, bool]:
+        return (self.is_active, self.is_superuser)
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        # Access tokens carry is_active/is_superuser claims, so changing either
+        # must revoke outstanding tokens
+        loaded = getattr(self, "_loaded_token_claims", None)
+        if loaded is not None and loaded != self._token_claims():
+            self.token_version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "token_version"}
+        super().save(*args, **kwargs)
+        self._loaded_token_claims = self._token_claims()
+
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}".strip()
@@ -0,0 +1 @@
+"""API latency benchmarks (see scripts/benchmark_api.py)."""
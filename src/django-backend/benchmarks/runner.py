@@ -0,0 +1,234 @@
+"""Replay the benchmark scenarios and compare them with a stored baseline.
+
+Requests go through Django's test client in this process, so the numbers
+measure the application (routing, ORM, serialization) without network or
+server overhead. By default one request runs at a time, which gives latency
+without concurrent load. With `concurrency` above one, that many threads
+replay each scenario at once, each with its own client and database
+connection. The timings then include contention for the GIL, connections and
+the database. For load through real HTTP servers, see
+scripts/benchmark_asgi.py.
+
+Each scenario is timed over a number of requests, then replayed once more to
+count its queries and the memory it allocates, since tracing both would
+distort the timings. Response caches are disabled so every request does its
+full work.
+"""
+
+import json
+import resource
+import statistics
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, get_args
+
+from django.db import connection, connections
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from api.auth.jwt import create_access_token
+from apps.projects.view_tracking import view_buffer
+
+from .scenarios import SCENARIOS, Actor, Scenario
+from .seed import Dataset
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+
+# Latency changes smaller than this are treated as noise
+NOISE_FLOOR_MS = 1.0
+
+Results = dict[str, dict[str, Any]]
+
+
+def _client(dataset: Dataset, actor: Actor) -> Client:
+    user_ids = {
+        "member": dataset.member_id,
+        "admin": dataset.admin_id,
+        "reviewer": dataset.reviewer_id,
+    }
+    if actor == "anonymous":
+        return Client()
+    token = create_access_token(user_ids[actor])
+    return Client(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+def _send(client: Client, scenario: Scenario, dataset: Dataset) -> int:
+    url = scenario.url(dataset)
+    if scenario.method == "GET":
+        response = client.get(url, scenario.query(dataset))
+    else:
+        response = client.generic(
+            scenario.method,
+            url,
+            json.dumps(scenario.body or {}),
+            content_type="application/json",
+        )
+    return response.status_code
+
+
+def _percentile(timings: list[float], percent: int) -> float:
+    if len(timings) < 2:  # noqa: PLR2004
+        return timings[0] if timings else 0.0
+    return statistics.quantiles(timings, n=100, method="inclusive")[percent - 1]
+
+
+def _timed(client: Client, scenario: Scenario, dataset: Dataset) -> tuple[float, int]:
+    started = time.perf_counter()
+    status = _send(client, scenario, dataset)
+    return (time.perf_counter() - started) * 1000, status
+
+
+def _replay(
+    scenario: Scenario,
+    dataset: Dataset,
+    *,
+    requests: int,
+    concurrency: int,
+) -> list[tuple[float, int]]:
+    """Send `requests` requests from `concurrency` threads at once."""
+    samples: list[tuple[float, int]] = []
+    lock = threading.Lock()
+    remaining = iter(range(requests))
+
+    def worker() -> None:
+        client = _client(dataset, scenario.actor)
+        try:
+            while True:
+                with lock:
+                    if next(remaining, None) is None:
+                        return
+                sample = _timed(client, scenario, dataset)
+                with lock:
+                    samples.append(sample)
+        finally:
+            # Leftover connections would keep the test database from being
+            # dropped
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return samples
+
+
+def run_scenarios(
+    dataset: Dataset,
+    scenarios: list[Scenario] = SCENARIOS,
+    *,
+    requests: int = 50,
+    warmup: int = 5,
+    concurrency: int = 1,
+) -> Results:
+    """Time each scenario; returns per-scenario latency, queries and memory."""
+    clients = {actor: _client(dataset, actor) for actor in get_args(Actor)}
+    results: Results = {}
+    with override_settings(
+        PUBLIC_API_CACHE_TIMEOUT=0,
+        ANALYTICS_CACHE_TIMEOUT=0,
+        PROJECT_VIEW_FLUSH_INTERVAL=0,
+    ):
+        for scenario in scenarios:
+            client = clients[scenario.actor]
+            for _ in range(warmup):
+                _send(client, scenario, dataset)
+
+            if concurrency > 1:
+                samples = _replay(
+                    scenario,
+                    dataset,
+                    requests=requests,
+                    concurrency=concurrency,
+                )
+            else:
+                samples = [_timed(client, scenario, dataset) for _ in range(requests)]
+            timings = [elapsed for elapsed, _ in samples]
+            errors = sum(status >= 400 for _, status in samples)  # noqa: PLR2004
+
+            tracemalloc.start()
+            with CaptureQueriesContext(connection) as queries:
+                _send(client, scenario, dataset)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            results[scenario.name] = {
+                "p50_ms": round(_percentile(timings, 50), 3),
+                "p95_ms": round(_percentile(timings, 95), 3),
+                "p99_ms": round(_percentile(timings, 99), 3),
+                "queries": len(queries),
+                "peak_alloc_kb": round(peak / 1024, 1),
+                "errors": errors,
+            }
+    view_buffer.reset()
+    return results
+
+
+def worker_peak_rss_mb() -> float:
+    """Peak resident memory of this process (the benchmark's one worker)."""
+    # ru_maxrss is in kilobytes on Linux
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def baseline_path(label: str) -> Path:
+    return BASELINE_DIR / f"{label}.json"
+
+
+def load_baseline(label: str) -> Results | None:
+    path = baseline_path(label)
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())["scenarios"]
+
+
+def save_baseline(label: str, results: Results, meta: dict[str, Any]) -> Path:
+    path = baseline_path(label)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {**meta, "scenarios": results}
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+    return path
+
+
+def regressions(
+    results: Results,
+    baseline: Results,
+    *,
+    tolerance: float,
+) -> list[str]:
+    """Describe each scenario that got slower or runs more queries."""
+    found = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["queries"] > before["queries"]:
+            found.append(
+                f"{name}: {before['queries']} -> {result['queries']} queries",
+            )
+        slower = result["p95_ms"] - before["p95_ms"]
+        if slower > NOISE_FLOOR_MS and slower > before["p95_ms"] * tolerance:
+            found.append(
+                f"{name}: p95 {before['p95_ms']:.1f} -> {result['p95_ms']:.1f} ms",
+            )
+    return found
+
+
+def format_table(results: Results, baseline: Results | None = None) -> str:
+    header = (
+        f"{'scenario':<30} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+        f"{'queries':>7} {'alloc KB':>9} {'errors':>6}"
+    )
+    lines = [header]
+    for name, result in results.items():
+        line = (
+            f"{name:<30} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+            f"{result['p99_ms']:>8.1f} {result['queries']:>7} "
+            f"{result['peak_alloc_kb']:>9.1f} {result['errors']:>6}"
+        )
+        before = (baseline or {}).get(name)
+        if before:
+            line += f"  (p95 was {before['p95_ms']:.1f}, queries {before['queries']})"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,113 @@
+"""The requests a benchmark run replays, covering every router in api.main.
+
+Paths are templates filled from the seeded `Dataset`. Writes that would
+change what later requests see (approving, deleting, uploading) are left
+out so every run measures the same data.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from .seed import MEMBER_EMAIL, PASSWORD, Dataset
+
+Actor = Literal["anonymous", "member", "admin", "reviewer"]
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    path: str
+    method: str = "GET"
+    actor: Actor = "anonymous"
+    params: dict[str, Any] = field(default_factory=dict)
+    body: dict[str, Any] | None = None
+
+    def url(self, dataset: Dataset) -> str:
+        return self.path.format_map(vars(dataset))
+
+    def query(self, dataset: Dataset) -> dict[str, Any]:
+        return {
+            key: value.format_map(vars(dataset)) if isinstance(value, str) else value
+            for key, value in self.params.items()
+        }
+
+
+SCENARIOS = [
+    Scenario("root", "/api/"),
+    Scenario("health", "/api/health"),
+    # auth
+    Scenario(
+        "auth.login",
+        "/api/auth/login",
+        method="POST",
+        body={"email": MEMBER_EMAIL, "password": PASSWORD},
+    ),
+    Scenario("auth.me", "/api/auth/me", actor="member"),
+    # projects
+    Scenario("projects.list", "/api/projects"),
+    Scenario(
+        "projects.list_deep_page",
+        "/api/projects",
+        params={"page": 200, "count": "capped"},
+    ),
+    Scenario(
+        "projects.list_cursor",
+        "/api/projects",
+        params={"pagination": "cursor"},
+    ),
+    Scenario(
+        "projects.list_by_visitors",
+        "/api/projects",
+        params={"sort_by": "monthly_visitors"},
+    ),
+    Scenario("projects.list_by_tag", "/api/projects", params={"tags": "{tag_slug}"}),
+    Scenario(
+        "projects.list_by_tech",
+        "/api/projects",
+        params={"tech_stack": "{tech}"},
+    ),
+    Scenario("projects.search", "/api/projects", params={"search": "app"}),
+    Scenario("projects.featured", "/api/projects/featured"),
+    Scenario("projects.trending", "/api/projects/trending"),
+    Scenario("projects.detail", "/api/projects/{project_id}"),
+    # my/projects
+    Scenario("my_projects.list", "/api/my/projects", actor="member"),
+    Scenario(
+        "my_projects.detail",
+        "/api/my/projects/{own_project_id}",
+        actor="member",
+    ),
+    # tags
+    Scenario("tags.list", "/api/tags"),
+    # admin
+    Scenario("admin.projects", "/api/admin/projects", actor="admin"),
+    Scenario(
+        "admin.projects_pending",
+        "/api/admin/projects",
+        actor="admin",
+        params={"status_filter": "pending"},
+    ),
+    Scenario(
+        "admin.project_detail",
+        "/api/admin/projects/{project_id}",
+        actor="admin",
+    ),
+    Scenario("admin.users", "/api/admin/users", actor="admin"),
+    Scenario("admin.analytics", "/api/admin/analytics", actor="admin"),
+    Scenario(
+        "admin.analytics_timeseries",
+        "/api/admin/analytics/timeseries",
+        actor="admin",
+        params={"interval": "week"},
+    ),
+    # competitions
+    Scenario("competitions.list", "/api/competitions"),
+    Scenario("competitions.detail", "/api/competitions/{competition_id}"),
+    # my-review
+    Scenario("my_review.list", "/api/my-review/competitions", actor="reviewer"),
+    Scenario(
+        "my_review.detail",
+        "/api/my-review/competitions/{competition_id}",
+        actor="reviewer",
+    ),
+]
@@ -0,0 +1,295 @@
+"""Seed a benchmark database with realistic volumes.
+
+Rows are built with the test factories (so they look like the fixtures the
+functional tests use) and written with bulk_create in batches, which keeps a
+500k-project seed to minutes. Derived data that signals would normally
+maintain (tech stack rows, main images, search vectors, monthly visitors,
+trending scores, analytics rollups) is rebuilt once at the end.
+"""
+
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.projects.models import (
+    Competition,
+    CompetitionReviewer,
+    Project,
+    ProjectDailyViews,
+    ProjectImage,
+    ProjectRanking,
+    ProjectStatus,
+    TechStackItem,
+)
+from apps.projects.rollups import rebuild_rollups
+from apps.projects.search import update_search_vectors
+from apps.projects.tech_stack import normalize_tech_stack
+from apps.projects.trending import refresh_trending_scores
+from apps.projects.view_counters import refresh_monthly_visitors
+from apps.tags.models import Tag
+from tests.factories import (
+    CompetitionFactory,
+    ProjectFactory,
+    ProjectImageFactory,
+    TagFactory,
+    UserFactory,
+)
+
+User = get_user_model()
+
+PASSWORD = "benchmark-password"  # noqa: S105
+ADMIN_EMAIL = "bench-admin@example.com"
+MEMBER_EMAIL = "bench-member@example.com"
+REVIEWER_EMAIL = "bench-reviewer@example.com"
+
+TECHNOLOGIES = [
+    "Django", "React", "Vue", "Svelte", "Next.js", "Rails", "Laravel", "Go",
+    "Rust", "Elixir", "Kotlin", "Swift", "Flutter", "PostgreSQL", "Redis",
+    "Docker", "Kubernetes", "AWS", "GCP", "Tailwind", "TypeScript", "Node.js",
+]  # fmt: skip
+
+TAG_COUNT = 60
+PROJECTS_PER_USER = 4
+PROJECTS_PER_COMPETITION = 100
+RANKED_PER_COMPETITION = 10
+MAX_TAGS_PER_PROJECT = 4
+MAX_IMAGES_PER_PROJECT = 3
+# Approved projects are viewed on up to MAX_VIEW_DAYS of the last VIEW_DAYS
+VIEW_DAYS = 90
+MAX_VIEW_DAYS = 20
+MAX_DAILY_VIEWS = 300
+BATCH_SIZE = 2000
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Identifiers the benchmark scenarios fill into their paths."""
+
+    projects: int
+    admin_id: str
+    member_id: str
+    reviewer_id: str
+    project_id: str
+    own_project_id: str
+    competition_id: str
+    tag_slug: str
+    tech: str
+
+    @classmethod
+    def load(cls) -> "Dataset | None":
+        """Describe an already seeded database, or None if it is not seeded."""
+        users = dict(
+            User.objects.filter(
+                email__in=[ADMIN_EMAIL, MEMBER_EMAIL, REVIEWER_EMAIL],
+            ).values_list("email", "id"),
+        )
+        if len(users) < 3:  # noqa: PLR2004
+            return None
+        member = users[MEMBER_EMAIL]
+        return cls(
+            projects=Project.objects.count(),
+            admin_id=str(users[ADMIN_EMAIL]),
+            member_id=str(member),
+            reviewer_id=str(users[REVIEWER_EMAIL]),
+            project_id=str(
+                Project.objects.filter(status=ProjectStatus.APPROVED)
+                .order_by("-trending_score")
+                .values_list("id", flat=True)
+                .first(),
+            ),
+            own_project_id=str(
+                Project.objects.filter(owner_id=member)
+                .values_list("id", flat=True)
+                .first(),
+            ),
+            competition_id=str(
+                CompetitionReviewer.objects.filter(user_id=users[REVIEWER_EMAIL])
+                .values_list("competition_id", flat=True)
+                .first(),
+            ),
+            tag_slug=Tag.objects.values_list("slug", flat=True).first(),
+            tech=TECHNOLOGIES[0].lower(),
+        )
+
+
+def _batches(items: list, size: int = BATCH_SIZE) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _bulk_create(model: type, rows: list, **kwargs: object) -> None:
+    for batch in _batches(rows):
+        model.objects.bulk_create(batch, **kwargs)
+
+
+def _status(rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.7:  # noqa: PLR2004
+        return ProjectStatus.APPROVED
+    if roll < 0.9:  # noqa: PLR2004
+        return ProjectStatus.PENDING
+    return ProjectStatus.REJECTED
+
+
+def seed(projects: int, *, random_seed: int = 0) -> Dataset:
+    """Fill an empty database with `projects` projects and related rows."""
+    rng = random.Random(random_seed)  # noqa: S311
+    password = make_password(PASSWORD)
+    now = timezone.now()
+
+    with transaction.atomic():
+        special = [
+            UserFactory.build(email=ADMIN_EMAIL, is_superuser=True, is_staff=True),
+            UserFactory.build(email=MEMBER_EMAIL),
+            UserFactory.build(email=REVIEWER_EMAIL),
+        ]
+        users = special + UserFactory.build_batch(
+            max(projects // PROJECTS_PER_USER, 1),
+        )
+        for user in users:
+            user.password = password
+        _bulk_create(User, users)
+        admin, member, reviewer = special
+
+        tags = TagFactory.build_batch(TAG_COUNT)
+        _bulk_create(Tag, tags)
+
+        rows = []
+        for index in range(projects):
+            status = _status(rng)
+            approved = status == ProjectStatus.APPROVED
+            rows.append(
+                ProjectFactory.build(
+                    # The member owns the first projects, for /my/projects
+                    owner=member if index < PROJECTS_PER_USER else rng.choice(users),
+                    status=status,
+                    is_featured=approved and rng.random() < 0.01,  # noqa: PLR2004
+                    approved_at=(
+                        now - timedelta(days=rng.uniform(0, 730)) if approved else None
+                    ),
+                    approved_by=admin if approved else None,
+                    tech_stack=rng.sample(TECHNOLOGIES, rng.randint(1, 5)),
+                    submission_month=(
+                        f"{rng.randint(2023, 2025)}-{rng.randint(1, 12):02d}"
+                    ),
+                ),
+            )
+        _bulk_create(Project, rows)
+
+        _bulk_create(
+            TechStackItem,
+            [
+                TechStackItem(project=project, name=name)
+                for project in rows
+                for name in normalize_tech_stack(project.tech_stack)
+            ],
+        )
+        Through = Project.tags.through  # noqa: N806
+        _bulk_create(
+            Through,
+            [
+                Through(project_id=project.id, tag_id=tag.id)
+                for project in rows
+                for tag in rng.sample(tags, rng.randint(0, MAX_TAGS_PER_PROJECT))
+            ],
+        )
+        images = [
+            ProjectImageFactory.build(
+                project=project,
+                is_main=order == 0,
+                display_order=order,
+            )
+            for project in rows
+            for order in range(rng.randint(0, MAX_IMAGES_PER_PROJECT))
+        ]
+        _bulk_create(ProjectImage, images)
+        # bulk_create skips the signals that keep main_image in sync
+        with_main = []
+        for image in images:
+            if image.is_main:
+                image.project.main_image = image
+                with_main.append(image.project)
+        Project.objects.bulk_update(with_main, ["main_image"], batch_size=BATCH_SIZE)
+
+        today = timezone.localdate()
+        _bulk_create(
+            ProjectDailyViews,
+            [
+                ProjectDailyViews(
+                    project=project,
+                    date=today - timedelta(days=days_ago),
+                    count=rng.randint(1, MAX_DAILY_VIEWS),
+                )
+                for project in rows
+                if project.status == ProjectStatus.APPROVED
+                for days_ago in rng.sample(
+                    range(VIEW_DAYS),
+                    rng.randint(0, MAX_VIEW_DAYS),
+                )
+            ],
+        )
+
+        approved_rows = [p for p in rows if p.status == ProjectStatus.APPROVED]
+        competitions = CompetitionFactory.build_batch(
+            max(len(approved_rows) // PROJECTS_PER_COMPETITION, 1),
+        )
+        _bulk_create(Competition, competitions)
+        CompetitionThrough = Competition.projects.through  # noqa: N806
+        entries = {
+            competition.id: approved_rows[
+                index * PROJECTS_PER_COMPETITION : (index + 1)
+                * PROJECTS_PER_COMPETITION
+            ]
+            for index, competition in enumerate(competitions)
+        }
+        _bulk_create(
+            CompetitionThrough,
+            [
+                CompetitionThrough(competition_id=competition_id, project_id=p.id)
+                for competition_id, entered in entries.items()
+                for p in entered
+            ],
+        )
+        _bulk_create(
+            CompetitionReviewer,
+            [
+                CompetitionReviewer(user=reviewer, competition=competition)
+                for competition in competitions
+            ],
+        )
+        _bulk_create(
+            ProjectRanking,
+            [
+                ProjectRanking(
+                    reviewer=reviewer,
+                    competition_id=competition_id,
+                    project=project,
+                    position=position,
+                )
+                for competition_id, entered in entries.items()
+                for position, project in enumerate(
+                    entered[:RANKED_PER_COMPETITION],
+                    start=1,
+                )
+            ],
+        )
+
+    if connection.vendor == "postgresql":
+        update_search_vectors()
+    refresh_monthly_visitors()
+    refresh_trending_scores()
+    rebuild_rollups()
+
+    dataset = Dataset.load()
+    if dataset is None:
+        msg = "Seeding did not create the benchmark users"
+        raise RuntimeError(msg)
+    return dataset
@@ -1,5 +1,8 @@
 """Gunicorn configuration for production."""
 
+import os
+import shutil
+
 # Server socket
 bind = "0.0.0.0:8000"
 
@@ -16,3 +19,19 @@ access_log_format = (
 # Trust X-Forwarded-* headers from all IPs (required when behind load balancer/proxy)
 # Cloud Run always sits behind a proxy, so we trust all forwarded IPs
 forwarded_allow_ips = "*"
+
+
+# Prometheus multiprocess mode (see project_showcase.metrics): workers write
+# their samples under PROMETHEUS_MULTIPROC_DIR, which must start out empty
+def on_starting(server):  # noqa: ANN001, ANN201
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)  # noqa: PTH103
+
+
+def child_exit(server, worker):  # noqa: ANN001, ANN201
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess  # noqa: PLC0415
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,14 @@
+"""URL configuration for requests served by project_showcase.asgi.
+
+The same routes as project_showcase.urls, with async_api's public read
+endpoints matched first under /api/; every other /api/ path falls through to
+the sync `api`. URLconfMiddleware selects it for every ASGI request.
+"""
+
+from django.urls import path
+
+from api.main import async_api
+
+from . import urls
+
+urlpatterns = [path("api/", async_api.urls), *urls.urlpatterns]
@@ -0,0 +1,241 @@
+"""Prometheus metrics, served at /metrics to the ADMIN_ALLOWED_IPS addresses.
+
+Enabled by METRICS_ENABLED (requires the "metrics" extra); otherwise the
+recording helpers return straight away and prometheus_client is never
+imported. Gunicorn and uvicorn run several worker processes and a scrape
+reaches only one of them, so set PROMETHEUS_MULTIPROC_DIR to an empty
+directory the workers share: each worker then writes its samples there and
+/metrics sums them across all workers, including ones that have since exited.
+"""
+
+import inspect
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from functools import wraps
+from types import SimpleNamespace
+from typing import Any
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import connection
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.http import HttpRequest, HttpResponseBase
+
+PREFIX = "naglasupan"
+
+_lock = threading.Lock()
+_instruments: SimpleNamespace | None = None
+
+
+def _enabled() -> bool:
+    return settings.METRICS_ENABLED
+
+
+def _get_instruments() -> SimpleNamespace:
+    global _instruments  # noqa: PLW0603
+    with _lock:
+        if _instruments is None:
+            from prometheus_client import (  # noqa: PLC0415
+                CollectorRegistry,
+                Counter,
+                Histogram,
+            )
+
+            registry = CollectorRegistry()
+            _instruments = SimpleNamespace(
+                registry=registry,
+                operations=Histogram(
+                    f"{PREFIX}_api_operation_duration_seconds",
+                    "Time Ninja took to run an API operation, from authentication "
+                    "to the rendered response",
+                    ["operation", "method", "status"],
+                    registry=registry,
+                ),
+                s3_calls=Histogram(
+                    f"{PREFIX}_s3_call_duration_seconds",
+                    "Latency of S3 API calls made by StorageService",
+                    ["operation", "status"],
+                    registry=registry,
+                ),
+                db_connections_opened=Counter(
+                    f"{PREFIX}_db_connections_opened",
+                    "Database connections opened by the workers",
+                    ["alias"],
+                    registry=registry,
+                ),
+                auth_failures=Counter(
+                    f"{PREFIX}_auth_failures",
+                    "Rejected logins, token refreshes and bearer tokens",
+                    ["reason"],
+                    registry=registry,
+                ),
+                cache_lookups=Counter(
+                    f"{PREFIX}_public_cache_lookups",
+                    "Public response cache lookups by outcome",
+                    ["namespace", "outcome"],
+                    registry=registry,
+                ),
+            )
+            if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+                registry.register(DatabaseConnectionsCollector())
+        return _instruments
+
+
+class DatabaseConnectionsCollector:
+    """The database server's connections, read when /metrics is scraped.
+
+    Django holds one connection per worker thread (kept for CONN_MAX_AGE
+    seconds) instead of a pool, so pg_stat_activity is where the pool's
+    state shows: how many connections are active, idle or idle in a
+    transaction, against max_connections. Only PostgreSQL reports these.
+    """
+
+    def collect(self) -> Iterator[Any]:
+        from prometheus_client.core import GaugeMetricFamily  # noqa: PLC0415
+
+        if connection.vendor != "postgresql":
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT coalesce(state, 'unknown'), count(*) FROM pg_stat_activity "
+                "WHERE datname = current_database() GROUP BY 1",
+            )
+            states = cursor.fetchall()
+            cursor.execute("SHOW max_connections")
+            (max_connections,) = cursor.fetchone()
+
+        by_state = GaugeMetricFamily(
+            f"{PREFIX}_db_connections",
+            "Connections to the application database by state",
+            labels=["state"],
+        )
+        for state, count in states:
+            by_state.add_metric([state], count)
+        yield by_state
+        yield GaugeMetricFamily(
+            f"{PREFIX}_db_max_connections",
+            "Connections the database server accepts in total",
+            value=int(max_connections),
+        )
+
+
+def observe_operation(run: Callable[..., Any]) -> Callable[..., Any]:
+    """Ninja "view" mode decorator timing each operation into a histogram.
+
+    Operations are labelled <router module>.<handler name>, e.g.
+    projects.list_projects, which stays unique where paths are shared. The
+    async handlers served under ASGI carry their sync twin's url_name, so
+    both report under one label.
+    """
+    # Beneath any per-operation view decorators lies the bound Operation.run
+    operation = inspect.unwrap(run).__self__
+    view_func = operation.view_func
+    handler = getattr(operation, "url_name", None) or view_func.__name__
+    name = f"{view_func.__module__.rsplit('.', 1)[-1]}.{handler}"
+
+    def observe(
+        request: HttpRequest,
+        response: HttpResponseBase,
+        started: float,
+    ) -> None:
+        _get_instruments().operations.labels(
+            name,
+            request.method,
+            response.status_code,
+        ).observe(time.perf_counter() - started)
+
+    if iscoroutinefunction(run):
+
+        @wraps(run)
+        async def async_wrapper(request: HttpRequest, **kwargs: Any) -> Any:
+            if not _enabled():
+                return await run(request, **kwargs)
+            started = time.perf_counter()
+            response = await run(request, **kwargs)
+            observe(request, response, started)
+            return response
+
+        return async_wrapper
+
+    @wraps(run)
+    def wrapper(request: HttpRequest, **kwargs: Any) -> Any:
+        if not _enabled():
+            return run(request, **kwargs)
+        started = time.perf_counter()
+        response = run(request, **kwargs)
+        observe(request, response, started)
+        return response
+
+    return wrapper
+
+
+def count_auth_failure(reason: str) -> None:
+    if _enabled():
+        _get_instruments().auth_failures.labels(reason).inc()
+
+
+def count_cache_lookup(namespace: str, outcome: str) -> None:
+    if _enabled():
+        _get_instruments().cache_lookups.labels(namespace, outcome).inc()
+
+
+def _count_db_connection(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    if _enabled():
+        _get_instruments().db_connections_opened.labels(connection.alias).inc()
+
+
+connection_created.connect(_count_db_connection)
+
+
+def _s3_call_started(context: dict[str, Any], model: Any, **kwargs: Any) -> None:
+    context["metrics_call"] = (model.name, time.perf_counter())
+
+
+def _s3_call_finished(
+    context: dict[str, Any],
+    http_response: Any = None,
+    **kwargs: Any,
+) -> None:
+    call = context.pop("metrics_call", None)
+    if call is None or not _enabled():
+        return
+    operation, started = call
+    # after-call-error (a connection failure or timeout) has no response
+    status = http_response.status_code if http_response is not None else "error"
+    _get_instruments().s3_calls.labels(operation, status).observe(
+        time.perf_counter() - started,
+    )
+
+
+def instrument_s3_client(client: Any) -> None:
+    """Time every API call a boto3 S3 client makes, retries included.
+
+    Presigning URLs is local and makes no call, so it is not measured.
+    """
+    events = client.meta.events
+    events.register("before-call.s3", _s3_call_started)
+    events.register("after-call.s3", _s3_call_finished)
+    events.register("after-call-error.s3", _s3_call_finished)
+
+
+def render() -> tuple[bytes, str]:
+    """The exposition text for a scrape, and its content type."""
+    from prometheus_client import (  # noqa: PLC0415
+        CONTENT_TYPE_LATEST,
+        CollectorRegistry,
+        generate_latest,
+    )
+    from prometheus_client.multiprocess import (  # noqa: PLC0415
+        MultiProcessCollector,
+    )
+
+    registry = _get_instruments().registry
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        # This worker's samples are in the shared directory with everyone else's
+        registry = CollectorRegistry()
+        MultiProcessCollector(registry)
+        registry.register(DatabaseConnectionsCollector())
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -1,8 +1,31 @@
+import logging
+import random
+import time
 from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
 from typing import Any
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 from django.conf import settings
-from django.http import Http404, HttpRequest, HttpResponse
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.asgi import ASGIRequest
+from django.db import connections
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.signals import connection_created
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBase
+
+perf_logger = logging.getLogger("project_showcase.performance")
+
+
+def get_client_ip(request: HttpRequest) -> str:
+    # Get client IP from X-Forwarded-For (set by Scaleway) or fall back to
+    # REMOTE_ADDR
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR", "")
 
 
 class AdminIPMiddleware:
@@ -14,15 +37,194 @@ class AdminIPMiddleware:
     def __call__(self, request: HttpRequest) -> HttpResponse:
         if request.path.startswith("/admin"):
             allowed_ips: list[Any] = getattr(settings, "ADMIN_ALLOWED_IPS", [])
-            # Get client IP from X-Forwarded-For (set by Scaleway) or fall back
-            # to REMOTE_ADDR
-            x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-            if x_forwarded_for:
-                client_ip = x_forwarded_for.split(",")[0].strip()
-            else:
-                client_ip = request.META.get("REMOTE_ADDR", "")
-
-            if client_ip not in allowed_ips:
+            if get_client_ip(request) not in allowed_ips:
                 raise Http404
 
         return self.get_response(request)
+
+
+class URLconfMiddleware:
+    """Resolve requests served by the ASGI handler against ASGI_URLCONF.
+
+    The WSGI deployment keeps ROOT_URLCONF and its sync handlers; under
+    project_showcase.asgi the public read endpoints are served by their async
+    versions instead.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if isinstance(request, ASGIRequest):
+            request.urlconf = settings.ASGI_URLCONF
+        # A coroutine when get_response is async, which Django then awaits
+        return self.get_response(request)
+
+
+@dataclass
+class RequestTimings:
+    """Measurements for one sampled request, filled in as it is handled."""
+
+    started: float = field(default_factory=time.perf_counter)
+    db_queries: int = 0
+    db_seconds: float = 0.0
+    handler_done: float | None = None
+
+
+# Set while a sampled request is being handled; contextvars follow the request
+# into sync_to_async threads, where ASGI requests run their queries
+_current_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "current_timings",
+    default=None,
+)
+
+
+def time_queries(
+    execute: Callable[..., Any],
+    sql: str,
+    params: Any,
+    many: bool,  # noqa: FBT001
+    context: dict[str, Any],
+) -> Any:
+    """Database execute wrapper adding each query to the current timings."""
+    timings = _current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.db_queries += 1
+        timings.db_seconds += time.perf_counter() - started
+
+
+def _install_query_timer(connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    # Installed on the connection itself rather than with a per-request
+    # execute_wrapper() block, because async views query from other threads
+    if time_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_queries)
+
+
+def time_handler(view_func: Callable[..., Any]) -> Callable[..., Any]:
+    """Ninja operation decorator marking when the handler itself returned.
+
+    What follows (response validation and rendering) is reported as
+    serialization time.
+    """
+
+    def done() -> None:
+        timings = _current_timings.get()
+        if timings is not None:
+            timings.handler_done = time.perf_counter()
+
+    if iscoroutinefunction(view_func):
+
+        @wraps(view_func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await view_func(*args, **kwargs)
+            finally:
+                done()
+
+        return async_wrapper
+
+    @wraps(view_func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return view_func(*args, **kwargs)
+        finally:
+            done()
+
+    return wrapper
+
+
+class PerformanceMiddleware:
+    """Opt-in per-request timings, as Server-Timing headers and log lines.
+
+    Enabled by PERF_INSTRUMENTATION; only a PERF_SAMPLE_RATE fraction of
+    requests is measured, the rest pass straight through. Place it first in
+    MIDDLEWARE so the wall time covers the whole stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable[[HttpRequest], Any]) -> None:
+        if not settings.PERF_INSTRUMENTATION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+        connection_created.connect(_install_query_timer)
+        for connection in connections.all(initialized_only=True):
+            _install_query_timer(connection)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if self.async_mode:
+            return self.__acall__(request)
+        if random.random() >= settings.PERF_SAMPLE_RATE:  # noqa: S311
+            return self.get_response(request)
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+        self._report(request, response, timings)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> Any:
+        if random.random() >= settings.PERF_SAMPLE_RATE:  # noqa: S311
+            return await self.get_response(request)
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+        self._report(request, response, timings)
+        return response
+
+    def _report(
+        self,
+        request: HttpRequest,
+        response: HttpResponseBase,
+        timings: RequestTimings,
+    ) -> None:
+        finished = time.perf_counter()
+        match = getattr(request, "resolver_match", None)
+        serialize = (
+            finished - timings.handler_done if timings.handler_done is not None else 0
+        )
+        fields = {
+            "route": (match.url_name or match.route) if match else None,
+            "method": request.method,
+            "status": response.status_code,
+            "wall_ms": round((finished - timings.started) * 1000, 2),
+            "db_queries": timings.db_queries,
+            "db_ms": round(timings.db_seconds * 1000, 2),
+            "serialize_ms": round(serialize * 1000, 2),
+            # Streaming responses have no length until they are consumed
+            "bytes": None if response.streaming else len(response.content),
+        }
+
+        response["Server-Timing"] = ", ".join(
+            [
+                f'db;dur={fields["db_ms"]};desc="{timings.db_queries} queries"',
+                f"serialize;dur={fields['serialize_ms']}",
+                f"total;dur={fields['wall_ms']}",
+            ],
+        )
+        perf_logger.info(
+            " ".join(f"{key}={value}" for key, value in fields.items()),
+            extra={"perf": fields},
+        )
@@ -50,6 +50,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "ninja",
     "apps.users",
@@ -58,6 +59,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "project_showcase.middleware.PerformanceMiddleware",
+    "project_showcase.middleware.URLconfMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "project_showcase.middleware.AdminIPMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -71,6 +74,9 @@ MIDDLEWARE = [
 ]
 
 ROOT_URLCONF = "project_showcase.urls"
+# Used instead for requests served by project_showcase.asgi (see
+# URLconfMiddleware), routing the public read endpoints to async views
+ASGI_URLCONF = "project_showcase.asgi_urls"
 
 TEMPLATES = [
     {
@@ -103,6 +109,58 @@ DATABASES = {
 }
 
 
+# Cache
+# Local memory by default; set REDIS_URL to share the cache across workers
+# (requires the "redis" extra).
+REDIS_URL = os.getenv("REDIS_URL", "")
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+        if REDIS_URL
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    ),
+}
+
+# Seconds an anonymous public listing response stays cached
+PUBLIC_API_CACHE_TIMEOUT = int(os.getenv("PUBLIC_API_CACHE_TIMEOUT", "60"))
+
+# Seconds an admin analytics timeseries (per interval and range) stays cached
+ANALYTICS_CACHE_TIMEOUT = int(os.getenv("ANALYTICS_CACHE_TIMEOUT", "300"))
+
+# Largest per_page each listing endpoint accepts, and the largest serialized
+# body a guarded listing may return (api.guardrails)
+LISTING_MAX_PER_PAGE = {
+    "projects": int(os.getenv("PROJECTS_MAX_PER_PAGE", "100")),
+    "admin_projects": int(os.getenv("ADMIN_PROJECTS_MAX_PER_PAGE", "200")),
+    "admin_users": int(os.getenv("ADMIN_USERS_MAX_PER_PAGE", "200")),
+}
+MAX_RESPONSE_BYTES = int(os.getenv("MAX_RESPONSE_BYTES", str(5 * 1024 * 1024)))
+
+# Per-request timings (project_showcase.middleware.PerformanceMiddleware):
+# off unless PERF_INSTRUMENTATION is true, then a PERF_SAMPLE_RATE fraction of
+# requests get Server-Timing headers and a project_showcase.performance log line
+PERF_INSTRUMENTATION = os.getenv("PERF_INSTRUMENTATION", "False").lower() == "true"
+PERF_SAMPLE_RATE = float(os.getenv("PERF_SAMPLE_RATE", "0.01"))
+
+# Prometheus metrics at /metrics (project_showcase.metrics), for the
+# ADMIN_ALLOWED_IPS addresses; requires the "metrics" extra. With several
+# workers also set PROMETHEUS_MULTIPROC_DIR so scrapes see all of them
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "False").lower() == "true"
+
+# Rows a listing counts with count=capped before reporting "more than this"
+LISTING_COUNT_CAP = int(os.getenv("LISTING_COUNT_CAP", "1000"))
+
+# Project view tracking (apps.projects.view_tracking): at most BUFFER_SIZE
+# distinct views wait in memory per worker; they are written in batches of
+# BATCH_SIZE every FLUSH_INTERVAL seconds (0 disables the background flusher)
+PROJECT_VIEW_BUFFER_SIZE = int(os.getenv("PROJECT_VIEW_BUFFER_SIZE", "10000"))
+PROJECT_VIEW_BATCH_SIZE = int(os.getenv("PROJECT_VIEW_BATCH_SIZE", "500"))
+PROJECT_VIEW_FLUSH_INTERVAL = float(os.getenv("PROJECT_VIEW_FLUSH_INTERVAL", "5"))
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -166,6 +224,11 @@ JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
 JWT_REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Seconds an authenticated user is cached per process (0 disables); with
+# AUTH_USER_CACHE_SHARED the Django cache is used as a second, shared layer
+AUTH_USER_CACHE_TTL = int(os.getenv("AUTH_USER_CACHE_TTL", "30"))
+AUTH_USER_CACHE_SHARED = os.getenv("AUTH_USER_CACHE_SHARED", "False").lower() == "true"
+
 # CORS Settings
 CORS_ALLOW_ALL_ORIGINS = DEBUG
 _cors_origins_env = os.getenv("CORS_ALLOWED_ORIGINS", "")
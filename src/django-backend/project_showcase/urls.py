@@ -27,4 +27,5 @@ urlpatterns = [
     path("", views.home, name="home"),
     path("admin/", admin.site.urls),
     path("api/", api.urls),
+    path("metrics", views.metrics, name="metrics"),
 ]
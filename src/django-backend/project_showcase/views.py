@@ -1,4 +1,8 @@
-from django.http import HttpRequest, HttpResponse
+from django.conf import settings
+from django.http import Http404, HttpRequest, HttpResponse
+
+from . import metrics as prometheus_metrics
+from .middleware import get_client_ip
 
 
 def home(request: HttpRequest) -> HttpResponse:
@@ -28,3 +32,14 @@ def home(request: HttpRequest) -> HttpResponse:
 </body>
 </html>"""
     return HttpResponse(html)
+
+
+def metrics(request: HttpRequest) -> HttpResponse:
+    """Prometheus scrape target, hidden like /admin from other addresses."""
+    if (
+        not settings.METRICS_ENABLED
+        or get_client_ip(request) not in settings.ADMIN_ALLOWED_IPS
+    ):
+        raise Http404
+    body, content_type = prometheus_metrics.render()
+    return HttpResponse(body, content_type=content_type)
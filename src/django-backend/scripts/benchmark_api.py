@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark every API router against a seeded throwaway database.
+
+Creates a test database (like the test suite does) from the configured one,
+seeds it with --projects projects, replays benchmarks.scenarios and prints
+p50/p95/p99 latency, queries and allocated memory per scenario, plus the
+worker's peak memory. Results are compared with the stored baseline for the
+same database vendor, size and concurrency; the script exits non-zero on a
+regression.
+
+Requests go through the test client in this process. With the default
+--concurrency 1 the figures are latencies without concurrent load; raise it to
+replay each scenario from that many threads at once (see benchmarks.runner).
+
+    uv run python scripts/benchmark_api.py --projects 10000
+    uv run python scripts/benchmark_api.py --projects 10000 --save-baseline
+    # Latency under load, from 16 concurrent clients
+    uv run python scripts/benchmark_api.py --projects 10000 --concurrency 16
+    # Keep the seeded database between runs (seeding 500k takes a while)
+    uv run python scripts/benchmark_api.py --projects 500000 --keepdb
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import django
+
+DJANGO_BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(DJANGO_BACKEND_DIR))
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "project_showcase.settings")
+django.setup()
+
+from django.db import connection  # noqa: E402
+from django.test.utils import (  # noqa: E402
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from benchmarks.runner import (  # noqa: E402
+    format_table,
+    load_baseline,
+    regressions,
+    run_scenarios,
+    save_baseline,
+    worker_peak_rss_mb,
+)
+from benchmarks.scenarios import SCENARIOS  # noqa: E402
+from benchmarks.seed import Dataset, seed  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Clients replaying each scenario at once, each on its own thread",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="Only run scenarios whose name starts with this (repeatable)",
+    )
+    parser.add_argument(
+        "--label",
+        help="Baseline name (default: <vendor>-<projects>, plus -c<concurrency>)",
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed relative p95 slowdown before reporting a regression",
+    )
+    parser.add_argument("--keepdb", action="store_true")
+    args = parser.parse_args()
+
+    label = args.label or f"{connection.vendor}-{args.projects}"
+    if not args.label and args.concurrency > 1:
+        label += f"-c{args.concurrency}"
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if not args.scenario or scenario.name.startswith(tuple(args.scenario))
+    ]
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0, keepdb=args.keepdb)
+    try:
+        dataset = Dataset.load() if args.keepdb else None
+        if dataset is None:
+            started = time.perf_counter()
+            dataset = seed(args.projects)
+            elapsed = time.perf_counter() - started
+            print(f"Seeded {args.projects} projects in {elapsed:.0f}s")  # noqa: T201
+        elif dataset.projects != args.projects:
+            print(  # noqa: T201
+                f"Kept database has {dataset.projects} projects, not "
+                f"{args.projects}; rerun without --keepdb to reseed",
+            )
+            return 2
+
+        results = run_scenarios(
+            dataset,
+            scenarios,
+            requests=args.requests,
+            warmup=args.warmup,
+            concurrency=args.concurrency,
+        )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+        teardown_test_environment()
+
+    baseline = load_baseline(label)
+    if args.concurrency > 1:
+        load = f"{args.concurrency} concurrent in-process clients"
+    else:
+        load = "one request at a time, no concurrent load"
+    print(f"Latency per request, {load}:")  # noqa: T201
+    print(format_table(results, baseline))  # noqa: T201
+    print(f"\nWorker peak RSS: {worker_peak_rss_mb()} MB")  # noqa: T201
+
+    if args.save_baseline:
+        path = save_baseline(
+            label,
+            results,
+            {
+                "projects": args.projects,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+            },
+        )
+        print(f"Saved baseline to {path}")  # noqa: T201
+        return 0
+
+    if baseline is None:
+        print(f"No baseline for {label}; rerun with --save-baseline to store one")  # noqa: T201
+        return 0
+
+    found = regressions(results, baseline, tolerance=args.tolerance)
+    for regression in found:
+        print(f"REGRESSION {regression}")  # noqa: T201
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Compare the public read endpoints served over WSGI and ASGI.
+
+Starts gunicorn (sync workers, project_showcase.wsgi) and uvicorn
+(project_showcase.asgi) with the same number of worker processes, drives the
+public endpoints at increasing concurrency and prints throughput and latency
+percentiles for each. Both servers use the database configured for the
+project, so seed it first (e.g. `make bootstrap` plus some projects). The
+public response cache is disabled so every request reaches the database.
+
+    uv run --with uvicorn python scripts/benchmark_asgi.py --workers 2
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+DJANGO_BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_PATHS = [
+    "/api/projects",
+    "/api/projects/featured",
+    "/api/projects/trending",
+    "/api/tags",
+    "/api/competitions",
+]
+
+SERVERS = {
+    "wsgi": [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "--workers",
+        "{workers}",
+        "--bind",
+        "127.0.0.1:{port}",
+        "project_showcase.wsgi:application",
+    ],
+    "asgi": [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "--workers",
+        "{workers}",
+        "--port",
+        "{port}",
+        "--log-level",
+        "warning",
+        "project_showcase.asgi:application",
+    ],
+}
+
+
+def start_server(kind: str, workers: int, port: int) -> subprocess.Popen:
+    command = [part.format(workers=workers, port=port) for part in SERVERS[kind]]
+    env = {**os.environ, "PUBLIC_API_CACHE_TIMEOUT": "0"}
+    process = subprocess.Popen(  # noqa: S603
+        command,
+        cwd=DJANGO_BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health"):
+                return process
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.2)
+    process.terminate()
+    msg = f"{kind} server did not start on port {port}"
+    raise RuntimeError(msg)
+
+
+def fetch(url: str) -> float | None:
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url) as response:  # noqa: S310
+            response.read()
+    except (urllib.error.URLError, ConnectionError):
+        return None
+    return time.perf_counter() - started
+
+
+def run_load(
+    port: int, paths: list[str], concurrency: int, total: int
+) -> dict[str, float]:
+    urls = [f"http://127.0.0.1:{port}{paths[i % len(paths)]}" for i in range(total)]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(fetch, urls))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(r for r in results if r is not None)
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": quantiles[49] * 1000 if quantiles else 0.0,
+        "p95": quantiles[94] * 1000 if quantiles else 0.0,
+        "errors": total - len(latencies),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 8, 32, 64],
+    )
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--path", action="append", dest="paths")
+    args = parser.parse_args()
+    paths = args.paths or DEFAULT_PATHS
+
+    print(f"{'server':<6} {'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} errors")  # noqa: T201
+    for offset, kind in enumerate(SERVERS):
+        port = args.port + offset
+        process = start_server(kind, args.workers, port)
+        try:
+            for concurrency in args.concurrency:
+                result = run_load(port, paths, concurrency, args.requests)
+                print(  # noqa: T201
+                    f"{kind:<6} {concurrency:>5} {result['rps']:>9.1f} "
+                    f"{result['p50']:>8.1f} {result['p95']:>8.1f} "
+                    f"{result['errors']:>6}",
+                )
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
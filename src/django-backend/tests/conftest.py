@@ -1,10 +1,35 @@
 import pytest
+from django.core.cache import cache
+from django.db import connection
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from hamcrest import assert_that, equal_to
 
 from api.auth.jwt import create_access_token, create_refresh_token
+from api.auth.user_cache import local_cache as user_cache
+from api.cache import stats as cache_stats
+from api.guardrails import stats as rejection_stats
+from apps.projects.view_tracking import view_buffer
 from tests.factories import ProjectFactory, TagFactory, UserFactory
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    # Database rollbacks between tests don't fire invalidation signals
+    cache.clear()
+    cache_stats.reset()
+    rejection_stats.reset()
+    user_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _flush_views_manually(settings):
+    # A background flusher would write through its own database connection,
+    # outside the test transaction; tests call view_buffer.flush() instead
+    settings.PROJECT_VIEW_FLUSH_INTERVAL = 0
+    view_buffer.reset()
+
+
 @pytest.fixture
 def client():
     return Client()
@@ -26,6 +51,13 @@ def auth_headers(user):
     return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
 
 
+@pytest.fixture
+def admin_headers(db):
+    admin = UserFactory(is_superuser=True)
+    token = create_access_token(admin.id)
+    return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+
 @pytest.fixture
 def access_token(user):
     return create_access_token(user.id)
@@ -60,3 +92,19 @@ def tag(db):
 @pytest.fixture
 def tags(db):
     return [TagFactory() for _ in range(3)]
+
+
+@pytest.fixture
+def count_queries(client, settings):
+    """Return a function counting the queries one successful GET runs."""
+    # Cached responses would hide the queries being counted
+    settings.PUBLIC_API_CACHE_TIMEOUT = 0
+    settings.ANALYTICS_CACHE_TIMEOUT = 0
+
+    def count(url, **headers):
+        with CaptureQueriesContext(connection) as context:
+            response = client.get(url, **headers)
+        assert_that(response.status_code, equal_to(200), url)
+        return len(context.captured_queries)
+
+    return count
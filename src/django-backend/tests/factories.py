@@ -7,8 +7,10 @@ from apps.projects.models import (
     Competition,
     CompetitionReviewer,
     Project,
+    ProjectImage,
     ProjectRanking,
     ProjectStatus,
+    UploadStatus,
 )
 from apps.tags.models import Tag
 
@@ -63,6 +65,18 @@ class ProjectFactory(factory.django.DjangoModelFactory):
         self.tags.add(*extracted)
 
 
+class ProjectImageFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = ProjectImage
+
+    project = factory.SubFactory(ProjectFactory)
+    storage_key = factory.Sequence(lambda n: f"projects/test/{n}/image.png")
+    original_filename = "image.png"
+    content_type = "image/png"
+    file_size = 1024
+    upload_status = UploadStatus.UPLOADED
+
+
 class CompetitionFactory(factory.django.DjangoModelFactory):
     class Meta:
         model = Competition
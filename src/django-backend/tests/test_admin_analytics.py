@@ -0,0 +1,302 @@
+import sys
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    contains_inanyorder,
+    equal_to,
+    has_entries,
+)
+
+from apps.projects.models import (
+    AnalyticsRollup,
+    Project,
+    ProjectDailyViews,
+    ProjectStatus,
+)
+from apps.projects.rollups import read_analytics, rebuild_rollups, tech_stack_counts
+from apps.projects.tech_stack import TECH_WHITESPACE
+from apps.projects.view_counters import add_daily_views
+from apps.projects.view_tracking import view_buffer
+from tests.factories import ProjectFactory, TagFactory
+
+
+@pytest.mark.django_db
+class TestPlatformAnalytics:
+    def test_requires_admin(self, client, auth_headers):
+        response = client.get("/api/admin/analytics", **auth_headers)
+
+        assert_that(response.status_code, equal_to(403))
+
+    def test_builds_rollups_on_first_read(self, client, admin_headers, tag):
+        ProjectFactory(tech_stack=["Django", "React"], tags=[tag])
+        ProjectFactory(
+            status=ProjectStatus.APPROVED,
+            submission_month="2025-02",
+            tech_stack=["django"],
+        )
+
+        response = client.get("/api/admin/analytics", **admin_headers)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json(),
+            has_entries(
+                total_projects=2,
+                pending_projects=1,
+                approved_projects=1,
+                # The admin and the two project owners
+                total_users=3,
+                monthly_submissions={"2025-01": 1, "2025-02": 1},
+                top_tags=[{"name": tag.name, "count": 1}],
+                top_tech_stack=[
+                    {"name": "django", "count": 2},
+                    {"name": "react", "count": 1},
+                ],
+            ),
+        )
+
+    def test_read_uses_a_fixed_number_of_queries(
+        self,
+        client,
+        admin_headers,
+        django_assert_max_num_queries,
+    ):
+        for _ in range(20):
+            ProjectFactory(tech_stack=["Django"], tags=[TagFactory()])
+        rebuild_rollups()
+
+        with django_assert_max_num_queries(5):
+            assert_that(read_analytics()["total_projects"], equal_to(20))
+
+
+@pytest.mark.django_db
+class TestAnalyticsRollupMaintenance:
+    @pytest.fixture(autouse=True)
+    def _built(self, db):
+        rebuild_rollups()
+
+    def test_new_project_is_counted(self, user):
+        ProjectFactory(owner=user, tech_stack=["Go"], submission_month="2025-03")
+
+        analytics = read_analytics()
+
+        assert_that(
+            analytics,
+            has_entries(
+                total_projects=1,
+                pending_projects=1,
+                monthly_submissions={"2025-03": 1},
+                top_tech_stack=[{"name": "go", "count": 1}],
+            ),
+        )
+
+    def test_approval_moves_status_count(self, project):
+        project.status = ProjectStatus.APPROVED
+        project.save()
+
+        assert_that(
+            read_analytics(),
+            has_entries(pending_projects=0, approved_projects=1, total_projects=1),
+        )
+
+    def test_tech_stack_edit_replaces_counts(self, project):
+        project.tech_stack = ["Vue"]
+        project.save()
+        project.tech_stack = ["Svelte"]
+        project.save()
+
+        assert_that(
+            read_analytics()["top_tech_stack"],
+            contains_exactly({"name": "svelte", "count": 1}),
+        )
+
+    def test_tag_changes_are_counted(self, project, tags):
+        project.tags.add(*tags)
+        project.tags.remove(tags[0])
+        tags[1].projects.clear()
+
+        assert_that(
+            read_analytics()["top_tags"],
+            contains_exactly({"name": tags[2].name, "count": 1}),
+        )
+
+    def test_removing_unlinked_tags_changes_nothing(self, project, tags):
+        ProjectFactory().tags.add(*tags)
+        project.tags.add(tags[0])
+        project.tags.remove(tags[0], tags[1])
+        tags[2].projects.remove(project)
+
+        assert_that(
+            read_analytics()["top_tags"],
+            contains_inanyorder(
+                *({"name": tag.name, "count": 1} for tag in tags),
+            ),
+        )
+
+    def test_deleted_project_is_uncounted(self, project, tag):
+        project.tags.add(tag)
+        project.delete()
+
+        assert_that(
+            read_analytics(),
+            has_entries(total_projects=0, monthly_submissions={}, top_tags=[]),
+        )
+
+    def test_users_are_counted(self, user, other_user):
+        other_user.delete()
+
+        assert_that(read_analytics()["total_users"], equal_to(1))
+
+    def test_rebuild_command_corrects_drift(self, project):
+        AnalyticsRollup.objects.filter(key=ProjectStatus.PENDING).update(count=42)
+
+        call_command("rebuild_analytics_rollups")
+
+        assert_that(read_analytics()["pending_projects"], equal_to(1))
+
+
+@pytest.mark.django_db
+class TestTechStackCounts:
+    def test_counts_normalized_names_once_per_project(self):
+        ProjectFactory(tech_stack=["Django", " django ", "HTMX"])
+        ProjectFactory(tech_stack=["DJANGO", ""])
+        ProjectFactory(tech_stack=[])
+
+        counts = tech_stack_counts(chunk_size=1)
+
+        assert_that(dict(counts), equal_to({"django": 2, "htmx": 1}))
+
+    def test_trims_the_whitespace_str_strip_does(self):
+        every_space = {chr(c) for c in range(sys.maxunicode + 1) if chr(c).isspace()}
+
+        assert_that(set(TECH_WHITESPACE), equal_to(every_space))
+
+    def test_rebuild_matches_incremental_counts(self):
+        rebuild_rollups()
+        ProjectFactory(tech_stack=["Django\u00a0", "\x0bHTMX\x0c"])
+        ProjectFactory(tech_stack=["\u3000django", "htmx"])
+        incremental = read_analytics()["top_tech_stack"]
+
+        rebuild_rollups()
+
+        assert_that(read_analytics()["top_tech_stack"], equal_to(incremental))
+        assert_that(
+            incremental,
+            contains_inanyorder(
+                {"name": "django", "count": 2},
+                {"name": "htmx", "count": 2},
+            ),
+        )
+
+
+@pytest.mark.django_db
+class TestAnalyticsTimeseries:
+    def test_buckets_activity_by_day(self, client, admin_headers, project):
+        Project.objects.filter(pk=project.pk).update(
+            created_at=datetime(2025, 3, 2, 10, tzinfo=UTC),
+            approved_at=datetime(2025, 3, 3, 9, tzinfo=UTC),
+        )
+        add_daily_views({project.id: 1}, date(2025, 3, 3))
+
+        response = client.get(
+            "/api/admin/analytics/timeseries?start=2025-03-01&end=2025-03-03",
+            **admin_headers,
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json()["points"],
+            contains_exactly(
+                has_entries(period="2025-03-01", submissions=0, approvals=0),
+                has_entries(period="2025-03-02", submissions=1, approvals=0),
+                has_entries(period="2025-03-03", approvals=1, views=1),
+            ),
+        )
+
+    def test_counts_returning_visitors_every_day(
+        self,
+        client,
+        admin_headers,
+        project,
+    ):
+        today = timezone.localdate()
+        yesterday = today - timedelta(days=1)
+        view_buffer.record(project.id, "10.0.0.1", "ua")
+        view_buffer.flush()
+        ProjectDailyViews.objects.filter(project=project).update(date=yesterday)
+        view_buffer.record(project.id, "10.0.0.1", "ua")
+        view_buffer.flush()
+
+        response = client.get(
+            f"/api/admin/analytics/timeseries?start={yesterday}&end={today}",
+            **admin_headers,
+        )
+
+        assert_that(
+            [(p["period"], p["views"]) for p in response.json()["points"]],
+            equal_to([(str(yesterday), 1), (str(today), 1)]),
+        )
+
+    def test_buckets_by_week_and_month(self, client, admin_headers, project):
+        Project.objects.filter(pk=project.pk).update(
+            created_at=datetime(2025, 3, 5, tzinfo=UTC),
+        )
+
+        weekly = client.get(
+            "/api/admin/analytics/timeseries"
+            "?start=2025-03-01&end=2025-03-16&interval=week",
+            **admin_headers,
+        ).json()
+        monthly = client.get(
+            "/api/admin/analytics/timeseries"
+            "?start=2025-02-15&end=2025-03-31&interval=month",
+            **admin_headers,
+        ).json()
+
+        assert_that(
+            [(p["period"], p["submissions"]) for p in weekly["points"]],
+            equal_to(
+                [("2025-02-24", 0), ("2025-03-03", 1), ("2025-03-10", 0)],
+            ),
+        )
+        assert_that(
+            [(p["period"], p["submissions"]) for p in monthly["points"]],
+            equal_to([("2025-02-01", 0), ("2025-03-01", 1)]),
+        )
+
+    def test_caches_per_range(self, client, admin_headers, project):
+        url = "/api/admin/analytics/timeseries?start=2025-01-01&end=2025-01-31"
+        client.get(url, **admin_headers)
+        Project.objects.filter(pk=project.pk).update(
+            created_at=datetime(2025, 1, 15, tzinfo=UTC),
+        )
+
+        cached = client.get(url, **admin_headers).json()
+        other_range = client.get(
+            "/api/admin/analytics/timeseries?start=2025-01-15&end=2025-01-15",
+            **admin_headers,
+        ).json()
+
+        assert_that(sum(p["submissions"] for p in cached["points"]), equal_to(0))
+        assert_that(other_range["points"][0]["submissions"], equal_to(1))
+
+    def test_rejects_inverted_range(self, client, admin_headers):
+        response = client.get(
+            "/api/admin/analytics/timeseries?start=2025-02-01&end=2025-01-01",
+            **admin_headers,
+        )
+
+        assert_that(response.status_code, equal_to(400))
+
+    def test_rejects_too_many_buckets(self, client, admin_headers):
+        response = client.get(
+            "/api/admin/analytics/timeseries?start=2000-01-01&end=2025-01-01",
+            **admin_headers,
+        )
+
+        assert_that(response.status_code, equal_to(400))
@@ -0,0 +1,93 @@
+"""The public read endpoints served through Django's ASGI handler.
+
+AsyncClient builds ASGI requests, so these reach async_api's async handlers.
+"""
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries
+
+from apps.projects.models import ProjectStatus
+from tests.factories import CompetitionFactory, ProjectFactory
+
+
+@pytest.fixture
+def get():
+    client = AsyncClient()
+    return async_to_sync(client.get)
+
+
+@pytest.mark.django_db
+class TestAsyncPublicEndpoints:
+    def test_served_by_async_api(self, client, get) -> None:
+        asgi = get("/api/tags")
+        wsgi = client.get("/api/tags")
+
+        assert_that(asgi.resolver_match.namespace, equal_to("api-async"))
+        assert_that(wsgi.resolver_match.namespace, equal_to("api-1.0.0"))
+
+    def test_other_routes_fall_through_to_sync_api(self, get) -> None:
+        response = get("/api/health")
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(response.resolver_match.namespace, equal_to("api-1.0.0"))
+
+    def test_lists_projects(self, get) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        ProjectFactory()
+
+        response = get("/api/projects", {"count": "capped"})
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json(),
+            has_entries(total=1, count_strategy="capped"),
+        )
+        assert_that(
+            [p["id"] for p in response.json()["projects"]],
+            contains_exactly(str(project.id)),
+        )
+
+    def test_cursor_pagination(self, get) -> None:
+        ProjectFactory.create_batch(3, status=ProjectStatus.APPROVED)
+
+        first = get("/api/projects", {"pagination": "cursor", "per_page": 2}).json()
+        second = get(
+            "/api/projects",
+            {"pagination": "cursor", "per_page": 2, "cursor": first["next_cursor"]},
+        ).json()
+
+        assert_that(len(first["projects"]) + len(second["projects"]), equal_to(3))
+        assert_that(second["next_cursor"], equal_to(None))
+
+    def test_second_listing_is_a_cache_hit(self, get) -> None:
+        get("/api/tags")
+
+        response = get("/api/tags")
+
+        assert_that(response["X-Cache"], equal_to("HIT"))
+
+    def test_project_detail_revalidates(self, get) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        etag = get(f"/api/projects/{project.id}")["ETag"]
+
+        response = get(f"/api/projects/{project.id}", headers={"If-None-Match": etag})
+
+        assert_that(response.status_code, equal_to(304))
+
+    def test_unapproved_project_is_hidden(self, get) -> None:
+        project = ProjectFactory()
+
+        response = get(f"/api/projects/{project.id}")
+
+        assert_that(response.status_code, equal_to(404))
+
+    def test_competitions(self, get) -> None:
+        competition = CompetitionFactory()
+
+        listing = get("/api/competitions")
+        detail = get(f"/api/competitions/{competition.id}")
+
+        assert_that(listing.status_code, equal_to(200))
+        assert_that(detail.json(), has_entries(id=str(competition.id)))
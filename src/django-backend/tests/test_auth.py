@@ -4,15 +4,25 @@ from datetime import UTC, datetime, timedelta
 import jwt
 from django.conf import settings
 from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from hamcrest import (
     assert_that,
     contains_inanyorder,
     equal_to,
     has_entries,
+    has_length,
     is_not,
 )
 
-from api.auth.jwt import create_access_token, create_refresh_token, verify_token
+from api.auth.jwt import (
+    access_token_claims,
+    create_access_token,
+    create_refresh_token,
+    verify_token,
+)
+from api.auth.security import claims_auth
 from tests.factories import UserFactory
 
 
@@ -264,3 +274,105 @@ class TestGetCurrentUser:
             response.json()["groups"],
             contains_inanyorder("reviewers", "editors"),
         )
+
+
+class TestAuthenticatedUserCache:
+    def test_repeat_requests_skip_user_lookup(self, client, auth_headers) -> None:
+        client.get("/api/auth/me", **auth_headers)
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get("/api/auth/me", **auth_headers)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(ctx.captured_queries, has_length(0))
+
+    def test_ban_takes_effect_immediately(self, client, user, auth_headers) -> None:
+        client.get("/api/auth/me", **auth_headers)
+        admin = UserFactory(is_superuser=True)
+        admin_headers = {
+            "HTTP_AUTHORIZATION": f"Bearer {create_access_token(admin.id)}",
+        }
+
+        client.put(f"/api/admin/users/{user.id}/ban", **admin_headers)
+        response = client.get("/api/auth/me", **auth_headers)
+
+        assert_that(response.status_code, equal_to(401))
+
+    def test_group_change_is_visible(self, client, user, auth_headers) -> None:
+        client.get("/api/auth/me", **auth_headers)
+
+        user.groups.add(Group.objects.create(name="reviewers"))
+        response = client.get("/api/auth/me", **auth_headers)
+
+        assert_that(response.json()["groups"], equal_to(["reviewers"]))
+
+    def test_profile_update_is_visible(self, client, auth_headers) -> None:
+        client.put(
+            "/api/auth/me",
+            data=json.dumps({"first_name": "Changed"}),
+            content_type="application/json",
+            **auth_headers,
+        )
+
+        response = client.get("/api/auth/me", **auth_headers)
+
+        assert_that(response.json(), has_entries(first_name="Changed"))
+
+
+class TestClaimsAuth:
+    def _token(self, user):
+        return create_access_token(user.id, access_token_claims(user))
+
+    def test_login_token_carries_claims(self, client, user) -> None:
+        response = client.post(
+            "/api/auth/login",
+            data=json.dumps({"email": user.email, "password": "testpassword123"}),
+            content_type="application/json",
+        )
+
+        payload = verify_token(response.json()["access_token"])
+        assert_that(
+            payload,
+            has_entries(is_active=True, is_superuser=False, ver=0),
+        )
+
+    def test_reads_do_not_query_the_database(self, user) -> None:
+        request = RequestFactory().get("/api/my/projects")
+
+        with CaptureQueriesContext(connection) as ctx:
+            principal = claims_auth.authenticate(request, self._token(user))
+
+        assert_that(principal.id, equal_to(user.id))
+        assert_that(ctx.captured_queries, has_length(0))
+
+    def test_writes_reject_revoked_tokens(self, user) -> None:
+        token = self._token(user)
+        user.is_active = False
+        user.save()
+        user.is_active = True
+        user.save()
+        request = RequestFactory().post("/api/my/projects")
+
+        assert_that(claims_auth.authenticate(request, token), equal_to(None))
+
+    def test_banning_revokes_tokens_on_full_auth_endpoints(self, client, user) -> None:
+        token = self._token(user)
+        user.is_active = False
+        user.save()
+        user.is_active = True
+        user.save()
+
+        response = client.get(
+            "/api/auth/me",
+            HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+
+        assert_that(response.status_code, equal_to(401))
+
+    def test_list_my_projects_accepts_claims_token(self, client, user) -> None:
+        response = client.get(
+            "/api/my/projects",
+            HTTP_AUTHORIZATION=f"Bearer {self._token(user)}",
+        )
+
+        assert_that(response.status_code, equal_to(200))
@@ -0,0 +1,81 @@
+import pytest
+from hamcrest import assert_that, empty, equal_to, has_length
+
+from apps.projects.models import Project, ProjectDailyViews, ProjectStatus
+from benchmarks.runner import regressions, run_scenarios
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.seed import Dataset, seed
+
+
+@pytest.mark.django_db
+class TestBenchmarkScenarios:
+    def test_every_scenario_succeeds_on_seeded_data(self) -> None:
+        dataset = seed(40)
+
+        results = run_scenarios(dataset, requests=2, warmup=0)
+
+        assert_that(results, has_length(len(SCENARIOS)))
+        failing = [name for name, result in results.items() if result["errors"]]
+        assert_that(failing, empty())
+
+    def test_seeded_database_can_be_reloaded(self) -> None:
+        dataset = seed(10)
+
+        assert_that(Dataset.load(), equal_to(dataset))
+
+    def test_seeds_main_images_and_daily_views(self) -> None:
+        seed(40)
+
+        without_main = Project.objects.filter(
+            images__is_main=True,
+            main_image__isnull=True,
+        )
+        assert_that(without_main.exists(), equal_to(False))
+        assert_that(Project.objects.filter(main_image__isnull=False).exists())
+        assert_that(ProjectDailyViews.objects.exists())
+        viewed = Project.objects.filter(
+            status=ProjectStatus.APPROVED,
+            monthly_visitors__gt=0,
+        )
+        assert_that(viewed.exists())
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentScenarios:
+    def test_replays_each_scenario_from_several_clients(self) -> None:
+        dataset = seed(10)
+        scenarios = [s for s in SCENARIOS if s.name.startswith(("projects.", "tags."))]
+
+        results = run_scenarios(
+            dataset,
+            scenarios,
+            requests=8,
+            warmup=0,
+            concurrency=4,
+        )
+
+        assert_that(results, has_length(len(scenarios)))
+        failing = [name for name, result in results.items() if result["errors"]]
+        assert_that(failing, empty())
+
+
+class TestRegressions:
+    BASELINE = {"projects.list": {"p95_ms": 10.0, "queries": 4}}
+
+    def test_flags_slower_p95_and_more_queries(self) -> None:
+        results = {"projects.list": {"p95_ms": 20.0, "queries": 5}}
+
+        assert_that(
+            regressions(results, self.BASELINE, tolerance=0.25),
+            equal_to(
+                [
+                    "projects.list: 4 -> 5 queries",
+                    "projects.list: p95 10.0 -> 20.0 ms",
+                ],
+            ),
+        )
+
+    def test_ignores_changes_within_tolerance(self) -> None:
+        results = {"projects.list": {"p95_ms": 12.0, "queries": 4}}
+
+        assert_that(regressions(results, self.BASELINE, tolerance=0.25), empty())
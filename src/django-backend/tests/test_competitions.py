@@ -1,8 +1,8 @@
 import pytest
 from hamcrest import assert_that, equal_to, has_entries, has_length
 
-from apps.projects.models import ProjectStatus
-from tests.factories import CompetitionFactory, ProjectFactory
+from apps.projects.models import ProjectStatus, UploadStatus
+from tests.factories import CompetitionFactory, ProjectFactory, ProjectImageFactory
 
 
 @pytest.mark.django_db
@@ -88,3 +88,76 @@ class TestGetCompetition:
         response = client.get("/api/competitions/00000000-0000-0000-0000-000000000000")
 
         assert_that(response.status_code, equal_to(404))
+
+
+@pytest.mark.django_db
+class TestCompetitionProjectMainImage:
+    def test_uses_image_flagged_as_main(self, client, settings) -> None:
+        settings.S3_PUBLIC_URL_BASE = "https://cdn.example.com"
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        ProjectImageFactory(project=project, display_order=0)
+        main = ProjectImageFactory(project=project, display_order=1, is_main=True)
+        project.refresh_main_image()
+        competition = CompetitionFactory(projects=[project])
+
+        response = client.get(f"/api/competitions/{competition.id}")
+
+        assert_that(
+            response.json()["projects"][0]["main_image_url"],
+            equal_to(main.url),
+        )
+
+    def test_falls_back_to_first_uploaded_image(self, client, settings) -> None:
+        settings.S3_PUBLIC_URL_BASE = "https://cdn.example.com"
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        ProjectImageFactory(
+            project=project,
+            display_order=0,
+            upload_status=UploadStatus.PENDING,
+        )
+        first = ProjectImageFactory(project=project, display_order=1)
+        ProjectImageFactory(project=project, display_order=2)
+        project.refresh_main_image()
+        competition = CompetitionFactory(projects=[project])
+
+        response = client.get(f"/api/competitions/{competition.id}")
+
+        assert_that(
+            response.json()["projects"][0]["main_image_url"],
+            equal_to(first.url),
+        )
+
+    def test_is_null_without_uploaded_images(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        competition = CompetitionFactory(projects=[project])
+
+        response = client.get(f"/api/competitions/{competition.id}")
+
+        assert_that(response.json()["projects"][0]["main_image_url"], equal_to(None))
+
+
+@pytest.mark.django_db
+class TestGetCompetitionConditional:
+    def test_matching_etag_returns_304(self, client) -> None:
+        competition = CompetitionFactory()
+        etag = client.get(f"/api/competitions/{competition.id}")["ETag"]
+
+        response = client.get(
+            f"/api/competitions/{competition.id}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        assert_that(response.status_code, equal_to(304))
+
+    def test_adding_a_project_changes_etag(self, client) -> None:
+        competition = CompetitionFactory()
+        etag = client.get(f"/api/competitions/{competition.id}")["ETag"]
+
+        competition.projects.add(ProjectFactory(status=ProjectStatus.APPROVED))
+        response = client.get(
+            f"/api/competitions/{competition.id}",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(response.json()["projects"], has_length(1))
@@ -0,0 +1,80 @@
+import pytest
+from hamcrest import assert_that, equal_to, has_entries, has_entry
+
+from api.guardrails import stats
+from apps.projects.models import ProjectStatus
+from tests.factories import ProjectFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestPageSizeLimits:
+    @pytest.mark.parametrize(
+        ("url", "endpoint"),
+        [
+            ("/api/projects", "projects"),
+            ("/api/admin/projects", "admin_projects"),
+            ("/api/admin/users", "admin_users"),
+        ],
+    )
+    def test_rejects_per_page_above_maximum(
+        self, client, admin_headers, settings, url, endpoint
+    ):
+        settings.LISTING_MAX_PER_PAGE = {**settings.LISTING_MAX_PER_PAGE, endpoint: 5}
+
+        response = client.get(url, {"per_page": 6}, **admin_headers)
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(
+            response.json(),
+            has_entries(detail="per_page must be between 1 and 5"),
+        )
+        assert_that(stats.snapshot(), has_entry(endpoint, {"per_page": 1}))
+
+    def test_accepts_per_page_at_maximum(self, client, settings):
+        settings.LISTING_MAX_PER_PAGE = {**settings.LISTING_MAX_PER_PAGE, "projects": 5}
+
+        response = client.get("/api/projects", {"per_page": 5})
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(stats.snapshot(), equal_to({}))
+
+    @pytest.mark.parametrize(("page", "per_page"), [(0, 10), (1, 0)])
+    def test_rejects_non_positive_values(self, client, page, per_page):
+        response = client.get("/api/projects", {"page": page, "per_page": per_page})
+
+        assert_that(response.status_code, equal_to(400))
+
+
+@pytest.mark.django_db
+class TestResponseSizeCap:
+    def test_rejects_oversized_listing(self, client, settings, user):
+        ProjectFactory.create_batch(3, owner=user, status=ProjectStatus.APPROVED)
+        settings.MAX_RESPONSE_BYTES = 200
+
+        response = client.get("/api/projects")
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(
+            response.json(),
+            has_entries(detail="Response exceeds 200 bytes; request a smaller page"),
+        )
+        assert_that(stats.snapshot(), has_entry("projects", {"response_size": 1}))
+
+    def test_caps_admin_listings(self, client, admin_headers, settings):
+        UserFactory.create_batch(3)
+        settings.MAX_RESPONSE_BYTES = 200
+
+        response = client.get("/api/admin/users", **admin_headers)
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(stats.snapshot(), has_entry("admin_users", {"response_size": 1}))
+
+    def test_rejections_are_reported(self, client, admin_headers):
+        client.get("/api/projects", {"per_page": 1000})
+
+        response = client.get("/api/admin/cache-stats", **admin_headers)
+
+        assert_that(
+            response.json(),
+            has_entry("rejected_requests", {"projects": {"per_page": 1}}),
+        )
@@ -0,0 +1,177 @@
+import json
+
+import boto3
+import pytest
+from hamcrest import assert_that, contains_string, equal_to, greater_than
+from moto import mock_aws
+
+from api.services.storage import StorageService
+from apps.projects.models import ProjectStatus
+from tests.factories import ProjectFactory
+
+TEST_BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def metrics_enabled(settings):
+    settings.METRICS_ENABLED = True
+    settings.ADMIN_ALLOWED_IPS = ["127.0.0.1"]
+
+
+@pytest.fixture
+def sample(client, metrics_enabled):
+    """Scrape /metrics and return one sample's value (0 if it is missing)."""
+    parser = pytest.importorskip("prometheus_client.parser")
+
+    def sample(name, **labels):
+        response = client.get("/metrics")
+        assert_that(response.status_code, equal_to(200))
+        for family in parser.text_string_to_metric_families(response.content.decode()):
+            for found in family.samples:
+                if found.name == name and found.labels == labels:
+                    return found.value
+        return 0
+
+    return sample
+
+
+@pytest.mark.django_db
+class TestMetricsEndpoint:
+    def test_not_found_when_disabled(self, client) -> None:
+        response = client.get("/metrics")
+
+        assert_that(response.status_code, equal_to(404))
+
+    @pytest.mark.usefixtures("metrics_enabled")
+    def test_not_found_outside_allowed_ips(self, client) -> None:
+        response = client.get("/metrics", REMOTE_ADDR="203.0.113.7")
+
+        assert_that(response.status_code, equal_to(404))
+
+    @pytest.mark.usefixtures("metrics_enabled")
+    def test_exposition_format(self, client) -> None:
+        pytest.importorskip("prometheus_client")
+
+        response = client.get("/metrics")
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(response["Content-Type"], contains_string("text/plain"))
+
+
+@pytest.mark.django_db
+class TestOperationMetrics:
+    def test_times_each_operation(self, client, sample) -> None:
+        labels = {"operation": "main.health_check", "method": "GET", "status": "200"}
+        before = sample("naglasupan_api_operation_duration_seconds_count", **labels)
+
+        client.get("/api/health")
+
+        after = sample("naglasupan_api_operation_duration_seconds_count", **labels)
+        assert_that(after, equal_to(before + 1))
+
+    def test_times_async_operations(self, client, sample) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED)
+        labels = {
+            "operation": "projects.list_projects",
+            "method": "GET",
+            "status": "200",
+        }
+        before = sample("naglasupan_api_operation_duration_seconds_count", **labels)
+
+        client.get("/api/projects")
+
+        after = sample("naglasupan_api_operation_duration_seconds_count", **labels)
+        assert_that(after, equal_to(before + 1))
+
+    def test_labels_rejected_requests(self, client, sample) -> None:
+        labels = {
+            "operation": "auth.get_current_user_info",
+            "method": "GET",
+            "status": "401",
+        }
+        before = sample("naglasupan_api_operation_duration_seconds_count", **labels)
+
+        client.get("/api/auth/me")
+
+        after = sample("naglasupan_api_operation_duration_seconds_count", **labels)
+        assert_that(after, equal_to(before + 1))
+
+    def test_counts_public_cache_lookups(self, client, sample) -> None:
+        labels = {"namespace": "projects", "outcome": "hits"}
+        before = sample("naglasupan_public_cache_lookups_total", **labels)
+
+        client.get("/api/projects")
+        client.get("/api/projects")
+
+        after = sample("naglasupan_public_cache_lookups_total", **labels)
+        assert_that(after, equal_to(before + 1))
+
+
+@pytest.mark.django_db
+class TestAuthFailureMetrics:
+    def test_counts_invalid_credentials(self, client, user, sample) -> None:
+        before = sample("naglasupan_auth_failures_total", reason="invalid_credentials")
+
+        client.post(
+            "/api/auth/login",
+            data=json.dumps({"email": user.email, "password": "wrong"}),
+            content_type="application/json",
+        )
+
+        after = sample("naglasupan_auth_failures_total", reason="invalid_credentials")
+        assert_that(after, equal_to(before + 1))
+
+    def test_counts_invalid_bearer_tokens(self, client, sample) -> None:
+        before = sample("naglasupan_auth_failures_total", reason="invalid_token")
+
+        client.get("/api/auth/me", HTTP_AUTHORIZATION="Bearer not-a-token")
+
+        after = sample("naglasupan_auth_failures_total", reason="invalid_token")
+        assert_that(after, equal_to(before + 1))
+
+    def test_counts_invalid_refresh_tokens(self, client, access_token, sample) -> None:
+        before = sample(
+            "naglasupan_auth_failures_total",
+            reason="invalid_refresh_token",
+        )
+
+        client.post(
+            "/api/auth/refresh",
+            data=json.dumps({"refresh_token": access_token}),
+            content_type="application/json",
+        )
+
+        after = sample(
+            "naglasupan_auth_failures_total",
+            reason="invalid_refresh_token",
+        )
+        assert_that(after, equal_to(before + 1))
+
+
+@pytest.mark.django_db
+class TestStorageMetrics:
+    @pytest.fixture
+    def storage(self, settings):
+        settings.S3_BUCKET_NAME = TEST_BUCKET
+        settings.S3_ENDPOINT_URL = "https://s3.us-east-1.amazonaws.com"
+        settings.S3_REGION = "us-east-1"
+        settings.SCW_ACCESS_KEY = "test-access-key"
+        settings.SCW_SECRET_KEY = "test-secret-key"  # noqa: S105
+        with mock_aws():
+            boto3.client("s3", region_name="us-east-1").create_bucket(
+                Bucket=TEST_BUCKET,
+            )
+            yield StorageService()
+
+    def test_times_s3_calls(self, storage, sample) -> None:
+        labels = {"operation": "HeadObject", "status": "404"}
+        before = sample("naglasupan_s3_call_duration_seconds_count", **labels)
+
+        storage.object_exists("projects/missing.png")
+
+        after = sample("naglasupan_s3_call_duration_seconds_count", **labels)
+        assert_that(after, equal_to(before + 1))
+        assert_that(
+            sample("naglasupan_s3_call_duration_seconds_sum", **labels),
+            greater_than(0),
+        )
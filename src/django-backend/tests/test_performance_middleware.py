@@ -0,0 +1,89 @@
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from hamcrest import (
+    assert_that,
+    contains_string,
+    equal_to,
+    greater_than,
+    has_entries,
+    has_item,
+    has_properties,
+)
+
+from apps.projects.models import ProjectStatus
+from tests.factories import ProjectFactory
+
+
+@pytest.fixture
+def instrumented(settings):
+    settings.PERF_INSTRUMENTATION = True
+    settings.PERF_SAMPLE_RATE = 1.0
+    settings.PUBLIC_API_CACHE_TIMEOUT = 0
+
+
+@pytest.mark.django_db
+class TestPerformanceMiddleware:
+    def test_disabled_by_default(self, client) -> None:
+        response = client.get("/api/projects")
+
+        assert_that(response.has_header("Server-Timing"), equal_to(False))
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_reports_server_timing(self, client) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED)
+
+        response = client.get("/api/projects")
+
+        timing = response["Server-Timing"]
+        assert_that(timing, contains_string('desc="5 queries"'))
+        assert_that(timing, contains_string("serialize;dur="))
+        assert_that(timing, contains_string("total;dur="))
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_logs_structured_line(self, client, auth_headers, project, caplog) -> None:
+        caplog.set_level(logging.INFO, logger="project_showcase.performance")
+
+        response = client.get("/api/my/projects", **auth_headers)
+
+        assert_that(
+            caplog.records,
+            has_item(
+                has_properties(
+                    perf=has_entries(
+                        route="list_my_projects",
+                        method="GET",
+                        status=200,
+                        db_queries=greater_than(0),
+                        bytes=len(response.content),
+                    ),
+                ),
+            ),
+        )
+
+    def test_unsampled_requests_are_not_measured(self, client, settings) -> None:
+        settings.PERF_INSTRUMENTATION = True
+        settings.PERF_SAMPLE_RATE = 0
+
+        response = client.get("/api/projects")
+
+        assert_that(response.has_header("Server-Timing"), equal_to(False))
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_queries_outside_requests_are_not_counted(self, client) -> None:
+        client.get("/api/health")
+        ProjectFactory(status=ProjectStatus.APPROVED)
+
+        response = client.get("/api/health")
+
+        assert_that(response["Server-Timing"], contains_string('desc="0 queries"'))
+
+    @pytest.mark.usefixtures("instrumented")
+    def test_counts_queries_under_asgi(self) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED)
+
+        response = async_to_sync(AsyncClient().get)("/api/projects")
+
+        assert_that(response["Server-Timing"], contains_string('desc="5 queries"'))
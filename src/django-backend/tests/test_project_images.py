@@ -1,10 +1,12 @@
 """Tests for project image upload functionality."""
 
 import json
+from io import StringIO
 from unittest.mock import patch
 
 import boto3
 import pytest
+from django.core.management import call_command
 from hamcrest import (
     assert_that,
     contains_string,
@@ -15,7 +17,7 @@ from hamcrest import (
 from moto import mock_aws
 
 from apps.projects.models import ProjectImage, UploadStatus
-from tests.factories import ProjectFactory
+from tests.factories import ProjectFactory, ProjectImageFactory
 
 # Test bucket configuration
 TEST_BUCKET = "test-bucket"
@@ -253,6 +255,8 @@ class TestCompleteUpload:
         assert_that(response.status_code, equal_to(200))
         image.refresh_from_db()
         assert_that(image.is_main, is_(True))
+        project.refresh_from_db()
+        assert_that(project.main_image, equal_to(image))
 
     def test_fails_if_file_not_in_storage(
         self,
@@ -354,6 +358,8 @@ class TestDeleteImage:
         assert_that(response.status_code, equal_to(204))
         second_image.refresh_from_db()
         assert_that(second_image.is_main, is_(True))
+        project.refresh_from_db()
+        assert_that(project.main_image, equal_to(second_image))
 
 
 class TestSetMainImage:
@@ -394,6 +400,70 @@ class TestSetMainImage:
         image2.refresh_from_db()
         assert_that(image1.is_main, is_(False))
         assert_that(image2.is_main, is_(True))
+        project.refresh_from_db()
+        assert_that(project.main_image, equal_to(image2))
+
+
+@pytest.mark.django_db
+class TestMainImageSync:
+    def test_flagging_an_image_as_main_moves_the_pointer(self) -> None:
+        project = ProjectFactory()
+        ProjectImageFactory(project=project, display_order=0)
+        second = ProjectImageFactory(project=project, display_order=1)
+
+        second.is_main = True
+        second.save()
+
+        project.refresh_from_db()
+        assert_that(project.main_image, equal_to(second))
+
+    def test_deleting_the_main_image_promotes_a_fallback(self) -> None:
+        project = ProjectFactory()
+        main = ProjectImageFactory(project=project, display_order=0, is_main=True)
+        fallback = ProjectImageFactory(project=project, display_order=1)
+
+        main.delete()
+
+        project.refresh_from_db()
+        assert_that(project.main_image, equal_to(fallback))
+
+    def test_failed_upload_clears_the_pointer(self) -> None:
+        project = ProjectFactory()
+        image = ProjectImageFactory(project=project)
+
+        image.upload_status = UploadStatus.FAILED
+        image.save()
+
+        project.refresh_from_db()
+        assert_that(project.main_image, is_(None))
+
+    def test_deleting_the_project_deletes_its_images(self) -> None:
+        project = ProjectFactory()
+        ProjectImageFactory(project=project, is_main=True)
+
+        project.delete()
+
+        assert_that(ProjectImage.objects.count(), equal_to(0))
+
+
+@pytest.mark.django_db
+class TestBackfillMainImages:
+    def test_points_projects_at_main_or_first_uploaded_image(self) -> None:
+        with_main = ProjectFactory()
+        ProjectImageFactory(project=with_main, display_order=0)
+        main = ProjectImageFactory(project=with_main, display_order=1, is_main=True)
+        without_main = ProjectFactory()
+        first = ProjectImageFactory(project=without_main, display_order=0)
+        ProjectImageFactory(project=without_main, display_order=1)
+        no_images = ProjectFactory()
+
+        call_command("backfill_main_images", stdout=StringIO())
+
+        for project in (with_main, without_main, no_images):
+            project.refresh_from_db()
+        assert_that(with_main.main_image, equal_to(main))
+        assert_that(without_main.main_image, equal_to(first))
+        assert_that(no_images.main_image, is_(None))
 
 
 class TestImageAuthorization:
@@ -0,0 +1,96 @@
+import pytest
+from hamcrest import assert_that, contains_exactly, equal_to, has_entries
+
+from apps.projects.models import ProjectStatus, ProjectView
+from apps.projects.view_tracking import view_buffer
+from tests.factories import ProjectFactory
+
+
+@pytest.fixture
+def approved_project(user):
+    return ProjectFactory(owner=user, status=ProjectStatus.APPROVED)
+
+
+@pytest.mark.django_db
+class TestProjectViewTracking:
+    def test_get_project_buffers_view_without_writing(self, client, approved_project):
+        client.get(
+            f"/api/projects/{approved_project.id}",
+            HTTP_X_FORWARDED_FOR="203.0.113.7, 10.0.0.1",
+            HTTP_USER_AGENT="Mozilla/5.0",
+        )
+
+        assert_that(ProjectView.objects.count(), equal_to(0))
+        assert_that(view_buffer.flush(), equal_to(1))
+        assert_that(
+            ProjectView.objects.values("viewer_ip", "user_agent").get(),
+            equal_to({"viewer_ip": "203.0.113.7", "user_agent": "Mozilla/5.0"}),
+        )
+
+    def test_revalidated_views_are_tracked(self, client, approved_project):
+        first = client.get(
+            f"/api/projects/{approved_project.id}",
+            REMOTE_ADDR="203.0.113.7",
+        )
+        revalidated = client.get(
+            f"/api/projects/{approved_project.id}",
+            REMOTE_ADDR="203.0.113.8",
+            HTTP_IF_NONE_MATCH=first["ETag"],
+        )
+
+        assert_that(revalidated.status_code, equal_to(304))
+        assert_that(view_buffer.snapshot(), has_entries(recorded=2, pending=2))
+
+    def test_unapproved_project_views_are_not_tracked(
+        self,
+        client,
+        auth_headers,
+        project,
+    ):
+        client.get(f"/api/projects/{project.id}", **auth_headers)
+
+        assert_that(view_buffer.snapshot()["pending"], equal_to(0))
+
+    def test_repeat_views_are_written_once(self, approved_project):
+        ProjectView.objects.create(project=approved_project, viewer_ip="10.0.0.1")
+        for _ in range(3):
+            view_buffer.record(approved_project.id, "10.0.0.1", "ua")
+        view_buffer.record(approved_project.id, "10.0.0.2", "ua")
+
+        view_buffer.flush()
+
+        assert_that(
+            ProjectView.objects.order_by("viewer_ip").values_list(
+                "viewer_ip",
+                flat=True,
+            ),
+            contains_exactly("10.0.0.1", "10.0.0.2"),
+        )
+
+    def test_writes_in_batches(self, settings, approved_project):
+        settings.PROJECT_VIEW_BATCH_SIZE = 2
+        for i in range(5):
+            view_buffer.record(approved_project.id, f"10.0.0.{i}", "ua")
+
+        assert_that(view_buffer.flush(), equal_to(5))
+        assert_that(ProjectView.objects.count(), equal_to(5))
+
+    def test_full_buffer_drops_and_counts(self, settings, approved_project):
+        settings.PROJECT_VIEW_BUFFER_SIZE = 2
+        results = [
+            view_buffer.record(approved_project.id, f"10.0.0.{i}", "ua")
+            for i in range(4)
+        ]
+
+        assert_that(results, equal_to([True, True, False, False]))
+        assert_that(view_buffer.snapshot(), has_entries(dropped=2, pending=2))
+
+    def test_invalid_addresses_are_rejected(self, approved_project):
+        assert_that(view_buffer.record(approved_project.id, "", "ua"), equal_to(False))
+        assert_that(view_buffer.snapshot(), has_entries(invalid=1, pending=0))
+
+    def test_views_of_deleted_projects_are_skipped(self, approved_project):
+        view_buffer.record(approved_project.id, "10.0.0.1", "ua")
+        approved_project.delete()
+
+        assert_that(view_buffer.flush(), equal_to(0))
@@ -1,9 +1,28 @@
+import uuid
+from datetime import timedelta
+
 import pytest
-from hamcrest import assert_that, equal_to, has_entries
+from django.db import connection
+from django.utils import timezone
+from hamcrest import (
+    assert_that,
+    contains_exactly,
+    equal_to,
+    has_entries,
+    has_length,
+    is_not,
+    starts_with,
+)
 
 from api.auth.jwt import create_access_token
-from apps.projects.models import ProjectStatus
-from tests.factories import ProjectFactory, UserFactory
+from api.pagination import encode_cursor
+from apps.projects.models import Project, ProjectStatus
+from tests.factories import (
+    ProjectFactory,
+    ProjectImageFactory,
+    TagFactory,
+    UserFactory,
+)
 
 
 @pytest.mark.django_db
@@ -140,3 +159,416 @@ class TestGetPublicProject:
                 title=project.title,
             ),
         )
+
+
+@pytest.mark.django_db
+class TestListProjectsCursorPagination:
+    def test_page_mode_keeps_totals(self, client) -> None:
+        ProjectFactory.create_batch(3, status=ProjectStatus.APPROVED)
+
+        response = client.get("/api/projects", {"per_page": 2})
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json(),
+            has_entries(total=3, pages=2, page=1, per_page=2, next_cursor=None),
+        )
+
+    def test_walks_all_pages_without_repeats(self, client) -> None:
+        projects = ProjectFactory.create_batch(5, status=ProjectStatus.APPROVED)
+        ProjectFactory(status=ProjectStatus.PENDING)
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"pagination": "cursor", "per_page": 2}
+            if cursor:
+                params["cursor"] = cursor
+            response = client.get("/api/projects", params)
+            assert_that(response.status_code, equal_to(200))
+            body = response.json()
+            assert_that(body, has_entries(total=None, pages=None))
+            seen.extend(p["id"] for p in body["projects"])
+            cursor = body["next_cursor"]
+            if not cursor:
+                break
+
+        assert_that(seen, has_length(5))
+        assert_that(set(seen), equal_to({str(p.id) for p in projects}))
+
+    def test_orders_by_sort_key(self, client) -> None:
+        for visitors in (30, 10, 20):
+            ProjectFactory(status=ProjectStatus.APPROVED, monthly_visitors=visitors)
+
+        first = client.get(
+            "/api/projects",
+            {
+                "pagination": "cursor",
+                "sort_by": "monthly_visitors",
+                "sort_order": "asc",
+                "per_page": 2,
+            },
+        ).json()
+        second = client.get(
+            "/api/projects",
+            {
+                "pagination": "cursor",
+                "sort_by": "monthly_visitors",
+                "sort_order": "asc",
+                "per_page": 2,
+                "cursor": first["next_cursor"],
+            },
+        ).json()
+
+        assert_that(
+            [p["monthly_visitors"] for p in first["projects"]],
+            contains_exactly(10, 20),
+        )
+        assert_that(
+            [p["monthly_visitors"] for p in second["projects"]],
+            contains_exactly(30),
+        )
+        assert_that(second["next_cursor"], equal_to(None))
+
+    def test_rejects_invalid_cursor(self, client) -> None:
+        response = client.get(
+            "/api/projects",
+            {"pagination": "cursor", "cursor": "not-a-cursor"},
+        )
+
+        assert_that(response.status_code, equal_to(400))
+
+    @pytest.mark.parametrize("sort_order", ["asc", "desc"])
+    def test_walks_rows_created_within_one_millisecond(
+        self,
+        client,
+        sort_order,
+    ) -> None:
+        created = timezone.now().replace(microsecond=500_000)
+        projects = ProjectFactory.create_batch(4, status=ProjectStatus.APPROVED)
+        for offset, project in enumerate(projects):
+            Project.objects.filter(id=project.id).update(
+                created_at=created + timedelta(microseconds=offset * 3),
+            )
+
+        seen = []
+        params = {"pagination": "cursor", "sort_order": sort_order, "per_page": 1}
+        for _ in range(len(projects) + 1):
+            body = client.get("/api/projects", params).json()
+            seen.extend(p["id"] for p in body["projects"])
+            if not body["next_cursor"]:
+                break
+            params["cursor"] = body["next_cursor"]
+
+        assert_that(seen, has_length(4))
+        assert_that(set(seen), equal_to({str(p.id) for p in projects}))
+
+    @pytest.mark.parametrize("value", ["abc", [1]])
+    def test_rejects_cursor_with_wrong_value_type(self, client, value) -> None:
+        cursor = encode_cursor(value, str(uuid.uuid4()))
+
+        response = client.get(
+            "/api/projects",
+            {
+                "pagination": "cursor",
+                "sort_by": "monthly_visitors",
+                "cursor": cursor,
+            },
+        )
+
+        assert_that(response.status_code, equal_to(400))
+
+    def test_rejects_search(self, client) -> None:
+        response = client.get(
+            "/api/projects",
+            {"pagination": "cursor", "search": "django"},
+        )
+
+        assert_that(response.status_code, equal_to(400))
+
+    def test_rejects_nullable_sort_field(self, client) -> None:
+        response = client.get(
+            "/api/projects",
+            {"pagination": "cursor", "sort_by": "approved_at"},
+        )
+
+        assert_that(response.status_code, equal_to(400))
+
+
+@pytest.mark.django_db
+class TestListProjectsSorting:
+    @pytest.mark.parametrize("sort_by", ["approved_at", "owner__email", "-id"])
+    def test_rejects_unregistered_sort(self, client, sort_by) -> None:
+        response = client.get("/api/projects", {"sort_by": sort_by})
+
+        assert_that(response.status_code, equal_to(400))
+        assert_that(response.json()["detail"], starts_with("Cannot sort by"))
+
+    def test_rejects_unknown_sort_order(self, client) -> None:
+        response = client.get("/api/projects", {"sort_order": "sideways"})
+
+        assert_that(response.status_code, equal_to(400))
+
+    def test_ties_are_broken_by_id(self, client) -> None:
+        projects = [
+            ProjectFactory(status=ProjectStatus.APPROVED, title="Same")
+            for _ in range(4)
+        ]
+
+        pages = [
+            client.get(
+                "/api/projects",
+                {"sort_by": "title", "sort_order": "asc", "per_page": 2, "page": page},
+            ).json()["projects"]
+            for page in (1, 2)
+        ]
+
+        assert_that(
+            [p["id"] for page in pages for p in page],
+            equal_to(sorted(str(p.id) for p in projects)),
+        )
+
+
+@pytest.mark.django_db
+class TestListProjectsCounting:
+    @pytest.fixture(autouse=True)
+    def _approved(self) -> None:
+        ProjectFactory.create_batch(5, status=ProjectStatus.APPROVED)
+
+    def test_counts_exactly_by_default(self, client) -> None:
+        response = client.get("/api/projects", {"per_page": 2})
+
+        assert_that(
+            response.json(),
+            has_entries(total=5, pages=3, count_strategy="exact"),
+        )
+
+    def test_capped_count_stops_past_the_cap(self, client, settings) -> None:
+        settings.LISTING_COUNT_CAP = 3
+
+        response = client.get("/api/projects", {"per_page": 2, "count": "capped"})
+
+        assert_that(
+            response.json(),
+            has_entries(total=4, pages=2, count_strategy="capped"),
+        )
+
+    def test_capped_count_covers_the_requested_page(self, client, settings) -> None:
+        settings.LISTING_COUNT_CAP = 1
+
+        response = client.get(
+            "/api/projects",
+            {"per_page": 2, "page": 2, "count": "capped"},
+        )
+
+        assert_that(response.json(), has_entries(total=5, pages=3))
+
+    def test_filtered_estimate_falls_back_to_capped(self, client, tag) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED, tags=[tag])
+
+        response = client.get(
+            "/api/projects",
+            {"tags": [tag.slug], "count": "estimated"},
+        )
+
+        assert_that(
+            response.json(),
+            has_entries(total=1, count_strategy="capped"),
+        )
+
+    @pytest.mark.skipif(
+        connection.vendor == "postgresql",
+        reason="PostgreSQL serves the planner estimate",
+    )
+    def test_estimate_needs_postgresql(self, client) -> None:
+        response = client.get("/api/projects", {"count": "estimated"})
+
+        assert_that(
+            response.json(),
+            has_entries(total=5, count_strategy="exact"),
+        )
+
+    @pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="Planner estimates are only read on PostgreSQL",
+    )
+    def test_estimates_unfiltered_listing(self, client) -> None:
+        response = client.get("/api/projects", {"count": "estimated"})
+
+        assert_that(response.json(), has_entries(count_strategy="estimated"))
+
+    def test_admin_listing_reports_strategy(self, client, admin_headers) -> None:
+        response = client.get(
+            "/api/admin/projects",
+            {"status_filter": "approved", "count": "estimated"},
+            **admin_headers,
+        )
+
+        assert_that(
+            response.json(),
+            has_entries(total=5, count_strategy="capped"),
+        )
+
+    def test_rejects_unknown_strategy(self, client) -> None:
+        response = client.get("/api/projects", {"count": "guess"})
+
+        assert_that(response.status_code, equal_to(422))
+
+
+@pytest.mark.django_db
+class TestListProjectsSearch:
+    def test_matches_title_description_and_tags(self, client) -> None:
+        tag = TagFactory(name="Geology")
+        by_title = ProjectFactory(status=ProjectStatus.APPROVED, title="Geology map")
+        by_description = ProjectFactory(
+            status=ProjectStatus.APPROVED,
+            description="A tool for geology students",
+        )
+        by_tag = ProjectFactory(status=ProjectStatus.APPROVED, tags=[tag])
+        ProjectFactory(status=ProjectStatus.APPROVED, title="Unrelated")
+
+        response = client.get("/api/projects", {"search": "geology"})
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            [p["id"] for p in response.json()["projects"]],
+            contains_exactly(
+                str(by_title.id),
+                str(by_tag.id),
+                str(by_description.id),
+            ),
+        )
+
+    def test_excludes_unapproved_matches(self, client) -> None:
+        ProjectFactory(status=ProjectStatus.PENDING, title="Hidden geology")
+
+        response = client.get("/api/projects", {"search": "geology"})
+
+        assert_that(response.json(), has_entries(total=0))
+
+
+@pytest.mark.django_db
+class TestListProjectsTechStackFilter:
+    def _ids(self, response):
+        return {p["id"] for p in response.json()["projects"]}
+
+    def test_matches_whole_names_case_insensitively(self, client) -> None:
+        go = ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["Go"])
+        ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["Django"])
+
+        response = client.get("/api/projects", {"tech_stack": "GO"})
+
+        assert_that(self._ids(response), equal_to({str(go.id)}))
+
+    def test_requires_all_terms_by_default(self, client) -> None:
+        both = ProjectFactory(
+            status=ProjectStatus.APPROVED,
+            tech_stack=["Python", "React"],
+        )
+        ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["Python"])
+
+        response = client.get(
+            "/api/projects",
+            {"tech_stack": ["python", "react"]},
+        )
+
+        assert_that(self._ids(response), equal_to({str(both.id)}))
+
+    def test_any_match_returns_projects_with_either_term(self, client) -> None:
+        python = ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["Python"])
+        react = ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["React"])
+        ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["Rust"])
+
+        response = client.get(
+            "/api/projects",
+            {"tech_stack": ["python", "react"], "tech_stack_match": "any"},
+        )
+
+        assert_that(self._ids(response), equal_to({str(python.id), str(react.id)}))
+
+    def test_follows_tech_stack_updates(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED, tech_stack=["Vue"])
+        project.tech_stack = ["Svelte"]
+        project.save()
+
+        assert_that(
+            self._ids(client.get("/api/projects", {"tech_stack": "vue"})),
+            equal_to(set()),
+        )
+        assert_that(
+            self._ids(client.get("/api/projects", {"tech_stack": "svelte"})),
+            equal_to({str(project.id)}),
+        )
+
+
+@pytest.mark.django_db
+class TestGetProjectConditional:
+    def test_returns_etag_only(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        response = client.get(f"/api/projects/{project.id}")
+
+        assert_that(response["ETag"], starts_with('W/"'))
+        assert_that(response.has_header("Last-Modified"), equal_to(False))
+
+    def test_matching_etag_returns_304(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        etag = client.get(f"/api/projects/{project.id}")["ETag"]
+
+        response = client.get(f"/api/projects/{project.id}", HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code, equal_to(304))
+
+    def test_ignores_if_modified_since(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+
+        response = client.get(
+            f"/api/projects/{project.id}",
+            HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT",
+        )
+
+        assert_that(response.status_code, equal_to(200))
+
+    def test_tag_removal_changes_etag(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        project.tags.add(TagFactory())
+        etag = client.get(f"/api/projects/{project.id}")["ETag"]
+
+        project.tags.clear()
+        response = client.get(f"/api/projects/{project.id}", HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code, equal_to(200))
+
+    def test_flagging_the_fallback_main_image_changes_etag(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        image = ProjectImageFactory(project=project)
+        project.refresh_from_db()
+        assert_that(project.main_image, equal_to(image))
+        before = client.get(f"/api/projects/{project.id}")
+
+        image.is_main = True
+        image.save()
+        response = client.get(
+            f"/api/projects/{project.id}",
+            HTTP_IF_NONE_MATCH=before["ETag"],
+        )
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(response["ETag"], is_not(equal_to(before["ETag"])))
+
+    def test_tag_change_changes_etag(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED)
+        etag = client.get(f"/api/projects/{project.id}")["ETag"]
+
+        project.tags.add(TagFactory())
+        response = client.get(f"/api/projects/{project.id}", HTTP_IF_NONE_MATCH=etag)
+
+        assert_that(response.status_code, equal_to(200))
+
+    def test_unapproved_project_has_no_etag(self, client, user, auth_headers) -> None:
+        project = ProjectFactory(owner=user, status=ProjectStatus.PENDING)
+
+        response = client.get(f"/api/projects/{project.id}", **auth_headers)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(response.has_header("ETag"), equal_to(False))
@@ -0,0 +1,72 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from hamcrest import assert_that, equal_to, has_entries, has_length
+
+from api.auth.jwt import create_access_token
+from apps.projects.models import ProjectStatus
+from tests.factories import ProjectFactory, TagFactory, UserFactory
+
+
+@pytest.mark.django_db
+class TestPublicResponseCache:
+    def test_repeat_request_is_served_without_queries(self, client) -> None:
+        ProjectFactory(status=ProjectStatus.APPROVED)
+        first = client.get("/api/projects")
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = client.get("/api/projects")
+
+        assert_that(first["X-Cache"], equal_to("MISS"))
+        assert_that(second["X-Cache"], equal_to("HIT"))
+        assert_that(ctx.captured_queries, has_length(0))
+        assert_that(second.json(), equal_to(first.json()))
+
+    def test_query_parameter_order_shares_an_entry(self, client) -> None:
+        client.get("/api/projects?tags=a&tags=b&page=1")
+
+        response = client.get("/api/projects?page=1&tags=b&tags=a")
+
+        assert_that(response["X-Cache"], equal_to("HIT"))
+
+    def test_project_change_invalidates(self, client) -> None:
+        project = ProjectFactory(status=ProjectStatus.APPROVED, is_featured=True)
+        client.get("/api/projects/featured")
+
+        project.is_featured = False
+        project.save()
+        response = client.get("/api/projects/featured")
+
+        assert_that(response["X-Cache"], equal_to("MISS"))
+        assert_that(response.json(), has_length(0))
+
+    def test_tag_change_invalidates(self, client) -> None:
+        tag = TagFactory(name="Before")
+        client.get("/api/tags")
+
+        tag.name = "After"
+        tag.save()
+        response = client.get("/api/tags")
+
+        assert_that(response.json()[0], has_entries(name="After"))
+
+    def test_authenticated_requests_bypass_cache(self, client, auth_headers) -> None:
+        client.get("/api/projects")
+
+        response = client.get("/api/projects", **auth_headers)
+
+        assert_that(response.has_header("X-Cache"), equal_to(False))
+
+    def test_admin_can_read_hit_and_miss_counters(self, client) -> None:
+        client.get("/api/tags")
+        client.get("/api/tags")
+        admin = UserFactory(is_superuser=True)
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {create_access_token(admin.id)}"}
+
+        response = client.get("/api/admin/cache-stats", **headers)
+
+        assert_that(response.status_code, equal_to(200))
+        assert_that(
+            response.json()["public_api"]["tags"],
+            equal_to({"hits": 1, "misses": 1}),
+        )
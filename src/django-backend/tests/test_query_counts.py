@@ -0,0 +1,144 @@
+"""Query-count budgets for the API's read endpoints.
+
+Every route in BUDGETS is requested at two data sizes: one row of each kind,
+then six. The number of queries must not grow with the rows serialized (an
+N+1) and must stay within the route's budget. Add a route here when adding
+an endpoint; lower its budget when an optimization saves queries.
+"""
+
+from dataclasses import dataclass
+from typing import Literal
+
+import pytest
+from hamcrest import assert_that, equal_to, less_than_or_equal_to
+
+from apps.projects.models import ProjectStatus, UploadStatus
+from tests.factories import (
+    CompetitionFactory,
+    CompetitionReviewerFactory,
+    ProjectFactory,
+    ProjectImageFactory,
+    TagFactory,
+    UserFactory,
+)
+
+
+def _create_projects(count, **kwargs):
+    tag = TagFactory()
+    projects = []
+    for _ in range(count):
+        project = ProjectFactory(tags=[tag], **kwargs)
+        ProjectImageFactory(project=project, is_main=True)
+        ProjectImageFactory(project=project, upload_status=UploadStatus.PENDING)
+        project.refresh_main_image()
+        projects.append(project)
+    return projects
+
+
+@dataclass(frozen=True)
+class Budget:
+    """Most queries a GET of `url` may run, at any data size."""
+
+    url: str
+    queries: int
+    actor: Literal["anonymous", "user", "admin"] = "anonymous"
+
+
+# Paths are formatted with the ids from the `budget_data` fixture
+BUDGETS = {
+    "list_projects": Budget("/api/projects", 5),
+    "list_projects_cursor": Budget("/api/projects?pagination=cursor", 4),
+    "list_projects_by_tag": Budget("/api/projects?tags={tag}", 5),
+    "list_projects_by_tech": Budget("/api/projects?tech_stack=django", 5),
+    "list_projects_search": Budget("/api/projects?search=budget", 5),
+    "list_projects_capped": Budget("/api/projects?count=capped", 5),
+    "featured_projects": Budget("/api/projects/featured", 4),
+    "trending_projects": Budget("/api/projects/trending", 4),
+    "get_project": Budget("/api/projects/{project}", 5),
+    "list_tags": Budget("/api/tags", 1),
+    "list_competitions": Budget("/api/competitions", 2),
+    "get_competition": Budget("/api/competitions/{competition}", 3),
+    "me": Budget("/api/auth/me", 0, actor="user"),
+    "list_my_projects": Budget("/api/my/projects", 4, actor="user"),
+    "get_my_project": Budget("/api/my/projects/{project}", 4, actor="user"),
+    "list_review_competitions": Budget("/api/my-review/competitions", 1, actor="user"),
+    "get_review_competition": Budget(
+        "/api/my-review/competitions/{competition}", 4, actor="user"
+    ),
+    "admin_list_projects": Budget("/api/admin/projects", 5, actor="admin"),
+    "admin_get_project": Budget("/api/admin/projects/{project}", 4, actor="admin"),
+    "admin_list_users": Budget("/api/admin/users", 2, actor="admin"),
+    "admin_analytics": Budget("/api/admin/analytics", 5, actor="admin"),
+    "admin_timeseries": Budget("/api/admin/analytics/timeseries", 4, actor="admin"),
+}
+
+
+def _grow(count, owner, competition):
+    """Add `count` of each kind of row the budgeted routes list."""
+    projects = _create_projects(
+        count,
+        owner=owner,
+        status=ProjectStatus.APPROVED,
+        is_featured=True,
+        title="Budget project",
+        tech_stack=["Django"],
+    )
+    competition.projects.add(*projects)
+    for _ in range(count):
+        UserFactory()
+        CompetitionReviewerFactory(
+            user=owner,
+            competition=CompetitionFactory(projects=projects),
+        )
+    return projects
+
+
+@pytest.fixture
+def budget_data(user):
+    competition = CompetitionFactory()
+    CompetitionReviewerFactory(user=user, competition=competition)
+    (project,) = _grow(1, user, competition)
+    return {
+        "project": project.id,
+        "competition": competition.id,
+        "tag": project.tags.get().slug,
+        "grow": lambda count: _grow(count, user, competition),
+    }
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("route", BUDGETS)
+def test_query_budget(
+    route,
+    budget_data,
+    count_queries,
+    auth_headers,
+    admin_headers,
+) -> None:
+    budget = BUDGETS[route]
+    url = budget.url.format(**budget_data)
+    headers = {
+        "anonymous": {},
+        "user": auth_headers,
+        "admin": admin_headers,
+    }[budget.actor]
+    # Warm the authenticated-user cache so both measurements hit it
+    count_queries(url, **headers)
+    small = count_queries(url, **headers)
+
+    budget_data["grow"](5)
+    large = count_queries(url, **headers)
+
+    assert_that(large, equal_to(small), f"{route} queries scale with rows")
+    assert_that(large, less_than_or_equal_to(budget.queries), route)
+
+
+@pytest.mark.django_db
+def test_listing_only_returns_uploaded_images(client) -> None:
+    _create_projects(1, status=ProjectStatus.APPROVED)
+
+    response = client.get("/api/projects")
+
+    images = response.json()["projects"][0]["images"]
+    assert_that(len(images), equal_to(1))
+    assert_that(images[0]["upload_status"], equal_to(UploadStatus.UPLOADED))
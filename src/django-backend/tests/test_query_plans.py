@@ -0,0 +1,82 @@
+"""EXPLAIN checks that the listing endpoints are served by their indexes.
+
+Plans are only meaningful on PostgreSQL, so this module is skipped on other
+databases. Sequential scans are disabled for each EXPLAIN: on a test-sized
+table the planner would rightly prefer them, and the point here is that a
+matching index exists and is usable for the endpoint's exact query.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from hamcrest import assert_that, contains_string
+
+from apps.projects.models import ProjectStatus
+from tests.factories import ProjectFactory
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "postgresql",
+    reason="Query plans are only checked on PostgreSQL",
+)
+
+
+def _listing_plan(client, url, **headers):
+    """EXPLAIN output for the ordered `projects` query an endpoint runs."""
+    with CaptureQueriesContext(connection) as context:
+        client.get(url, **headers)
+    # Skips the COUNT (unordered) and the prefetches (other tables)
+    sql = next(
+        query["sql"]
+        for query in context.captured_queries
+        if query["sql"].startswith("SELECT")
+        and 'FROM "projects"' in query["sql"]
+        and "ORDER BY" in query["sql"]
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"EXPLAIN {sql}")
+        return "\n".join(row[0] for row in cursor.fetchall())
+
+
+@pytest.fixture
+def listed_projects(user):
+    ProjectFactory.create_batch(5, owner=user, status=ProjectStatus.APPROVED)
+    ProjectFactory.create_batch(
+        2,
+        owner=user,
+        status=ProjectStatus.APPROVED,
+        is_featured=True,
+    )
+    ProjectFactory.create_batch(3, owner=user)
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("listed_projects")
+class TestListingQueryPlans:
+    @pytest.mark.parametrize(
+        ("url", "index"),
+        [
+            ("/api/projects", "projects_approved_created_idx"),
+            (
+                "/api/projects?pagination=cursor&sort_by=created_at",
+                "projects_approved_created_idx",
+            ),
+            (
+                "/api/projects?sort_by=monthly_visitors",
+                "projects_approved_visitors_idx",
+            ),
+            (
+                "/api/projects?sort_by=title&sort_order=asc",
+                "projects_approved_title_idx",
+            ),
+            ("/api/projects/featured", "projects_featured_idx"),
+            ("/api/projects/trending", "projects_trending_idx"),
+        ],
+    )
+    def test_public_listing_uses_index(self, client, url, index):
+        assert_that(_listing_plan(client, url), contains_string(index))
+
+    def test_my_projects_uses_owner_index(self, client, auth_headers):
+        plan = _listing_plan(client, "/api/my/projects", **auth_headers)
+
+        assert_that(plan, contains_string("projects_owner_created_idx"))
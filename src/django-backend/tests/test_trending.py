@@ -0,0 +1,102 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+from hamcrest import assert_that, close_to, contains_exactly, equal_to
+
+from apps.projects.models import Project, ProjectStatus
+from apps.projects.trending import (
+    HALF_LIFE_DAYS,
+    RECENCY_WEIGHT,
+    compute_trending_scores,
+    refresh_trending_scores,
+)
+from apps.projects.view_counters import add_daily_views
+from tests.factories import (
+    CompetitionFactory,
+    ProjectFactory,
+    ProjectRankingFactory,
+    UserFactory,
+)
+
+
+@pytest.fixture
+def approved(user):
+    def make(**kwargs):
+        return ProjectFactory(owner=user, status=ProjectStatus.APPROVED, **kwargs)
+
+    return make
+
+
+@pytest.mark.django_db
+class TestTrendingScores:
+    def test_recent_views_outweigh_old_ones(self, approved):
+        today = timezone.localdate()
+        fresh = approved()
+        stale = approved()
+        add_daily_views({fresh.id: 10}, today)
+        add_daily_views({stale.id: 30}, today - timedelta(days=4 * HALF_LIFE_DAYS))
+
+        scores = compute_trending_scores()
+
+        assert_that(scores[str(fresh.id)], close_to(10, 0.01))
+        assert_that(scores[str(stale.id)], close_to(30 / 16, 0.01))
+
+    def test_recency_boost_halves_every_half_life(self, approved):
+        now = timezone.now()
+        project = approved(approved_at=now - timedelta(days=HALF_LIFE_DAYS))
+
+        scores = compute_trending_scores(now)
+
+        assert_that(scores[str(project.id)], close_to(RECENCY_WEIGHT / 2, 0.01))
+
+    def test_rankings_count_by_position(self, approved):
+        first = approved()
+        second = approved()
+        competition = CompetitionFactory(projects=[first, second])
+        reviewer = UserFactory()
+        for position, project in enumerate((first, second), start=1):
+            ProjectRankingFactory(
+                reviewer=reviewer,
+                competition=competition,
+                project=project,
+                position=position,
+            )
+
+        scores = compute_trending_scores()
+
+        assert_that(scores[str(first.id)], close_to(2 * scores[str(second.id)], 0.01))
+
+    def test_unapproved_projects_are_reset(self, project):
+        Project.objects.filter(pk=project.pk).update(trending_score=12.5)
+        add_daily_views({project.id: 10})
+
+        assert_that(refresh_trending_scores(), equal_to(1))
+
+        project.refresh_from_db()
+        assert_that(project.trending_score, equal_to(0))
+
+
+@pytest.mark.django_db
+class TestTrendingEndpoint:
+    def test_orders_by_stored_score(self, client, approved):
+        quiet = approved()
+        busy = approved()
+        add_daily_views({busy.id: 5, quiet.id: 1})
+
+        call_command("refresh_trending")
+        response = client.get("/api/projects/trending")
+
+        assert_that(
+            [project["id"] for project in response.json()],
+            contains_exactly(str(busy.id), str(quiet.id)),
+        )
+
+    def test_reads_at_most_ten(self, client, approved):
+        for _ in range(12):
+            approved()
+
+        response = client.get("/api/projects/trending")
+
+        assert_that(len(response.json()), equal_to(10))
@@ -0,0 +1,95 @@
+from datetime import timedelta
+
+import pytest
+from django.contrib.admin.sites import site
+from django.core.management import call_command
+from django.test import RequestFactory
+from django.utils import timezone
+from hamcrest import assert_that, equal_to
+
+from apps.projects.admin import ProjectAdmin
+from apps.projects.models import Project, ProjectDailyViews, ProjectStatus
+from apps.projects.view_counters import add_daily_views, refresh_monthly_visitors
+from apps.projects.view_tracking import view_buffer
+from tests.factories import ProjectFactory
+
+
+@pytest.mark.django_db
+class TestDailyViewCounters:
+    def test_flush_adds_every_hit_to_todays_counter(self, project):
+        for ip in ("10.0.0.1", "10.0.0.1", "10.0.0.2"):
+            view_buffer.record(project.id, ip, "ua")
+        view_buffer.flush()
+        view_buffer.record(project.id, "10.0.0.1", "ua")
+        view_buffer.flush()
+
+        counter = ProjectDailyViews.objects.get(project=project)
+        assert_that(counter.date, equal_to(timezone.localdate()))
+        assert_that(counter.count, equal_to(4))
+
+    def test_add_daily_views_accumulates_per_day(self, project):
+        today = timezone.localdate()
+        add_daily_views({project.id: 2}, today)
+        add_daily_views({project.id: 3}, today)
+        add_daily_views({project.id: 1}, today - timedelta(days=1))
+
+        assert_that(
+            dict(
+                ProjectDailyViews.objects.filter(project=project).values_list(
+                    "date",
+                    "count",
+                ),
+            ),
+            equal_to({today: 5, today - timedelta(days=1): 1}),
+        )
+
+
+@pytest.mark.django_db
+class TestRefreshMonthlyVisitors:
+    def test_sums_the_last_thirty_days(self, project, other_project):
+        today = timezone.localdate()
+        add_daily_views({project.id: 4}, today)
+        add_daily_views({project.id: 6}, today - timedelta(days=29))
+        add_daily_views({project.id: 100}, today - timedelta(days=30))
+        Project.objects.filter(pk=other_project.pk).update(monthly_visitors=50)
+
+        assert_that(refresh_monthly_visitors(), equal_to(2))
+
+        project.refresh_from_db()
+        other_project.refresh_from_db()
+        assert_that(project.monthly_visitors, equal_to(10))
+        assert_that(other_project.monthly_visitors, equal_to(0))
+
+    def test_command_feeds_visitor_sorting(self, client, user):
+        quiet = ProjectFactory(owner=user, status=ProjectStatus.APPROVED)
+        busy = ProjectFactory(owner=user, status=ProjectStatus.APPROVED)
+        add_daily_views({busy.id: 5, quiet.id: 1})
+
+        call_command("refresh_monthly_visitors")
+        response = client.get("/api/projects?sort_by=monthly_visitors")
+
+        assert_that(
+            [project["id"] for project in response.json()["projects"]],
+            equal_to([str(busy.id), str(quiet.id)]),
+        )
+
+
+@pytest.mark.django_db
+class TestProjectAdminViewCount:
+    def test_changelist_annotates_view_totals(
+        self,
+        project,
+        other_project,
+        django_assert_num_queries,
+    ):
+        add_daily_views({project.id: 3}, timezone.localdate() - timedelta(days=90))
+        add_daily_views({project.id: 2})
+        model_admin = ProjectAdmin(Project, site)
+        request = RequestFactory().get("/admin/projects/project/")
+
+        # The projects and their prefetched tags, however many projects
+        with django_assert_num_queries(2):
+            projects = model_admin.get_queryset(request).order_by("-total_views")
+            counts = [model_admin.view_count(obj) for obj in projects]
+
+        assert_that(counts, equal_to([5, 0]))